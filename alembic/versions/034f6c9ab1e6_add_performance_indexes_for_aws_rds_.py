@@ -1,7 +1,7 @@
 """Add performance indexes for AWS RDS optimization
 
 Revision ID: 034f6c9ab1e6
-Revises: c38c43c79949
+Revises: 42d9e070349b
 Create Date: 2025-10-28 22:14:41.558702
 
 """
@@ -21,142 +21,164 @@ depends_on: Union[str, Sequence[str], None] = None
 def upgrade() -> None:
     """Upgrade schema - Add performance indexes for AWS RDS optimization."""
     
-    # Composite indexes for common query patterns
-    
-    # Shopping lists - frequently queried by kitchen and creation date
-    op.create_index(
-        'idx_shopping_lists_kitchen_created', 
-        'shopping_lists', 
-        ['kitchen_id', 'created_at']
-    )
-    
-    # Shopping list items - frequently queried by list
-    op.create_index(
-        'idx_shopping_list_items_list', 
-        'shopping_list_items', 
-        ['shopping_list_id']
-    )
-    
-    # Pantry items - kitchen and name for search
-    op.create_index(
-        'idx_pantry_items_kitchen_name', 
-        'pantry_items', 
-        ['kitchen_id', 'name']
-    )
-    
-    # Pantry items - UPC lookup
-    op.create_index(
-        'idx_pantry_items_upc', 
-        'pantry_items', 
-        ['upc']
-    )
-    
-    # Refrigerator items - kitchen and name for search
-    op.create_index(
-        'idx_refrigerator_items_kitchen_name', 
-        'refrigerator_items', 
-        ['kitchen_id', 'name']
-    )
-    
-    # Refrigerator items - UPC lookup
-    op.create_index(
-        'idx_refrigerator_items_upc', 
-        'refrigerator_items', 
-        ['upc']
-    )
-    
-    # Freezer items - kitchen and name for search
-    op.create_index(
-        'idx_freezer_items_kitchen_name', 
-        'freezer_items', 
-        ['kitchen_id', 'name']
-    )
-    
-    # Freezer items - UPC lookup
-    op.create_index(
-        'idx_freezer_items_upc', 
-        'freezer_items', 
-        ['upc']
-    )
-    
-    # Users - email lookup (if not already indexed)
-    op.create_index(
-        'idx_users_email_active', 
-        'users', 
-        ['email', 'is_active']
-    )
-    
-    # Kitchens - owner lookup with creation date for sorting
-    op.create_index(
-        'idx_kitchens_owner_created', 
-        'kitchens', 
-        ['owner_id', 'created_at']
-    )
-    
-    # Full-text search indexes for PostgreSQL
-    # These use PostgreSQL's GIN indexes for better text search performance
-    
-    # Shopping list items - full text search on name only
-    op.execute("""
-        CREATE INDEX idx_shopping_list_items_fulltext 
-        ON shopping_list_items 
-        USING gin(to_tsvector('english', coalesce(name, '')))
-    """)
-    
-    # Pantry items - full text search
-    op.execute("""
-        CREATE INDEX idx_pantry_items_fulltext 
-        ON pantry_items 
-        USING gin(to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, '')))
-    """)
-    
-    # Refrigerator items - full text search
-    op.execute("""
-        CREATE INDEX idx_refrigerator_items_fulltext 
-        ON refrigerator_items 
-        USING gin(to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, '')))
-    """)
-    
-    # Freezer items - full text search
-    op.execute("""
-        CREATE INDEX idx_freezer_items_fulltext 
-        ON freezer_items 
-        USING gin(to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, '')))
-    """)
-    
-    # Partial indexes for active records (PostgreSQL optimization)
-    op.create_index(
-        'idx_users_active_username', 
-        'users', 
-        ['username'], 
-        postgresql_where=sa.text('is_active = true')
-    )
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block, so the
+    # builds run in autocommit mode and no longer lock out writes.
+    with op.get_context().autocommit_block():
+        # Composite indexes for common query patterns
+    
+        # Shopping lists - frequently queried by kitchen and creation date
+        op.create_index(
+            'idx_shopping_lists_kitchen_created', 
+            'shopping_lists', 
+            ['kitchen_id', 'created_at'],
+            postgresql_concurrently=True
+        )
+    
+        # Shopping list items - frequently queried by list
+        op.create_index(
+            'idx_shopping_list_items_list', 
+            'shopping_list_items', 
+            ['shopping_list_id'],
+            postgresql_concurrently=True
+        )
+    
+        # Pantry items - kitchen and name for search
+        op.create_index(
+            'idx_pantry_items_kitchen_name', 
+            'pantry_items', 
+            ['kitchen_id', 'name'],
+            postgresql_concurrently=True
+        )
+    
+        # Pantry items - UPC lookup
+        op.create_index(
+            'idx_pantry_items_upc', 
+            'pantry_items', 
+            ['upc'],
+            postgresql_concurrently=True
+        )
+    
+        # Refrigerator items - kitchen and name for search
+        op.create_index(
+            'idx_refrigerator_items_kitchen_name', 
+            'refrigerator_items', 
+            ['kitchen_id', 'name'],
+            postgresql_concurrently=True
+        )
+    
+        # Refrigerator items - UPC lookup
+        op.create_index(
+            'idx_refrigerator_items_upc', 
+            'refrigerator_items', 
+            ['upc'],
+            postgresql_concurrently=True
+        )
+    
+        # Freezer items - kitchen and name for search
+        op.create_index(
+            'idx_freezer_items_kitchen_name', 
+            'freezer_items', 
+            ['kitchen_id', 'name'],
+            postgresql_concurrently=True
+        )
+    
+        # Freezer items - UPC lookup
+        op.create_index(
+            'idx_freezer_items_upc', 
+            'freezer_items', 
+            ['upc'],
+            postgresql_concurrently=True
+        )
+    
+        # Users - email lookup (if not already indexed)
+        op.create_index(
+            'idx_users_email_active', 
+            'users', 
+            ['email', 'is_active'],
+            postgresql_concurrently=True
+        )
+    
+        # Kitchens - owner lookup with creation date for sorting
+        op.create_index(
+            'idx_kitchens_owner_created', 
+            'kitchens', 
+            ['owner_id', 'created_at'],
+            postgresql_concurrently=True
+        )
+    
+        # Full-text search indexes for PostgreSQL
+        # These use PostgreSQL's GIN indexes for better text search performance
+    
+        # Shopping list items - full text search on name only
+        op.execute("""
+            CREATE INDEX CONCURRENTLY idx_shopping_list_items_fulltext 
+            ON shopping_list_items 
+            USING gin(to_tsvector('english', coalesce(name, '')))
+        """)
+    
+        # Pantry items - full text search
+        op.execute("""
+            CREATE INDEX CONCURRENTLY idx_pantry_items_fulltext 
+            ON pantry_items 
+            USING gin(to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, '')))
+        """)
+    
+        # Refrigerator items - full text search
+        op.execute("""
+            CREATE INDEX CONCURRENTLY idx_refrigerator_items_fulltext 
+            ON refrigerator_items 
+            USING gin(to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, '')))
+        """)
+    
+        # Freezer items - full text search
+        op.execute("""
+            CREATE INDEX CONCURRENTLY idx_freezer_items_fulltext 
+            ON freezer_items 
+            USING gin(to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, '')))
+        """)
+    
+        # Partial indexes for active records (PostgreSQL optimization)
+        op.create_index(
+            'idx_users_active_username', 
+            'users', 
+            ['username'], 
+            postgresql_where=sa.text('is_active = true'),
+            postgresql_concurrently=True
+        )
+    
+        # Refresh planner statistics so the new indexes are considered
+        # immediately instead of after the next autovacuum analyze
+        op.execute(
+            "ANALYZE users, kitchens, shopping_lists, shopping_list_items, "
+            "pantry_items, refrigerator_items, freezer_items"
+        )
 
 
 def downgrade() -> None:
     """Downgrade schema - Remove performance indexes."""
     
-    # Drop composite indexes
-    op.drop_index('idx_shopping_lists_kitchen_created', table_name='shopping_lists')
-    op.drop_index('idx_shopping_list_items_list', table_name='shopping_list_items')
+    with op.get_context().autocommit_block():
+        # Drop composite indexes
+        op.drop_index('idx_shopping_lists_kitchen_created', table_name='shopping_lists', postgresql_concurrently=True)
+        op.drop_index('idx_shopping_list_items_list', table_name='shopping_list_items', postgresql_concurrently=True)
     
-    op.drop_index('idx_pantry_items_kitchen_name', table_name='pantry_items')
-    op.drop_index('idx_pantry_items_upc', table_name='pantry_items')
+        op.drop_index('idx_pantry_items_kitchen_name', table_name='pantry_items', postgresql_concurrently=True)
+        op.drop_index('idx_pantry_items_upc', table_name='pantry_items', postgresql_concurrently=True)
     
-    op.drop_index('idx_refrigerator_items_kitchen_name', table_name='refrigerator_items')
-    op.drop_index('idx_refrigerator_items_upc', table_name='refrigerator_items')
+        op.drop_index('idx_refrigerator_items_kitchen_name', table_name='refrigerator_items', postgresql_concurrently=True)
+        op.drop_index('idx_refrigerator_items_upc', table_name='refrigerator_items', postgresql_concurrently=True)
     
-    op.drop_index('idx_freezer_items_kitchen_name', table_name='freezer_items')
-    op.drop_index('idx_freezer_items_upc', table_name='freezer_items')
+        op.drop_index('idx_freezer_items_kitchen_name', table_name='freezer_items', postgresql_concurrently=True)
+        op.drop_index('idx_freezer_items_upc', table_name='freezer_items', postgresql_concurrently=True)
     
-    op.drop_index('idx_users_email_active', table_name='users')
-    op.drop_index('idx_kitchens_owner_created', table_name='kitchens')
+        op.drop_index('idx_users_email_active', table_name='users', postgresql_concurrently=True)
+        op.drop_index('idx_kitchens_owner_created', table_name='kitchens', postgresql_concurrently=True)
     
-    # Drop full-text search indexes
-    op.drop_index('idx_shopping_list_items_fulltext', table_name='shopping_list_items')
-    op.drop_index('idx_pantry_items_fulltext', table_name='pantry_items')
-    op.drop_index('idx_refrigerator_items_fulltext', table_name='refrigerator_items')
-    op.drop_index('idx_freezer_items_fulltext', table_name='freezer_items')
+        # Drop full-text search indexes
+        op.drop_index('idx_shopping_list_items_fulltext', table_name='shopping_list_items', postgresql_concurrently=True)
+        op.drop_index('idx_pantry_items_fulltext', table_name='pantry_items', postgresql_concurrently=True)
+        op.drop_index('idx_refrigerator_items_fulltext', table_name='refrigerator_items', postgresql_concurrently=True)
+        op.drop_index('idx_freezer_items_fulltext', table_name='freezer_items', postgresql_concurrently=True)
     
-    # Drop partial indexes
-    op.drop_index('idx_users_active_username', table_name='users')
+        # Drop partial indexes
+        op.drop_index('idx_users_active_username', table_name='users', postgresql_concurrently=True)
@@ -0,0 +1,63 @@
+"""Add trigram indexes for substring name search
+
+Revision ID: 0da1aff30e56
+Revises: 434a535750ca
+Create Date: 2026-10-15 22:45:29.226312
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0da1aff30e56'
+down_revision: Union[str, Sequence[str], None] = '434a535750ca'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables whose name column is filtered with ILIKE '%term%'
+TRIGRAM_NAME_TABLES = [
+    'kitchens',
+    'shopping_lists',
+    'shopping_list_items',
+    'pantry_items',
+    'refrigerator_items',
+    'freezer_items',
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema - Add pg_trgm GIN indexes on name columns.
+    
+    Leading-wildcard ILIKE patterns cannot use a btree and do not match
+    tsvector lexemes. A gin_trgm_ops index accelerates LIKE/ILIKE on the
+    plain column, so the existing name.ilike(f"%{term}%") filters use it
+    without any query changes.
+    """
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    
+    with op.get_context().autocommit_block():
+        for table in TRIGRAM_NAME_TABLES:
+            op.create_index(
+                f'ix_{table}_name_trgm',
+                table,
+                ['name'],
+                postgresql_using='gin',
+                postgresql_ops={'name': 'gin_trgm_ops'},
+                postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Remove trigram name indexes."""
+    with op.get_context().autocommit_block():
+        for table in TRIGRAM_NAME_TABLES:
+            op.drop_index(
+                f'ix_{table}_name_trgm',
+                table_name=table,
+                postgresql_concurrently=True
+            )
+    # pg_trgm is left installed; other objects may depend on it
@@ -1,7 +1,7 @@
 """Add pantry, refrigerator, and freezer item tables
 
 Revision ID: 42d9e070349b
-Revises: 034f6c9ab1e6
+Revises: c38c43c79949
 Create Date: 2025-10-30 22:29:06.021753
 
 """
@@ -0,0 +1,84 @@
+"""Replace fulltext expression indexes with generated tsvector columns
+
+Revision ID: 434a535750ca
+Revises: e7cc01f0a4fc
+Create Date: 2026-10-15 22:45:07.610047
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '434a535750ca'
+down_revision: Union[str, Sequence[str], None] = 'e7cc01f0a4fc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# table -> tsvector expression previously used by its idx_<table>_fulltext index
+FULLTEXT_TABLES = {
+    'shopping_list_items': "to_tsvector('english', coalesce(name, ''))",
+    'pantry_items': "to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, ''))",
+    'refrigerator_items': "to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, ''))",
+    'freezer_items': "to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, ''))",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema - Move full-text search onto stored tsvector columns.
+    
+    Expression GIN indexes are only used when a query repeats the exact
+    expression text. A GENERATED ... STORED column gives queries a stable
+    target (search_tsv @@ plainto_tsquery('english', :q)) and PostgreSQL keeps
+    it in sync on every write.
+    """
+    # Adding a stored generated column rewrites the table, so this part runs
+    # in the normal migration transaction
+    for table, expression in FULLTEXT_TABLES.items():
+        op.add_column(
+            table,
+            sa.Column(
+                'search_tsv',
+                postgresql.TSVECTOR(),
+                sa.Computed(expression, persisted=True),
+                nullable=True
+            )
+        )
+    
+    with op.get_context().autocommit_block():
+        for table in FULLTEXT_TABLES:
+            op.create_index(
+                f'ix_{table}_search_tsv',
+                table,
+                ['search_tsv'],
+                postgresql_using='gin',
+                postgresql_concurrently=True
+            )
+            op.drop_index(
+                f'idx_{table}_fulltext',
+                table_name=table,
+                postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Restore expression-based full-text indexes."""
+    with op.get_context().autocommit_block():
+        for table, expression in FULLTEXT_TABLES.items():
+            op.execute(f"""
+                CREATE INDEX CONCURRENTLY idx_{table}_fulltext 
+                ON {table} 
+                USING gin({expression})
+            """)
+            op.drop_index(
+                f'ix_{table}_search_tsv',
+                table_name=table,
+                postgresql_concurrently=True
+            )
+    
+    for table in FULLTEXT_TABLES:
+        op.drop_column(table, 'search_tsv')
@@ -0,0 +1,68 @@
+"""Make upc indexes partial on upc IS NOT NULL
+
+Revision ID: 539a5939b378
+Revises: 0da1aff30e56
+Create Date: 2026-10-15 22:47:15.688234
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '539a5939b378'
+down_revision: Union[str, Sequence[str], None] = '0da1aff30e56'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+
+# Inventory tables with a nullable, mostly-empty upc column
+UPC_TABLES = [
+    'pantry_items',
+    'refrigerator_items',
+    'freezer_items',
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema - Rebuild upc indexes as partial indexes.
+    
+    Most hand-added items carry no UPC, so the full indexes are mostly NULL
+    entries that no query reads. Lookups are always upc = :value, which
+    implies upc IS NOT NULL and so still qualify for the partial index.
+    """
+    with op.get_context().autocommit_block():
+        for table in UPC_TABLES:
+            op.create_index(
+                f'idx_{table}_upc_new',
+                table,
+                ['upc'],
+                postgresql_where=sa.text('upc IS NOT NULL'),
+                postgresql_concurrently=True
+            )
+            op.drop_index(
+                f'idx_{table}_upc',
+                table_name=table,
+                postgresql_concurrently=True
+            )
+            op.execute(f"ALTER INDEX idx_{table}_upc_new RENAME TO idx_{table}_upc")
+
+
+def downgrade() -> None:
+    """Downgrade schema - Restore full upc indexes."""
+    with op.get_context().autocommit_block():
+        for table in UPC_TABLES:
+            op.drop_index(
+                f'idx_{table}_upc',
+                table_name=table,
+                postgresql_concurrently=True
+            )
+            op.create_index(
+                f'idx_{table}_upc',
+                table,
+                ['upc'],
+                postgresql_concurrently=True
+            )
@@ -0,0 +1,60 @@
+"""Make active username index covering for login
+
+Revision ID: 58c3ce17ad1f
+Revises: 8defc2577048
+Create Date: 2026-10-15 22:48:15.219522
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '58c3ce17ad1f'
+down_revision: Union[str, Sequence[str], None] = '8defc2577048'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+
+def upgrade() -> None:
+    """Upgrade schema - Add INCLUDE columns to idx_users_active_username.
+    
+    authenticate_user only reads id, hashed_password and is_verified for an
+    active username, so carrying them in the index lets login be answered
+    by an index-only scan once the visibility map is current.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_users_active_username_new',
+            'users',
+            ['username'],
+            postgresql_include=['id', 'hashed_password', 'is_verified'],
+            postgresql_where=sa.text('is_active = true'),
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'idx_users_active_username',
+            table_name='users',
+            postgresql_concurrently=True
+        )
+        op.execute("ALTER INDEX idx_users_active_username_new RENAME TO idx_users_active_username")
+
+
+def downgrade() -> None:
+    """Downgrade schema - Restore idx_users_active_username without INCLUDE."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_users_active_username',
+            table_name='users',
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'idx_users_active_username',
+            'users',
+            ['username'],
+            postgresql_where=sa.text('is_active = true'),
+            postgresql_concurrently=True
+        )
@@ -0,0 +1,48 @@
+"""Add index on users selected_kitchen_id
+
+Revision ID: 8defc2577048
+Revises: 539a5939b378
+Create Date: 2026-10-15 22:47:33.025939
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8defc2577048'
+down_revision: Union[str, Sequence[str], None] = '539a5939b378'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+
+def upgrade() -> None:
+    """Upgrade schema - Index the users.selected_kitchen_id foreign key.
+    
+    Deleting a kitchen has to check fk_users_selected_kitchen for referencing
+    users, which is a sequential scan of users without an index on the child
+    side. Users without a selected kitchen are left out of the index. The
+    other child-side foreign keys are already the leading column of an
+    existing composite index.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_selected_kitchen_id',
+            'users',
+            ['selected_kitchen_id'],
+            postgresql_where=sa.text('selected_kitchen_id IS NOT NULL'),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Drop ix_users_selected_kitchen_id."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_users_selected_kitchen_id',
+            table_name='users',
+            postgresql_concurrently=True
+        )
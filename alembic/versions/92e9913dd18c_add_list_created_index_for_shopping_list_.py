@@ -0,0 +1,58 @@
+"""Add list/created index for shopping list items
+
+Revision ID: 92e9913dd18c
+Revises: d8a415c355d6
+Create Date: 2026-10-15 23:41:05.733921
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '92e9913dd18c'
+down_revision: Union[str, Sequence[str], None] = 'd8a415c355d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Index shopping list items by list, newest first.
+    
+    Matches the item listing's shopping_list_id filter and its default
+    ORDER BY created_at DESC, id DESC, like the kitchen and shopping list
+    listing indexes. The single-column idx_shopping_list_items_list is a
+    prefix of the new index, so it is dropped once the new one is ready.
+    """
+    
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_shopping_list_items_list_created',
+            'shopping_list_items',
+            ['shopping_list_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'idx_shopping_list_items_list',
+            table_name='shopping_list_items',
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Restore the single-column list index."""
+    
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_shopping_list_items_list',
+            'shopping_list_items',
+            ['shopping_list_id'],
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'idx_shopping_list_items_list_created',
+            table_name='shopping_list_items',
+            postgresql_concurrently=True
+        )
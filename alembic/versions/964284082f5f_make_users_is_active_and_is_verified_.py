@@ -0,0 +1,63 @@
+"""Make users is_active and is_verified not null
+
+Revision ID: 964284082f5f
+Revises: 58c3ce17ad1f
+Create Date: 2026-10-15 22:50:27.950934
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '964284082f5f'
+down_revision: Union[str, Sequence[str], None] = '58c3ce17ad1f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+
+def upgrade() -> None:
+    """Upgrade schema - Make users.is_active/is_verified NOT NULL.
+    
+    NULL flags were already treated as false by the application, so they are
+    backfilled as false. Server defaults mirror the ORM defaults so rows
+    inserted outside the ORM get the same values.
+    """
+    op.execute("UPDATE users SET is_active = false WHERE is_active IS NULL")
+    op.execute("UPDATE users SET is_verified = false WHERE is_verified IS NULL")
+    
+    op.alter_column(
+        'users',
+        'is_active',
+        existing_type=sa.Boolean(),
+        nullable=False,
+        server_default=sa.true()
+    )
+    op.alter_column(
+        'users',
+        'is_verified',
+        existing_type=sa.Boolean(),
+        nullable=False,
+        server_default=sa.false()
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Allow NULL users.is_active/is_verified again."""
+    op.alter_column(
+        'users',
+        'is_verified',
+        existing_type=sa.Boolean(),
+        nullable=True,
+        server_default=None
+    )
+    op.alter_column(
+        'users',
+        'is_active',
+        existing_type=sa.Boolean(),
+        nullable=True,
+        server_default=None
+    )
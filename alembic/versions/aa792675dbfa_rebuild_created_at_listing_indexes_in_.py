@@ -0,0 +1,83 @@
+"""Rebuild created_at listing indexes in descending order
+
+Revision ID: aa792675dbfa
+Revises: 335b52e7179e
+Create Date: 2026-10-15 22:44:31.600259
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'aa792675dbfa'
+down_revision: Union[str, Sequence[str], None] = '335b52e7179e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Rebuild listing indexes to match ORDER BY created_at DESC."""
+    
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block.
+    # Each index is built under a temporary name first so the old one keeps
+    # serving reads until the replacement is ready.
+    with op.get_context().autocommit_block():
+        # Kitchens - owner listing, newest first
+        op.create_index(
+            'idx_kitchens_owner_created_new',
+            'kitchens',
+            ['owner_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'idx_kitchens_owner_created',
+            table_name='kitchens',
+            postgresql_concurrently=True
+        )
+        op.execute("ALTER INDEX idx_kitchens_owner_created_new RENAME TO idx_kitchens_owner_created")
+        
+        # Shopping lists - kitchen listing, newest first
+        op.create_index(
+            'idx_shopping_lists_kitchen_created_new',
+            'shopping_lists',
+            ['kitchen_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'idx_shopping_lists_kitchen_created',
+            table_name='shopping_lists',
+            postgresql_concurrently=True
+        )
+        op.execute("ALTER INDEX idx_shopping_lists_kitchen_created_new RENAME TO idx_shopping_lists_kitchen_created")
+
+
+def downgrade() -> None:
+    """Downgrade schema - Restore ascending listing indexes."""
+    
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_shopping_lists_kitchen_created',
+            table_name='shopping_lists',
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'idx_shopping_lists_kitchen_created',
+            'shopping_lists',
+            ['kitchen_id', 'created_at'],
+            postgresql_concurrently=True
+        )
+        
+        op.drop_index(
+            'idx_kitchens_owner_created',
+            table_name='kitchens',
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'idx_kitchens_owner_created',
+            'kitchens',
+            ['owner_id', 'created_at'],
+            postgresql_concurrently=True
+        )
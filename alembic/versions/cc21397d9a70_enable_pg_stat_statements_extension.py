@@ -0,0 +1,34 @@
+"""Enable pg_stat_statements extension
+
+Revision ID: cc21397d9a70
+Revises: 964284082f5f
+Create Date: 2026-10-15 22:56:34.521021
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'cc21397d9a70'
+down_revision: Union[str, Sequence[str], None] = '964284082f5f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+
+def upgrade() -> None:
+    """Upgrade schema - Create the pg_stat_statements extension.
+    
+    Exposes per-statement timing and I/O for index auditing. Statistics are
+    only collected when pg_stat_statements is listed in
+    shared_preload_libraries (see DATABASE_CONFIGURATION.md).
+    """
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_stat_statements")
+
+
+def downgrade() -> None:
+    """Downgrade schema - Drop the pg_stat_statements extension."""
+    op.execute("DROP EXTENSION IF EXISTS pg_stat_statements")
@@ -0,0 +1,63 @@
+"""Add trigram indexes for description and quantity search
+
+Revision ID: d8a415c355d6
+Revises: cc21397d9a70
+Create Date: 2026-10-15 23:31:12.408113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8a415c355d6'
+down_revision: Union[str, Sequence[str], None] = 'cc21397d9a70'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column) pairs searched with ILIKE '%term%' alongside name; the
+# name columns already have ix_<table>_name_trgm
+TRIGRAM_COLUMNS = [
+    ('kitchens', 'description'),
+    ('shopping_lists', 'description'),
+    ('shopping_list_items', 'quantity'),
+    ('pantry_items', 'description'),
+    ('refrigerator_items', 'description'),
+    ('freezer_items', 'description'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema - Add pg_trgm GIN indexes on searched text columns.
+    
+    The search filters OR a name ILIKE with a description (or quantity)
+    ILIKE. PostgreSQL can only combine them in a BitmapOr when every arm has
+    an index; with the name index alone the whole search falls back to a
+    sequential scan.
+    """
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    
+    with op.get_context().autocommit_block():
+        for table, column in TRIGRAM_COLUMNS:
+            op.create_index(
+                f'ix_{table}_{column}_trgm',
+                table,
+                [column],
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Remove trigram description and quantity indexes."""
+    with op.get_context().autocommit_block():
+        for table, column in TRIGRAM_COLUMNS:
+            op.drop_index(
+                f'ix_{table}_{column}_trgm',
+                table_name=table,
+                postgresql_concurrently=True
+            )
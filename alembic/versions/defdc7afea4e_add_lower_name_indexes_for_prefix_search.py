@@ -0,0 +1,54 @@
+"""Add lower(name) indexes for prefix search
+
+Revision ID: defdc7afea4e
+Revises: 92e9913dd18c
+Create Date: 2026-10-15 23:44:38.190254
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'defdc7afea4e'
+down_revision: Union[str, Sequence[str], None] = '92e9913dd18c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables whose listings accept name_prefix
+PREFIX_NAME_TABLES = [
+    'kitchens',
+    'shopping_lists',
+    'shopping_list_items',
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema - Add B-tree indexes on lower(name) for prefix filters.
+    
+    name_prefix filters with lower(name) LIKE 'prefix%'. text_pattern_ops
+    lets a B-tree answer that as a range scan whatever the database
+    collation, which neither ILIKE nor the trigram indexes do in log time.
+    """
+    with op.get_context().autocommit_block():
+        for table in PREFIX_NAME_TABLES:
+            op.create_index(
+                f'ix_{table}_name_lower',
+                table,
+                [sa.text('lower(name) text_pattern_ops')],
+                postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Remove lower(name) prefix indexes."""
+    with op.get_context().autocommit_block():
+        for table in PREFIX_NAME_TABLES:
+            op.drop_index(
+                f'ix_{table}_name_lower',
+                table_name=table,
+                postgresql_concurrently=True
+            )
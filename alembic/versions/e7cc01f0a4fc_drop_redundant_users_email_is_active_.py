@@ -0,0 +1,45 @@
+"""Drop redundant users email/is_active index
+
+Revision ID: e7cc01f0a4fc
+Revises: aa792675dbfa
+Create Date: 2026-10-15 22:44:50.236466
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7cc01f0a4fc'
+down_revision: Union[str, Sequence[str], None] = 'aa792675dbfa'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Drop idx_users_email_active.
+    
+    email is already unique via ix_users_email, so the trailing is_active
+    column never narrows a lookup and the index only adds write overhead.
+    Name lookups on pantry/refrigerator/freezer items are always scoped by
+    kitchen_id, so the (kitchen_id, name) indexes are kept as they are.
+    """
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_users_email_active',
+            table_name='users',
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Restore idx_users_email_active."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_users_email_active',
+            'users',
+            ['email', 'is_active'],
+            postgresql_concurrently=True
+        )
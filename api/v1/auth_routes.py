@@ -1,21 +1,28 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import update, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query as ORMQuery, Session, selectinload
 from datetime import timedelta, date
 from typing import List, Optional
-import math
 
 from . import schemas, models
-from .database import get_db
-from .filters import filter_kitchens
+from .database import get_db, get_async_db
+from .filters import filter_kitchens, paginate_with_total_async, SortBy, SortOrder
 from .exceptions import (
-    DuplicateUsernameException,
     DuplicateEmailException,
     InvalidCredentialsException,
     KitchenNotFoundException,
     KitchenAccessDeniedException
 )
-from auth import authenticate_user, create_access_token, create_user, get_current_active_user
+from auth import (
+    authenticate_user,
+    create_access_token,
+    create_user,
+    get_current_active_user,
+    get_current_active_user_async,
+    invalidate_cached_user
+)
 from config import ACCESS_TOKEN_EXPIRE_MINUTES
 
 router = APIRouter()
@@ -23,17 +30,9 @@ router = APIRouter()
 @router.post("/register", response_model=schemas.User, status_code=status.HTTP_201_CREATED)
 def register_user(user_data: schemas.UserCreate, db: Session = Depends(get_db)):
     """Register a new user"""
-    # Check if username already exists
-    existing_user = db.query(models.User).filter(models.User.username == user_data.username).first()
-    if existing_user:
-        raise DuplicateUsernameException(user_data.username)
-    
-    # Check if email already exists
-    existing_email = db.query(models.User).filter(models.User.email == user_data.email).first()
-    if existing_email:
-        raise DuplicateEmailException(user_data.email)
-    
-    # Create new user (this will handle database errors internally)
+    # Uniqueness of username/email is enforced by the ix_users_username and
+    # ix_users_email unique indexes; create_user maps the IntegrityError raised
+    # by the INSERT to DuplicateUsernameException / DuplicateEmailException.
     user = create_user(
         username=user_data.username,
         email=user_data.email,
@@ -64,7 +63,7 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depend
     }
 
 @router.get("/users/me", response_model=schemas.User)
-def get_current_user_info(current_user: models.User = Depends(get_current_active_user)):
+async def get_current_user_info(current_user: models.User = Depends(get_current_active_user_async)):
     """Get current user information"""
     return current_user
 
@@ -91,6 +90,7 @@ def update_current_user(
             setattr(current_user, field, value)
         
         db.commit()
+        invalidate_cached_user(current_user.username)
         db.refresh(current_user)
         return current_user
     except Exception as e:
@@ -115,26 +115,37 @@ def create_kitchen(
     db.refresh(kitchen)
     return kitchen
 
-@router.get("/kitchens/", response_model=schemas.PaginatedKitchensResponse)
-def list_user_kitchens(
+@router.get("/kitchens/", response_model=schemas.PaginatedKitchenSummaryResponse)
+async def list_user_kitchens(
     skip: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of items to return"),
     name: Optional[str] = Query(None, description="Filter by name (partial match)"),
+    name_prefix: Optional[str] = Query(None, description="Filter by name prefix (case-insensitive)"),
     search: Optional[str] = Query(None, description="Search in name and description"),
     date_from: Optional[date] = Query(None, description="Filter from date (YYYY-MM-DD)"),
     date_to: Optional[date] = Query(None, description="Filter to date (YYYY-MM-DD)"),
-    sort_by: Optional[str] = Query("created_at", description="Sort by field (name, created_at, updated_at)"),
-    sort_order: Optional[str] = Query("desc", description="Sort order (asc, desc)"),
-    current_user: models.User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    sort_by: SortBy = Query(SortBy.created_at, description="Sort by field"),
+    sort_order: SortOrder = Query(SortOrder.desc, description="Sort order"),
+    current_user: models.User = Depends(get_current_active_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """List current user's kitchens with filtering and search"""
     # Base query with ownership filtering
-    base_query = db.query(models.Kitchen).filter(models.Kitchen.owner_id == current_user.id)
+    base_query = ORMQuery(models.Kitchen).filter(models.Kitchen.owner_id == current_user.id)
     
-    # Apply filters
+    # Apply filters; only the KitchenSummary columns are selected, as plain
+    # rows, so the description TEXT is never read and no Kitchen objects are
+    # built for a listing
     filters = {
+        'columns': [
+            models.Kitchen.id,
+            models.Kitchen.name,
+            models.Kitchen.owner_id,
+            models.Kitchen.created_at,
+            models.Kitchen.updated_at
+        ],
         'name': name,
+        'name_prefix': name_prefix,
         'owner_id': current_user.id,
         'search': search,
         'date_from': date_from,
@@ -145,35 +156,30 @@ def list_user_kitchens(
     
     filtered_query = filter_kitchens(base_query, **filters)
     
-    # Get total count for pagination
-    total = filtered_query.count()
+    # Fetch the page and total count together
+    kitchens, total = await paginate_with_total_async(db, filtered_query, skip, limit)
     
-    # Apply pagination
-    kitchens = filtered_query.offset(skip).limit(limit).all()
-    
-    # Calculate pagination metadata
-    page = (skip // limit) + 1
-    pages = math.ceil(total / limit) if total > 0 else 1
-    
-    return schemas.PaginatedKitchensResponse(
+    return schemas.PaginatedKitchenSummaryResponse(
         items=kitchens,
         total=total,
-        page=page,
-        per_page=limit,
-        pages=pages,
-        has_next=skip + limit < total,
-        has_prev=skip > 0
+        skip=skip,
+        per_page=limit
     )
 
 @router.get("/kitchens/{kitchen_id}", response_model=schemas.Kitchen)
-def get_kitchen(
+async def get_kitchen(
     kitchen_id: int,
-    current_user: models.User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: models.User = Depends(get_current_active_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific kitchen"""
-    # First check if kitchen exists
-    kitchen = db.query(models.Kitchen).filter(models.Kitchen.id == kitchen_id).first()
+    # First check if kitchen exists; relationships in the response are loaded
+    # eagerly since lazy loads are not available on an async session
+    kitchen = await db.get(
+        models.Kitchen,
+        kitchen_id,
+        options=[selectinload(models.Kitchen.shopping_lists).selectinload(models.ShoppingList.items)]
+    )
     if not kitchen:
         raise KitchenNotFoundException(kitchen_id)
     
@@ -191,23 +197,27 @@ def update_kitchen(
     db: Session = Depends(get_db)
 ):
     """Update a kitchen"""
-    kitchen = db.query(models.Kitchen).filter(
-        models.Kitchen.id == kitchen_id,
-        models.Kitchen.owner_id == current_user.id
-    ).first()
+    # Ownership check, update and reload in one UPDATE ... RETURNING
+    update_data = kitchen_update.dict(exclude_unset=True)
+    stmt = (
+        update(models.Kitchen)
+        .where(
+            models.Kitchen.id == kitchen_id,
+            models.Kitchen.owner_id == current_user.id
+        )
+        .values(**update_data)
+        .returning(models.Kitchen)
+        .execution_options(synchronize_session=False)
+    )
+    kitchen = db.execute(stmt).scalar_one_or_none()
     
-    if not kitchen:
+    if kitchen is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Kitchen not found"
         )
     
-    update_data = kitchen_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(kitchen, field, value)
-    
     db.commit()
-    db.refresh(kitchen)
     return kitchen
 
 @router.delete("/kitchens/{kitchen_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -217,17 +227,23 @@ def delete_kitchen(
     db: Session = Depends(get_db)
 ):
     """Delete a kitchen"""
-    kitchen = db.query(models.Kitchen).filter(
-        models.Kitchen.id == kitchen_id,
-        models.Kitchen.owner_id == current_user.id
-    ).first()
+    # Delete directly; no returned id means the kitchen is missing or foreign
+    stmt = (
+        delete(models.Kitchen)
+        .where(
+            models.Kitchen.id == kitchen_id,
+            models.Kitchen.owner_id == current_user.id
+        )
+        .returning(models.Kitchen.id)
+        .execution_options(synchronize_session=False)
+    )
+    deleted_id = db.execute(stmt).scalar_one_or_none()
     
-    if not kitchen:
+    if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Kitchen not found"
         )
     
-    db.delete(kitchen)
     db.commit()
     return None
\ No newline at end of file
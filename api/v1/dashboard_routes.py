@@ -1,315 +1,346 @@
-from fastapi import APIRouter, Depends, Query, HTTPException
-from typing import Dict, Any, List, Optional
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from typing import Dict, Any, List, Callable, Tuple
 from datetime import datetime, timedelta
+import asyncio
+import hashlib
+import heapq
 import logging
+import time
 from collections import defaultdict
+from functools import lru_cache
+from operator import itemgetter
 
-from .monitoring import metrics_collector, performance_profiler, alert_manager
+from .monitoring import metrics_collector, performance_profiler, alert_manager, COMMON_OPERATIONS
 from .validation import validate_bearer_token
 from . import models
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Short-lived response cache: dashboard data is the same for every caller, so
+# concurrent refreshes within the TTL share a single computation. Bodies are
+# cached already serialized, with an ETag so unchanged polls get a 304.
+OVERVIEW_CACHE_TTL = 2.0
+CHARTS_CACHE_TTL = 10.0
+ALERTS_CACHE_TTL = 3.0
+
+_response_cache: Dict[str, Tuple[float, bytes, str]] = {}
+_cache_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+cache_stats = {"hits": 0, "misses": 0, "not_modified": 0}
+
+async def _cached(key: str, ttl: float, request: Request, producer: Callable[[], Any]) -> Response:
+    """Serve the cached body for key, computing it at most once per TTL"""
+    cache_status = "HIT"
+    entry = _response_cache.get(key)
+    if entry is None or entry[0] <= time.monotonic():
+        async with _cache_locks[key]:
+            # Another request may have refreshed the entry while we waited
+            entry = _response_cache.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                body = ORJSONResponse(producer()).body
+                etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+                entry = (time.monotonic() + ttl, body, etag)
+                _response_cache[key] = entry
+                cache_status = "MISS"
+    
+    cache_stats["hits" if cache_status == "HIT" else "misses"] += 1
+    _, body, etag = entry
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"private, max-age={int(ttl)}",
+        "X-Cache": cache_status
+    }
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        cache_stats["not_modified"] += 1
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def clear_dashboard_cache():
+    """Drop all cached dashboard responses"""
+    _response_cache.clear()
+    _request_chart_columns.cache_clear()
+
 @router.get("/dashboard/overview", response_model=Dict[str, Any])
 async def dashboard_overview(
+    request: Request,
     current_user: models.User = Depends(validate_bearer_token)
 ):
     """
     Get dashboard overview with key metrics
     Requires authentication for security
     """
-    try:
-        now = datetime.utcnow()
-        
-        # Get basic health status
-        health_status = metrics_collector.get_health_status()
-        
-        # Get metrics for different time periods
-        last_hour_metrics = metrics_collector.get_metrics_summary(hours=1)
-        last_24h_metrics = metrics_collector.get_metrics_summary(hours=24)
-        
-        # Calculate trends
-        hour_requests = last_hour_metrics.get("total_requests", 0)
-        day_requests = last_24h_metrics.get("total_requests", 0)
-        
-        # Estimate requests per hour for the day
-        avg_requests_per_hour = day_requests / 24 if day_requests > 0 else 0
-        
-        # Calculate trend (current hour vs average)
-        request_trend = "stable"
-        if avg_requests_per_hour > 0:
-            trend_ratio = hour_requests / avg_requests_per_hour
-            if trend_ratio > 1.2:
-                request_trend = "increasing"
-            elif trend_ratio < 0.8:
-                request_trend = "decreasing"
-        
-        # Get top endpoints
-        top_endpoints = last_24h_metrics.get("top_endpoints", [])[:5]
-        
-        # Get recent alerts (last 24 hours)
-        recent_alerts = []
-        twenty_four_hours_ago = now - timedelta(hours=24)
-        
-        # This would typically come from a persistent alert store
-        # For now, we'll use the current alert status
-        if health_status["status"] != "healthy":
-            recent_alerts.append({
-                "type": "system_health",
-                "severity": "warning" if health_status["status"] == "degraded" else "critical",
-                "message": f"System status: {health_status['status']}",
-                "timestamp": now.isoformat(),
-                "issues": health_status.get("issues", [])
-            })
-        
-        return {
+    return await _cached("overview", OVERVIEW_CACHE_TTL, request, _build_overview)
+
+def _build_overview() -> Dict[str, Any]:
+    """Assemble the dashboard overview payload"""
+    now = datetime.utcnow()
+    
+    # Get basic health status; metrics are absent when the check itself failed
+    health_status = metrics_collector.get_health_status()
+    system_metrics = health_status.get("metrics", {})
+    
+    # Get metrics for different time periods
+    last_hour_metrics = metrics_collector.get_metrics_summary(hours=1)
+    last_24h_metrics = metrics_collector.get_metrics_summary(hours=24)
+    
+    # Calculate trends
+    hour_requests = last_hour_metrics.get("total_requests", 0)
+    day_requests = last_24h_metrics.get("total_requests", 0)
+    
+    # Estimate requests per hour for the day
+    avg_requests_per_hour = day_requests / 24 if day_requests > 0 else 0
+    
+    # Calculate trend (current hour vs average)
+    request_trend = "stable"
+    if avg_requests_per_hour > 0:
+        trend_ratio = hour_requests / avg_requests_per_hour
+        if trend_ratio > 1.2:
+            request_trend = "increasing"
+        elif trend_ratio < 0.8:
+            request_trend = "decreasing"
+    
+    # Get top endpoints
+    top_endpoints = last_24h_metrics.get("top_endpoints", [])[:5]
+    
+    # Get recent alerts (last 24 hours)
+    recent_alerts = []
+    
+    # This would typically come from a persistent alert store
+    # For now, we'll use the current alert status
+    if health_status["status"] != "healthy":
+        recent_alerts.append({
+            "type": "system_health",
+            "severity": "warning" if health_status["status"] == "degraded" else "critical",
+            "message": f"System status: {health_status['status']}",
             "timestamp": now.isoformat(),
-            "system_status": {
-                "overall_health": health_status["status"],
-                "uptime_seconds": health_status["uptime_seconds"],
-                "issues": health_status.get("issues", [])
+            "issues": health_status.get("issues", [])
+        })
+    
+    return {
+        "timestamp": now.isoformat(),
+        "system_status": {
+            "overall_health": health_status["status"],
+            "uptime_seconds": health_status.get("uptime_seconds"),
+            "issues": health_status.get("issues", [])
+        },
+        "request_metrics": {
+            "last_hour": {
+                "total_requests": hour_requests,
+                "error_rate": last_hour_metrics.get("error_rate", 0),
+                "avg_response_time": last_hour_metrics.get("response_times", {}).get("avg", 0)
             },
-            "request_metrics": {
-                "last_hour": {
-                    "total_requests": hour_requests,
-                    "error_rate": last_hour_metrics.get("error_rate", 0),
-                    "avg_response_time": last_hour_metrics.get("response_times", {}).get("avg", 0)
-                },
-                "last_24h": {
-                    "total_requests": day_requests,
-                    "error_rate": last_24h_metrics.get("error_rate", 0),
-                    "avg_response_time": last_24h_metrics.get("response_times", {}).get("avg", 0)
-                },
-                "trend": request_trend
+            "last_24h": {
+                "total_requests": day_requests,
+                "error_rate": last_24h_metrics.get("error_rate", 0),
+                "avg_response_time": last_24h_metrics.get("response_times", {}).get("avg", 0)
             },
-            "system_resources": {
-                "cpu_percent": health_status["metrics"].get("cpu_percent"),
-                "memory_percent": health_status["metrics"].get("memory_percent"),
-                "requests_last_5min": health_status["metrics"].get("requests_last_5min", 0)
-            },
-            "top_endpoints": top_endpoints,
-            "recent_alerts": recent_alerts,
-            "error_breakdown": last_24h_metrics.get("error_breakdown", {})
-        }
-        
-    except Exception as e:
-        logger.error(f"Failed to get dashboard overview: {e}")
-        raise HTTPException(status_code=500, detail="Failed to retrieve dashboard data")
+            "trend": request_trend
+        },
+        "system_resources": {
+            "cpu_percent": system_metrics.get("cpu_percent"),
+            "memory_percent": system_metrics.get("memory_percent"),
+            "requests_last_5min": system_metrics.get("requests_last_5min", 0)
+        },
+        "top_endpoints": top_endpoints,
+        "recent_alerts": recent_alerts,
+        "error_breakdown": last_24h_metrics.get("error_breakdown", {})
+    }
 
 @router.get("/dashboard/charts/requests", response_model=Dict[str, Any])
 async def dashboard_request_charts(
+    request: Request,
     hours: int = Query(24, ge=1, le=168, description="Hours of data to retrieve"),
     interval_minutes: int = Query(60, ge=5, le=1440, description="Data point interval in minutes"),
+    data_format: str = Query(
+        "rows",
+        alias="format",
+        pattern="^(rows|columnar)$",
+        description="rows: {timestamp, value} points per series; columnar: one shared timestamps array plus a value array per series"
+    ),
     current_user: models.User = Depends(validate_bearer_token)
 ):
     """
     Get request metrics data for charts
     """
-    try:
-        now = datetime.utcnow()
-        start_time = now - timedelta(hours=hours)
-        interval = timedelta(minutes=interval_minutes)
-        
-        # Create time buckets
-        time_buckets = []
-        current_time = start_time
-        while current_time <= now:
-            time_buckets.append(current_time)
-            current_time += interval
-        
-        # Initialize data structures
-        request_counts = []
-        error_counts = []
-        response_times = []
-        
-        # Process metrics by time bucket
-        for i, bucket_start in enumerate(time_buckets[:-1]):
-            bucket_end = time_buckets[i + 1]
-            
-            # Filter requests in this time bucket
-            bucket_requests = [
-                m for m in metrics_collector.request_metrics
-                if bucket_start <= m.timestamp < bucket_end
-            ]
-            
-            # Calculate metrics for this bucket
-            total_requests = len(bucket_requests)
-            error_requests = sum(1 for m in bucket_requests if m.status_code >= 400)
-            
-            if bucket_requests:
-                avg_response_time = sum(m.duration for m in bucket_requests) / len(bucket_requests)
-            else:
-                avg_response_time = 0
-            
-            request_counts.append({
-                "timestamp": bucket_start.isoformat(),
-                "value": total_requests
-            })
-            
-            error_counts.append({
-                "timestamp": bucket_start.isoformat(),
-                "value": error_requests
-            })
-            
-            response_times.append({
-                "timestamp": bucket_start.isoformat(),
-                "value": avg_response_time
-            })
-        
-        return {
-            "period_hours": hours,
-            "interval_minutes": interval_minutes,
-            "data": {
-                "request_counts": request_counts,
-                "error_counts": error_counts,
-                "response_times": response_times
-            }
+    return await _cached(
+        f"charts:requests:{hours}:{interval_minutes}:{data_format}",
+        CHARTS_CACHE_TTL,
+        request,
+        lambda: _build_request_charts(hours, interval_minutes, int(time.time()) // 60, data_format)
+    )
+
+def _build_request_charts(hours: int, interval_minutes: int, now_minute: int, data_format: str) -> Dict[str, Any]:
+    """Shape the request chart series as row points or parallel columns"""
+    timestamps, request_counts, error_counts, response_times = _request_chart_columns(
+        hours, interval_minutes, now_minute
+    )
+    
+    if data_format == "columnar":
+        data = {
+            "timestamps": timestamps,
+            "request_counts": request_counts,
+            "error_counts": error_counts,
+            "response_times": response_times
         }
-        
-    except Exception as e:
-        logger.error(f"Failed to get request chart data: {e}")
-        raise HTTPException(status_code=500, detail="Failed to retrieve chart data")
+    else:
+        data = {
+            name: [{"timestamp": timestamp, "value": value} for timestamp, value in zip(timestamps, values)]
+            for name, values in (
+                ("request_counts", request_counts),
+                ("error_counts", error_counts),
+                ("response_times", response_times)
+            )
+        }
+    
+    return {
+        "period_hours": hours,
+        "interval_minutes": interval_minutes,
+        "data": data
+    }
+
+@lru_cache(maxsize=128)
+def _request_chart_columns(hours: int, interval_minutes: int, now_minute: int) -> Tuple[List[str], List[int], List[int], List[float]]:
+    """Bucket timestamps and per-bucket request counts, error counts and
+    average response times
+    
+    Only fully elapsed minutes are charted, so the columns for a given
+    minute never change and are memoized until the minute advances.
+    """
+    # Bucket starts are whole epoch minutes, aligned with the collector's
+    # rollup; only buckets that have fully elapsed are reported
+    start_minute = now_minute - hours * 60
+    bucket_starts = range(start_minute, now_minute - interval_minutes + 1, interval_minutes)
+    
+    # Sum the collector's per-minute rollups instead of scanning raw requests
+    rollup = metrics_collector.get_request_rollup(start_minute, interval_minutes, len(bucket_starts))
+    
+    timestamps = [datetime.utcfromtimestamp(bucket_start * 60).isoformat() for bucket_start in bucket_starts]
+    request_counts = [total_requests for total_requests, _, _ in rollup]
+    error_counts = [error_requests for _, error_requests, _ in rollup]
+    response_times = [
+        total_duration / total_requests if total_requests else 0
+        for total_requests, _, total_duration in rollup
+    ]
+    return timestamps, request_counts, error_counts, response_times
 
 @router.get("/dashboard/charts/system", response_model=Dict[str, Any])
 async def dashboard_system_charts(
+    request: Request,
     hours: int = Query(24, ge=1, le=168, description="Hours of data to retrieve"),
     current_user: models.User = Depends(validate_bearer_token)
 ):
     """
     Get system metrics data for charts
     """
-    try:
-        now = datetime.utcnow()
-        start_time = now - timedelta(hours=hours)
-        
-        # Filter system metrics by time period
-        system_data = [
-            m for m in metrics_collector.system_metrics
-            if m.timestamp >= start_time
-        ]
-        
-        # Format data for charts
-        cpu_data = []
-        memory_data = []
-        request_rate_data = []
-        
-        for metric in system_data:
-            timestamp = metric.timestamp.isoformat()
-            
-            cpu_data.append({
-                "timestamp": timestamp,
-                "value": metric.cpu_percent
-            })
-            
-            memory_data.append({
-                "timestamp": timestamp,
-                "value": metric.memory_percent
-            })
-            
-            request_rate_data.append({
-                "timestamp": timestamp,
-                "value": metric.request_count  # Requests per minute
-            })
-        
-        return {
-            "period_hours": hours,
-            "data": {
-                "cpu_usage": cpu_data,
-                "memory_usage": memory_data,
-                "request_rate": request_rate_data
-            }
+    return await _cached(
+        f"charts:system:{hours}",
+        CHARTS_CACHE_TTL,
+        request,
+        lambda: _build_system_charts(hours)
+    )
+
+def _build_system_charts(hours: int) -> Dict[str, Any]:
+    """Format recorded system snapshots into chart series"""
+    now = datetime.utcnow()
+    start_time = now - timedelta(hours=hours)
+    
+    # Snapshots are appended in time order, so the window is found by bisect
+    system_data = metrics_collector.get_system_metrics(start_time)
+    timestamps = [metric.timestamp.isoformat() for metric in system_data]
+    
+    # Format data for charts
+    cpu_data = [
+        {"timestamp": timestamp, "value": metric.cpu_percent}
+        for timestamp, metric in zip(timestamps, system_data)
+    ]
+    memory_data = [
+        {"timestamp": timestamp, "value": metric.memory_percent}
+        for timestamp, metric in zip(timestamps, system_data)
+    ]
+    request_rate_data = [
+        {"timestamp": timestamp, "value": metric.request_count}  # Requests per minute
+        for timestamp, metric in zip(timestamps, system_data)
+    ]
+    
+    return {
+        "period_hours": hours,
+        "data": {
+            "cpu_usage": cpu_data,
+            "memory_usage": memory_data,
+            "request_rate": request_rate_data
         }
-        
-    except Exception as e:
-        logger.error(f"Failed to get system chart data: {e}")
-        raise HTTPException(status_code=500, detail="Failed to retrieve system chart data")
+    }
 
 @router.get("/dashboard/alerts", response_model=Dict[str, Any])
 async def dashboard_alerts(
+    request: Request,
     hours: int = Query(24, ge=1, le=168, description="Hours of alert history"),
     current_user: models.User = Depends(validate_bearer_token)
 ):
     """
     Get alert history and current alert status
     """
-    try:
-        now = datetime.utcnow()
-        
-        # Get current system status
-        health_status = metrics_collector.get_health_status()
-        
-        # Get alert thresholds
-        thresholds = alert_manager.alert_thresholds
-        
-        # Get recent alert history (this would typically come from persistent storage)
-        alert_history = []
-        
-        # Check current conditions against thresholds
-        current_alerts = []
-        
-        # Check error rate
-        error_rate = health_status["metrics"]["error_rate"]
-        if error_rate > thresholds["error_rate"]:
-            current_alerts.append({
-                "type": "high_error_rate",
-                "severity": "critical",
-                "message": f"Error rate {error_rate:.2%} exceeds threshold {thresholds['error_rate']:.2%}",
-                "current_value": error_rate,
-                "threshold": thresholds["error_rate"],
-                "timestamp": now.isoformat()
-            })
-        
-        # Check response time
-        avg_response_time = health_status["metrics"]["avg_response_time"]
-        if avg_response_time and avg_response_time > thresholds["response_time_p95"]:
-            current_alerts.append({
-                "type": "slow_response_time",
-                "severity": "warning",
-                "message": f"Response time {avg_response_time:.3f}s exceeds threshold {thresholds['response_time_p95']}s",
-                "current_value": avg_response_time,
-                "threshold": thresholds["response_time_p95"],
-                "timestamp": now.isoformat()
-            })
-        
-        # Check system resources
-        cpu_percent = health_status["metrics"]["cpu_percent"]
-        if cpu_percent and cpu_percent > thresholds["cpu_percent"]:
-            current_alerts.append({
-                "type": "high_cpu_usage",
-                "severity": "warning",
-                "message": f"CPU usage {cpu_percent:.1f}% exceeds threshold {thresholds['cpu_percent']}%",
-                "current_value": cpu_percent,
-                "threshold": thresholds["cpu_percent"],
-                "timestamp": now.isoformat()
-            })
-        
-        memory_percent = health_status["metrics"]["memory_percent"]
-        if memory_percent and memory_percent > thresholds["memory_percent"]:
+    return await _cached("alerts", ALERTS_CACHE_TTL, request, _build_alerts)
+
+# (metric, alert type, severity, message, threshold key) for each alert check
+ALERT_CHECKS = (
+    ("error_rate", "high_error_rate", "critical",
+     "Error rate {value:.2%} exceeds threshold {threshold:.2%}", "error_rate"),
+    ("avg_response_time", "slow_response_time", "warning",
+     "Response time {value:.3f}s exceeds threshold {threshold}s", "response_time_p95"),
+    ("cpu_percent", "high_cpu_usage", "warning",
+     "CPU usage {value:.1f}% exceeds threshold {threshold}%", "cpu_percent"),
+    ("memory_percent", "high_memory_usage", "critical",
+     "Memory usage {value:.1f}% exceeds threshold {threshold}%", "memory_percent"),
+)
+
+def _build_alerts() -> Dict[str, Any]:
+    """Check current conditions against the alert thresholds"""
+    now = datetime.utcnow()
+    
+    # Get current system status
+    health_status = metrics_collector.get_health_status()
+    
+    # Get alert thresholds
+    thresholds = alert_manager.alert_thresholds
+    
+    # Get recent alert history (this would typically come from persistent storage)
+    alert_history = []
+    
+    # Check current conditions against thresholds; alerts are only built
+    # for checks that trip
+    metrics = health_status.get("metrics", {})
+    timestamp = now.isoformat()
+    current_alerts = []
+    for metric, alert_type, severity, message, threshold_key in ALERT_CHECKS:
+        value = metrics.get(metric)
+        threshold = thresholds[threshold_key]
+        if value is not None and value > threshold:
             current_alerts.append({
-                "type": "high_memory_usage",
-                "severity": "critical",
-                "message": f"Memory usage {memory_percent:.1f}% exceeds threshold {thresholds['memory_percent']}%",
-                "current_value": memory_percent,
-                "threshold": thresholds["memory_percent"],
-                "timestamp": now.isoformat()
+                "type": alert_type,
+                "severity": severity,
+                "message": message.format(value=value, threshold=threshold),
+                "current_value": value,
+                "threshold": threshold,
+                "timestamp": timestamp
             })
-        
-        return {
-            "timestamp": now.isoformat(),
-            "current_alerts": current_alerts,
-            "alert_history": alert_history,
-            "thresholds": thresholds,
-            "alert_summary": {
-                "total_active": len(current_alerts),
-                "critical_count": sum(1 for a in current_alerts if a["severity"] == "critical"),
-                "warning_count": sum(1 for a in current_alerts if a["severity"] == "warning")
-            }
+    
+    critical_count = sum(1 for alert in current_alerts if alert["severity"] == "critical")
+    
+    return {
+        "timestamp": timestamp,
+        "current_alerts": current_alerts,
+        "alert_history": alert_history,
+        "thresholds": thresholds,
+        "alert_summary": {
+            "total_active": len(current_alerts),
+            "critical_count": critical_count,
+            "warning_count": len(current_alerts) - critical_count
         }
-        
-    except Exception as e:
-        logger.error(f"Failed to get alert data: {e}")
-        raise HTTPException(status_code=500, detail="Failed to retrieve alert data")
+    }
 
 @router.get("/dashboard/performance", response_model=Dict[str, Any])
 async def dashboard_performance(
@@ -318,55 +349,40 @@ async def dashboard_performance(
     """
     Get performance analysis data
     """
-    try:
-        # Get performance stats for key operations
-        operations = [
-            "database_query",
-            "authentication", 
-            "shopping_list_create",
-            "shopping_list_update",
-            "user_registration"
-        ]
-        
-        performance_data = {}
-        for operation in operations:
-            stats = performance_profiler.get_operation_stats(operation)
-            if stats["count"] > 0:
-                performance_data[operation] = stats
-        
-        # Get slowest endpoints
-        slow_endpoints = []
-        for endpoint, stats in metrics_collector.endpoint_stats.items():
-            if stats['count'] > 0:
-                avg_time = stats['total_time'] / stats['count']
-                if avg_time > 0.5:  # Endpoints taking more than 500ms on average
-                    slow_endpoints.append({
-                        "endpoint": endpoint,
-                        "avg_response_time": avg_time,
-                        "request_count": stats['count'],
-                        "error_rate": stats['error_count'] / stats['count']
-                    })
-        
-        # Sort by response time
-        slow_endpoints.sort(key=lambda x: x['avg_response_time'], reverse=True)
-        
-        return {
-            "timestamp": datetime.utcnow().isoformat(),
-            "operation_performance": performance_data,
-            "slow_endpoints": slow_endpoints[:10],  # Top 10 slowest
-            "performance_summary": {
-                "total_operations_tracked": len(performance_data),
-                "slowest_operation": max(
-                    performance_data.items(), 
-                    key=lambda x: x[1]["avg"], 
-                    default=(None, {"avg": 0})
-                )[0] if performance_data else None
-            }
+    # Get performance stats for key operations
+    performance_data = performance_profiler.get_many(COMMON_OPERATIONS)
+    
+    # Get the 10 slowest endpoints averaging over 500ms; only those are
+    # turned into response dicts
+    averages = (
+        (endpoint, stats['total_time'] / stats['count'], stats)
+        for endpoint, stats in metrics_collector.snapshot_endpoint_stats()
+        if stats['count'] > 0
+    )
+    slowest = heapq.nlargest(10, (entry for entry in averages if entry[1] > 0.5), key=itemgetter(1))
+    slow_endpoints = [
+        {
+            "endpoint": endpoint,
+            "avg_response_time": avg_time,
+            "request_count": stats['count'],
+            "error_rate": stats['error_count'] / stats['count']
+        }
+        for endpoint, avg_time, stats in slowest
+    ]
+    
+    return {
+        "timestamp": datetime.utcnow().isoformat(),
+        "operation_performance": performance_data,
+        "slow_endpoints": slow_endpoints,
+        "response_cache": dict(cache_stats),
+        "performance_summary": {
+            "total_operations_tracked": len(performance_data),
+            "slowest_operation": max(
+                performance_data,
+                key=lambda operation: performance_data[operation]["avg"]
+            ) if performance_data else None
         }
-        
-    except Exception as e:
-        logger.error(f"Failed to get performance data: {e}")
-        raise HTTPException(status_code=500, detail="Failed to retrieve performance data")
+    }
 
 @router.post("/dashboard/alerts/acknowledge", response_model=Dict[str, Any])
 async def acknowledge_alert(
@@ -376,27 +392,22 @@ async def acknowledge_alert(
     """
     Acknowledge an alert (mark as seen)
     """
-    try:
-        # In a real implementation, this would update persistent storage
-        # For now, we'll just log the acknowledgment
-        
-        logger.info(
-            f"Alert acknowledged by user {current_user.id}",
-            extra={
-                "alert_type": alert_type,
-                "user_id": current_user.id,
-                "username": current_user.username,
-                "timestamp": datetime.utcnow().isoformat()
-            }
-        )
-        
-        return {
-            "status": "acknowledged",
+    # In a real implementation, this would update persistent storage
+    # For now, we'll just log the acknowledgment
+    
+    logger.info(
+        f"Alert acknowledged by user {current_user.id}",
+        extra={
             "alert_type": alert_type,
-            "acknowledged_by": current_user.username,
+            "user_id": current_user.id,
+            "username": current_user.username,
             "timestamp": datetime.utcnow().isoformat()
         }
-        
-    except Exception as e:
-        logger.error(f"Failed to acknowledge alert: {e}")
-        raise HTTPException(status_code=500, detail="Failed to acknowledge alert")
\ No newline at end of file
+    )
+    
+    return {
+        "status": "acknowledged",
+        "alert_type": alert_type,
+        "acknowledged_by": current_user.username,
+        "timestamp": datetime.utcnow().isoformat()
+    }
\ No newline at end of file
@@ -1,24 +1,42 @@
-from sqlalchemy import create_engine, event, pool
+from sqlalchemy import create_engine, event, pool, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import QueuePool, NullPool
 from sqlalchemy.engine import Engine
+from sqlalchemy.sql.elements import TextClause
 from contextlib import contextmanager
 import logging
 import time
-from typing import Generator
+from typing import Generator, AsyncGenerator, Union
 import psycopg2
 
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+# Statements run on every health check; built once so SQLAlchemy's compiled
+# cache is reused instead of wrapping a new string each call
+HEALTH_CHECK_SQL = text("SELECT 1 as health_check")
+DATABASE_INFO_SQL = text("""
+    SELECT 
+        version() as version,
+        current_database() as database_name,
+        current_user as current_user,
+        inet_server_addr() as server_address,
+        inet_server_port() as server_port
+""")
+
 class DatabaseManager:
     """Enhanced database manager with connection pooling and monitoring"""
     
     def __init__(self):
         self.engine = None
         self.SessionLocal = None
+        self.async_engine = None
+        self.AsyncSessionLocal = None
         self._setup_engine()
+        self._setup_async_engine()
         self._setup_event_listeners()
     
     def _setup_engine(self):
@@ -31,8 +49,11 @@ class DatabaseManager:
             "connect_timeout": settings.connect_timeout,
             "sslmode": ssl_mode,
             "application_name": settings.application_name,
+            # Session settings travel in the startup packet, so new
+            # connections need no extra SET round trips
             "options": f"-c statement_timeout={settings.statement_timeout}ms "
-                      f"-c idle_in_transaction_session_timeout={settings.idle_in_transaction_session_timeout}ms"
+                      f"-c idle_in_transaction_session_timeout={settings.idle_in_transaction_session_timeout}ms "
+                      f"-c timezone=UTC"
         }
         
         # Choose pool class based on environment
@@ -49,6 +70,9 @@ class DatabaseManager:
             "echo_pool": settings.debug,
             "future": True,  # Use SQLAlchemy 2.0 style
             "connect_args": connect_args,
+            # Compiled SQL is cached per engine; sized for every distinct
+            # filter/sort combination the routes can build
+            "query_cache_size": settings.query_cache_size,
         }
         
         # Add pool settings only for QueuePool
@@ -69,8 +93,7 @@ class DatabaseManager:
             
             # Test connection
             with self.engine.connect() as conn:
-                from sqlalchemy import text
-                conn.execute(text("SELECT 1"))
+                conn.execute(HEALTH_CHECK_SQL)
                 logger.info("Database connection established successfully")
             
             # Setup session factory
@@ -85,21 +108,58 @@ class DatabaseManager:
             logger.error(f"Failed to create database engine: {e}")
             raise
     
+    def _setup_async_engine(self):
+        """Setup the asyncpg-backed engine used by async endpoints
+        
+        Mirrors the sync engine's pool and session settings, with its own
+        pool budget (DB_ASYNC_POOL_SIZE / DB_ASYNC_MAX_OVERFLOW) since its
+        connections add to the sync pool's. The engine connects lazily, so no
+        connection is opened here.
+        """
+        import os
+        ssl_mode = os.getenv('DB_SSL_MODE', 'require')
+        connect_args = {
+            "timeout": settings.connect_timeout,
+            "ssl": ssl_mode,
+            # asyncpg prepares every statement server-side; caching them per
+            # connection skips parse/plan on repeat queries. Set to 0 behind
+            # PgBouncer in transaction pooling mode.
+            "prepared_statement_cache_size": settings.prepared_statement_cache_size,
+            "server_settings": {
+                "application_name": settings.application_name,
+                "timezone": "UTC",
+                "statement_timeout": str(settings.statement_timeout),
+                "idle_in_transaction_session_timeout": str(settings.idle_in_transaction_session_timeout),
+            },
+        }
+        
+        engine_kwargs = {
+            "echo": settings.debug and settings.log_level == 'DEBUG',
+            "connect_args": connect_args,
+            "query_cache_size": settings.query_cache_size,
+        }
+        if self.engine.pool.__class__ is NullPool:
+            engine_kwargs["poolclass"] = NullPool
+        else:
+            engine_kwargs.update({
+                "pool_size": settings.async_pool_size,
+                "max_overflow": settings.async_max_overflow,
+                "pool_timeout": settings.pool_timeout,
+                "pool_recycle": settings.pool_recycle,
+                "pool_pre_ping": settings.pool_pre_ping,
+            })
+        
+        async_url = make_url(settings.database_url).set(drivername='postgresql+asyncpg')
+        self.async_engine = create_async_engine(async_url, **engine_kwargs)
+        self.AsyncSessionLocal = async_sessionmaker(
+            self.async_engine,
+            autoflush=False,
+            expire_on_commit=False
+        )
+    
     def _setup_event_listeners(self):
         """Setup SQLAlchemy event listeners for monitoring and optimization"""
         
-        @event.listens_for(Engine, "connect")
-        def set_sqlite_pragma(dbapi_connection, connection_record):
-            """Set PostgreSQL-specific connection parameters"""
-            if hasattr(dbapi_connection, 'cursor'):
-                cursor = dbapi_connection.cursor()
-                # Set connection-level parameters for better performance
-                cursor.execute("SET timezone = 'UTC'")
-                cursor.execute("SET statement_timeout = %s", (settings.statement_timeout,))
-                cursor.execute("SET idle_in_transaction_session_timeout = %s", 
-                             (settings.idle_in_transaction_session_timeout,))
-                cursor.close()
-        
         @event.listens_for(Engine, "checkout")
         def receive_checkout(dbapi_connection, connection_record, connection_proxy):
             """Log connection checkout for monitoring"""
@@ -121,6 +181,12 @@ class DatabaseManager:
             raise RuntimeError("Database not initialized")
         return self.SessionLocal()
     
+    def get_async_session(self):
+        """Get async database session"""
+        if not self.AsyncSessionLocal:
+            raise RuntimeError("Database not initialized")
+        return self.AsyncSessionLocal()
+    
     def health_check(self) -> dict:
         """Perform database health check"""
         try:
@@ -128,35 +194,62 @@ class DatabaseManager:
             
             with self.engine.connect() as conn:
                 # Test basic connectivity
-                from sqlalchemy import text
-                result = conn.execute(text("SELECT 1 as health_check"))
+                result = conn.execute(HEALTH_CHECK_SQL)
                 result.fetchone()
                 
-                # Get connection pool status
-                pool_status = {
-                    "pool_size": self.engine.pool.size() if hasattr(self.engine.pool, 'size') else 'N/A',
-                    "checked_in": self.engine.pool.checkedin() if hasattr(self.engine.pool, 'checkedin') else 'N/A',
-                    "checked_out": self.engine.pool.checkedout() if hasattr(self.engine.pool, 'checkedout') else 'N/A',
-                    "overflow": self.engine.pool.overflow() if hasattr(self.engine.pool, 'overflow') else 'N/A',
-                }
-                
                 response_time = (time.time() - start_time) * 1000  # Convert to milliseconds
+                return self._healthy_status(self.engine.pool, response_time)
                 
-                return {
-                    "status": "healthy",
-                    "response_time_ms": round(response_time, 2),
-                    "pool_status": pool_status,
-                    "database_url": settings.database_url.split('@')[1] if '@' in settings.database_url else 'hidden'
-                }
+        except Exception as e:
+            logger.error(f"Database health check failed: {e}")
+            return self._unhealthy_status(e)
+    
+    async def async_health_check(self) -> dict:
+        """Perform database health check on the async engine
+        
+        Used by async endpoints so the check does not block the event loop.
+        """
+        try:
+            start_time = time.time()
+            
+            async with self.async_engine.connect() as conn:
+                # Test basic connectivity
+                result = await conn.execute(HEALTH_CHECK_SQL)
+                result.fetchone()
+                
+                response_time = (time.time() - start_time) * 1000  # Convert to milliseconds
+                return self._healthy_status(self.async_engine.pool, response_time)
                 
         except Exception as e:
             logger.error(f"Database health check failed: {e}")
-            return {
-                "status": "unhealthy",
-                "error": str(e),
-                "response_time_ms": None,
-                "pool_status": None
-            }
+            return self._unhealthy_status(e)
+    
+    @staticmethod
+    def _healthy_status(engine_pool, response_time: float) -> dict:
+        """Health check result with connection pool status"""
+        pool_status = {
+            "pool_size": engine_pool.size() if hasattr(engine_pool, 'size') else 'N/A',
+            "checked_in": engine_pool.checkedin() if hasattr(engine_pool, 'checkedin') else 'N/A',
+            "checked_out": engine_pool.checkedout() if hasattr(engine_pool, 'checkedout') else 'N/A',
+            "overflow": engine_pool.overflow() if hasattr(engine_pool, 'overflow') else 'N/A',
+        }
+        
+        return {
+            "status": "healthy",
+            "response_time_ms": round(response_time, 2),
+            "pool_status": pool_status,
+            "database_url": settings.database_url.split('@')[1] if '@' in settings.database_url else 'hidden'
+        }
+    
+    @staticmethod
+    def _unhealthy_status(error: Exception) -> dict:
+        """Health check result for a failed check"""
+        return {
+            "status": "unhealthy",
+            "error": str(error),
+            "response_time_ms": None,
+            "pool_status": None
+        }
     
     def get_pool_status(self) -> dict:
         """Get detailed connection pool status"""
@@ -171,11 +264,13 @@ class DatabaseManager:
             "total_connections": self.engine.pool.size() + self.engine.pool.overflow(),
         }
     
-    def close(self):
-        """Close database connections"""
+    async def close(self):
+        """Close database connections of both engines"""
+        if self.async_engine:
+            await self.async_engine.dispose()
         if self.engine:
             self.engine.dispose()
-            logger.info("Database connections closed")
+        logger.info("Database connections closed")
 
 # Global database manager instance
 db_manager = DatabaseManager()
@@ -191,15 +286,28 @@ def get_db() -> Generator:
     Yields:
         Session: SQLAlchemy database session
     """
-    db = db_manager.get_session()
-    try:
-        yield db
-    except Exception as e:
-        logger.error(f"Database session error: {e}")
-        db.rollback()
-        raise
-    finally:
-        db.close()
+    with db_manager.get_session() as db:
+        try:
+            yield db
+        except Exception as e:
+            logger.error(f"Database session error: {e}")
+            db.rollback()
+            raise
+
+async def get_async_db() -> AsyncGenerator:
+    """
+    Dependency function to get an async database session
+    
+    Yields:
+        AsyncSession: SQLAlchemy async database session (asyncpg)
+    """
+    async with db_manager.get_async_session() as db:
+        try:
+            yield db
+        except Exception as e:
+            logger.error(f"Database session error: {e}")
+            await db.rollback()
+            raise
 
 @contextmanager
 def get_db_context():
@@ -211,45 +319,78 @@ def get_db_context():
             # Use db session
             pass
     """
-    db = db_manager.get_session()
+    # Session.begin() commits on success, rolls back on error and closes
     try:
-        yield db
-        db.commit()
+        with db_manager.SessionLocal.begin() as db:
+            yield db
     except Exception as e:
         logger.error(f"Database transaction error: {e}")
-        db.rollback()
         raise
-    finally:
-        db.close()
+
+@contextmanager
+def read_tx():
+    """
+    Context manager for read-only raw SQL outside the ORM
+    
+    Yields an autocommit connection, so no transaction is opened, committed
+    or left idle in transaction.
+    
+    Usage:
+        with read_tx() as conn:
+            conn.execute(SOME_TEXT_CLAUSE)
+    """
+    with db_manager.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        yield conn
 
 # Database utility functions
-def execute_raw_sql(sql: str, params: dict = None) -> list:
-    """Execute raw SQL query safely"""
+def execute_raw_sql(sql: Union[str, TextClause], params: dict = None) -> list:
+    """Execute raw SQL query safely
+    
+    Pass a module-level text() clause for statements that run repeatedly so
+    the compiled form is cached; plain strings are wrapped on each call.
+    """
+    if isinstance(sql, str):
+        sql = text(sql)
     with get_db_context() as db:
         result = db.execute(sql, params or {})
         return result.fetchall()
 
+async def execute_raw_sql_async(sql: Union[str, TextClause], params: dict = None) -> list:
+    """Execute raw SQL query on the async engine
+    
+    Read-only counterpart of execute_raw_sql for async endpoints.
+    """
+    if isinstance(sql, str):
+        sql = text(sql)
+    async with db_manager.get_async_session() as db:
+        result = await db.execute(sql, params or {})
+        return result.fetchall()
+
+def _database_info(row) -> dict:
+    """Map a DATABASE_INFO_SQL row to the server information dict"""
+    return {
+        "version": row[0] if row else None,
+        "database_name": row[1] if row else None,
+        "current_user": row[2] if row else None,
+        "server_address": row[3] if row else None,
+        "server_port": row[4] if row else None,
+    }
+
 def get_database_info() -> dict:
     """Get database server information"""
     try:
-        with get_db_context() as db:
-            result = db.execute("""
-                SELECT 
-                    version() as version,
-                    current_database() as database_name,
-                    current_user as current_user,
-                    inet_server_addr() as server_address,
-                    inet_server_port() as server_port
-            """)
-            row = result.fetchone()
-            
-            return {
-                "version": row[0] if row else None,
-                "database_name": row[1] if row else None,
-                "current_user": row[2] if row else None,
-                "server_address": row[3] if row else None,
-                "server_port": row[4] if row else None,
-            }
+        with read_tx() as conn:
+            result = conn.execute(DATABASE_INFO_SQL)
+            return _database_info(result.fetchone())
+    except Exception as e:
+        logger.error(f"Failed to get database info: {e}")
+        return {"error": str(e)}
+
+async def get_database_info_async() -> dict:
+    """Get database server information without blocking the event loop"""
+    try:
+        rows = await execute_raw_sql_async(DATABASE_INFO_SQL)
+        return _database_info(rows[0] if rows else None)
     except Exception as e:
         logger.error(f"Failed to get database info: {e}")
         return {"error": str(e)}
\ No newline at end of file
@@ -1,223 +1,307 @@
-from fastapi import Request, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi import Request, HTTPException
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
-from pydantic import ValidationError
 from datetime import datetime
 import logging
-import traceback
-import uuid
-from typing import Dict, Any
+import time
+from os import urandom
+from typing import Dict, Any, Optional
 
-from .exceptions import (
-    APIException,
-    DatabaseException,
-    ValidationException,
-    ConflictException
-)
+from .monitoring import current_request_id
+from .exceptions import APIException, ValidationException, DatabaseException
 
 logger = logging.getLogger(__name__)
 
+# Shared context for errors that carry none; responses only serialize it
+_EMPTY_CONTEXT: Dict[str, Any] = {}
+
+# (error_type, error_code) for common HTTP status codes
+HTTP_ERROR_META = {
+    400: ("bad_request", "BAD_REQUEST"),
+    401: ("authentication", "UNAUTHORIZED"),
+    403: ("authorization", "FORBIDDEN"),
+    404: ("not_found", "NOT_FOUND"),
+    405: ("method_not_allowed", "METHOD_NOT_ALLOWED"),
+    409: ("conflict", "CONFLICT"),
+    422: ("validation", "UNPROCESSABLE_ENTITY"),
+    429: ("rate_limit", "TOO_MANY_REQUESTS"),
+    500: ("internal_server_error", "INTERNAL_SERVER_ERROR"),
+    502: ("bad_gateway", "BAD_GATEWAY"),
+    503: ("service_unavailable", "SERVICE_UNAVAILABLE")
+}
+DEFAULT_HTTP_ERROR_META = ("http", "HTTP_ERROR")
+
+# (PostgreSQL SQLSTATE, SQLite message, error_detail, error_code) for
+# integrity violations, checked in order
+INTEGRITY_ERROR_RULES = (
+    ("23505", "UNIQUE constraint failed", "Duplicate value detected", "DUPLICATE_VALUE"),
+    ("23503", "FOREIGN KEY constraint failed", "Referenced resource not found", "FOREIGN_KEY_ERROR"),
+    ("23502", "NOT NULL constraint failed", "Required field is missing", "REQUIRED_FIELD_MISSING"),
+)
+
+# Bounds on error context size, so one oversized context cannot make the
+# response and its log record expensive to serialize
+MAX_CONTEXT_ITEMS = 64
+MAX_CONTEXT_STRING = 4096
+
+def _cap_context(context: Dict[str, Any]) -> Dict[str, Any]:
+    """Truncate long lists and strings one level deep; unchanged if within bounds"""
+    capped = None
+    for key, value in context.items():
+        if isinstance(value, str) and len(value) > MAX_CONTEXT_STRING:
+            value = value[:MAX_CONTEXT_STRING]
+        elif isinstance(value, (list, tuple)) and len(value) > MAX_CONTEXT_ITEMS:
+            value = value[:MAX_CONTEXT_ITEMS]
+        else:
+            continue
+        if capped is None:
+            capped = dict(context)
+        capped[key] = value
+    
+    if len(context) > MAX_CONTEXT_ITEMS:
+        capped = dict(list((capped or context).items())[:MAX_CONTEXT_ITEMS])
+    if capped is None:
+        return context
+    capped["_truncated"] = True
+    return capped
+
+# (epoch second, ISO string) of the last error timestamp; errors in the same
+# second share one formatted string
+_timestamp_cache = (0, "")
+
+def _error_timestamp() -> str:
+    """Current UTC time in ISO format, at second granularity"""
+    global _timestamp_cache
+    now = int(time.time())
+    cached_second, formatted = _timestamp_cache
+    if now != cached_second:
+        formatted = datetime.utcfromtimestamp(now).isoformat()
+        _timestamp_cache = (now, formatted)
+    return formatted
+
+def _request_id(request: Request) -> Optional[str]:
+    """Id bound to the request by MonitoringMiddleware, if it ran"""
+    return getattr(request.state, "request_id", None)
+
 def create_error_response(
     error_detail: str,
     error_code: str = "UNKNOWN_ERROR",
     error_type: str = "unknown",
     status_code: int = 500,
     context: Dict[str, Any] = None,
-    request: Request = None
+    path: Optional[str] = None,
+    method: Optional[str] = None,
+    request_id: Optional[str] = None
 ) -> Dict[str, Any]:
-    """Create standardized error response"""
+    """Create standardized error response
     
-    request_id = str(uuid.uuid4())
+    Handlers read path, method and request id from the request once and pass
+    them in.
+    """
     
-    error_response = {
-        "error": {
-            "message": error_detail,
-            "error_code": error_code,
-            "error_type": error_type,
-            "context": context or {},
-            "timestamp": datetime.utcnow().isoformat(),
-            "request_id": request_id
-        }
-    }
+    # Opaque 128-bit id; hex of raw random bytes skips building a UUID object
+    request_id = request_id or current_request_id.get() or urandom(16).hex()
+    if context:
+        context = _cap_context(context)
     
-    if request:
-        error_response["error"]["path"] = str(request.url.path)
-        error_response["error"]["method"] = request.method
+    error = {
+        "message": error_detail,
+        "error_code": error_code,
+        "error_type": error_type,
+        "context": context or _EMPTY_CONTEXT,
+        "timestamp": _error_timestamp(),
+        "request_id": request_id
+    }
+    if path is not None:
+        error["path"] = path
+        error["method"] = method
     
-    # Log error for monitoring
-    logger.error(
-        f"API Error: {error_code} - {error_detail}",
-        extra={
-            "request_id": request_id,
-            "error_code": error_code,
-            "error_type": error_type,
-            "status_code": status_code,
-            "context": context,
-            "path": str(request.url.path) if request else None,
-            "method": request.method if request else None
-        }
-    )
+    # Log error for monitoring; the message and extra are only built when
+    # a handler will receive the record
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error(
+            "API Error: %s - %s",
+            error_code,
+            error_detail,
+            extra={
+                "request_id": request_id,
+                "error_code": error_code,
+                "error_type": error_type,
+                "status_code": status_code,
+                "context": context,
+                "path": path,
+                "method": method
+            }
+        )
     
-    return error_response
+    return {"error": error}
 
-async def api_exception_handler(request: Request, exc: APIException) -> JSONResponse:
+# The handlers stay ``async def`` even though none of them awaits: Starlette
+# dispatches sync exception handlers through run_in_threadpool, which costs
+# far more than awaiting a coroutine that returns immediately.
+
+async def api_exception_handler(request: Request, exc: APIException) -> ORJSONResponse:
     """Handle custom API exceptions"""
     
+    path = request.url.path
+    method = request.method
+    
     error_response = create_error_response(
         error_detail=exc.detail,
         error_code=exc.error_code or "API_ERROR",
         error_type=exc.error_type or "api",
         status_code=exc.status_code,
         context=exc.context,
-        request=request
+        path=path,
+        method=method,
+        request_id=_request_id(request)
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=error_response,
         headers=exc.headers
     )
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> ORJSONResponse:
     """Handle standard HTTP exceptions"""
     
-    # Map common HTTP status codes to error types
-    error_type_map = {
-        400: "bad_request",
-        401: "authentication",
-        403: "authorization",
-        404: "not_found",
-        405: "method_not_allowed",
-        409: "conflict",
-        422: "validation",
-        429: "rate_limit",
-        500: "internal_server_error",
-        502: "bad_gateway",
-        503: "service_unavailable"
-    }
+    path = request.url.path
+    method = request.method
     
-    error_code_map = {
-        400: "BAD_REQUEST",
-        401: "UNAUTHORIZED",
-        403: "FORBIDDEN",
-        404: "NOT_FOUND",
-        405: "METHOD_NOT_ALLOWED",
-        409: "CONFLICT",
-        422: "UNPROCESSABLE_ENTITY",
-        429: "TOO_MANY_REQUESTS",
-        500: "INTERNAL_SERVER_ERROR",
-        502: "BAD_GATEWAY",
-        503: "SERVICE_UNAVAILABLE"
-    }
+    error_type, error_code = HTTP_ERROR_META.get(exc.status_code, DEFAULT_HTTP_ERROR_META)
     
     error_response = create_error_response(
         error_detail=exc.detail,
-        error_code=error_code_map.get(exc.status_code, "HTTP_ERROR"),
-        error_type=error_type_map.get(exc.status_code, "http"),
+        error_code=error_code,
+        error_type=error_type,
         status_code=exc.status_code,
-        request=request
+        path=path,
+        method=method,
+        request_id=_request_id(request)
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=error_response,
         headers=exc.headers
     )
 
-async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> ORJSONResponse:
     """Handle Pydantic validation errors"""
     
+    path = request.url.path
+    method = request.method
+    
     # Extract validation error details
-    validation_errors = []
-    for error in exc.errors():
-        field_path = " -> ".join(str(loc) for loc in error["loc"])
-        validation_errors.append({
-            "field": field_path,
+    validation_errors = [
+        {
+            "field": " -> ".join(map(str, error["loc"])),
             "message": error["msg"],
             "type": error["type"],
             "input": error.get("input")
-        })
+        }
+        for error in exc.errors()
+    ]
     
     error_response = create_error_response(
         error_detail="Validation failed",
-        error_code="VALIDATION_ERROR",
-        error_type="validation",
+        error_code=ValidationException.ERROR_CODE,
+        error_type=ValidationException.ERROR_TYPE,
         status_code=422,
         context={"validation_errors": validation_errors},
-        request=request
+        path=path,
+        method=method,
+        request_id=_request_id(request)
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content=error_response
     )
 
-async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError) -> JSONResponse:
-    """Handle SQLAlchemy database errors"""
-    
-    error_detail = "Database operation failed"
-    error_code = "DATABASE_ERROR"
-    context = {}
+def _database_error_response(request: Request, exc: SQLAlchemyError, error_detail: str, error_code: str) -> ORJSONResponse:
+    """Log a database error and build its 500 response"""
     
-    # Handle specific SQLAlchemy exceptions
-    if isinstance(exc, IntegrityError):
-        error_detail = "Data integrity constraint violation"
-        error_code = "INTEGRITY_ERROR"
-        
-        # Extract constraint information if available
-        if hasattr(exc, 'orig') and exc.orig:
-            orig_error = str(exc.orig)
-            if "UNIQUE constraint failed" in orig_error:
-                error_detail = "Duplicate value detected"
-                error_code = "DUPLICATE_VALUE"
-            elif "FOREIGN KEY constraint failed" in orig_error:
-                error_detail = "Referenced resource not found"
-                error_code = "FOREIGN_KEY_ERROR"
-            elif "NOT NULL constraint failed" in orig_error:
-                error_detail = "Required field is missing"
-                error_code = "REQUIRED_FIELD_MISSING"
+    path = request.url.path
+    method = request.method
     
     # Log the full exception for debugging
-    logger.error(
-        f"Database error: {error_code}",
-        exc_info=True,
-        extra={
-            "error_code": error_code,
-            "exception_type": type(exc).__name__,
-            "path": str(request.url.path),
-            "method": request.method
-        }
-    )
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error(
+            "Database error: %s",
+            error_code,
+            exc_info=True,
+            extra={
+                "error_code": error_code,
+                "exception_type": type(exc).__name__,
+                "path": path,
+                "method": method
+            }
+        )
     
     error_response = create_error_response(
         error_detail=error_detail,
         error_code=error_code,
-        error_type="database",
+        error_type=DatabaseException.ERROR_TYPE,
         status_code=500,
-        context=context,
-        request=request
+        context={},
+        path=path,
+        method=method,
+        request_id=_request_id(request)
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content=error_response
     )
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def integrity_error_handler(request: Request, exc: IntegrityError) -> ORJSONResponse:
+    """Handle database integrity constraint violations"""
+    
+    error_detail = "Data integrity constraint violation"
+    error_code = "INTEGRITY_ERROR"
+    
+    # Extract constraint information if available
+    orig = getattr(exc, 'orig', None)
+    if orig:
+        # PostgreSQL drivers expose the SQLSTATE; fall back to SQLite's message
+        sqlstate = getattr(orig, 'pgcode', None) or getattr(orig, 'sqlstate', None)
+        orig_error = str(orig)
+        for rule_sqlstate, needle, detail, code in INTEGRITY_ERROR_RULES:
+            if sqlstate == rule_sqlstate or needle in orig_error:
+                error_detail, error_code = detail, code
+                break
+    
+    return _database_error_response(request, exc, error_detail, error_code)
+
+async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError) -> ORJSONResponse:
+    """Handle SQLAlchemy database errors (IntegrityError has its own handler)"""
+    
+    return _database_error_response(request, exc, "Database operation failed", DatabaseException.ERROR_CODE)
+
+async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handle unexpected exceptions"""
     
+    path = request.url.path
+    method = request.method
+    request_id = _request_id(request)
+    
     # Log the full exception with traceback
-    logger.error(
-        f"Unexpected error: {type(exc).__name__}: {str(exc)}",
-        exc_info=True,
-        extra={
-            "exception_type": type(exc).__name__,
-            "path": str(request.url.path),
-            "method": request.method,
-            "traceback": traceback.format_exc()
-        }
-    )
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error(
+            "Unexpected error: %s: %s",
+            type(exc).__name__,
+            exc,
+            exc_info=True,
+            extra={
+                "exception_type": type(exc).__name__,
+                "path": path,
+                "method": method,
+                "request_id": request_id
+            }
+        )
     
     # Don't expose internal error details in production
     error_detail = "An unexpected error occurred"
@@ -227,126 +311,72 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
         error_code="INTERNAL_SERVER_ERROR",
         error_type="internal",
         status_code=500,
-        request=request
+        path=path,
+        method=method,
+        request_id=request_id
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content=error_response
     )
 
 # Error response schemas for OpenAPI documentation
-ERROR_RESPONSES = {
-    400: {
-        "description": "Bad Request",
+def _error_response_doc(description: str, message: str, error_code: str, error_type: str,
+                        context: Optional[Dict[str, Any]] = None, **extra) -> Dict[str, Any]:
+    """OpenAPI response entry with an example of the standard error body"""
+    return {
+        "description": description,
         "content": {
             "application/json": {
                 "example": {
                     "error": {
-                        "message": "Invalid request parameters",
-                        "error_code": "BAD_REQUEST",
-                        "error_type": "bad_request",
-                        "context": {},
+                        "message": message,
+                        "error_code": error_code,
+                        "error_type": error_type,
+                        "context": context or {},
                         "timestamp": "2024-01-01T12:00:00.000Z",
                         "request_id": "123e4567-e89b-12d3-a456-426614174000",
-                        "path": "/api/v1/shopping-lists/",
-                        "method": "GET"
-                    }
-                }
-            }
-        }
-    },
-    401: {
-        "description": "Unauthorized",
-        "content": {
-            "application/json": {
-                "example": {
-                    "error": {
-                        "message": "Authentication failed",
-                        "error_code": "UNAUTHORIZED",
-                        "error_type": "authentication",
-                        "context": {},
-                        "timestamp": "2024-01-01T12:00:00.000Z",
-                        "request_id": "123e4567-e89b-12d3-a456-426614174000"
-                    }
-                }
-            }
-        }
-    },
-    403: {
-        "description": "Forbidden",
-        "content": {
-            "application/json": {
-                "example": {
-                    "error": {
-                        "message": "Access denied",
-                        "error_code": "FORBIDDEN",
-                        "error_type": "authorization",
-                        "context": {"resource": "Kitchen", "action": "access"},
-                        "timestamp": "2024-01-01T12:00:00.000Z",
-                        "request_id": "123e4567-e89b-12d3-a456-426614174000"
-                    }
-                }
-            }
-        }
-    },
-    404: {
-        "description": "Not Found",
-        "content": {
-            "application/json": {
-                "example": {
-                    "error": {
-                        "message": "Resource not found",
-                        "error_code": "NOT_FOUND",
-                        "error_type": "not_found",
-                        "context": {"resource": "ShoppingList", "identifier": 123},
-                        "timestamp": "2024-01-01T12:00:00.000Z",
-                        "request_id": "123e4567-e89b-12d3-a456-426614174000"
+                        **extra
                     }
                 }
             }
         }
-    },
-    422: {
-        "description": "Validation Error",
-        "content": {
-            "application/json": {
-                "example": {
-                    "error": {
-                        "message": "Validation failed",
-                        "error_code": "VALIDATION_ERROR",
-                        "error_type": "validation",
-                        "context": {
-                            "validation_errors": [
-                                {
-                                    "field": "name",
-                                    "message": "field required",
-                                    "type": "value_error.missing"
-                                }
-                            ]
-                        },
-                        "timestamp": "2024-01-01T12:00:00.000Z",
-                        "request_id": "123e4567-e89b-12d3-a456-426614174000"
-                    }
-                }
-            }
-        }
-    },
-    500: {
-        "description": "Internal Server Error",
-        "content": {
-            "application/json": {
-                "example": {
-                    "error": {
-                        "message": "An unexpected error occurred",
-                        "error_code": "INTERNAL_SERVER_ERROR",
-                        "error_type": "internal",
-                        "context": {},
-                        "timestamp": "2024-01-01T12:00:00.000Z",
-                        "request_id": "123e4567-e89b-12d3-a456-426614174000"
-                    }
+    }
+
+# Built once and shared by reference: routers pick entries with
+# error_responses() rather than declaring their own response literals
+ERROR_RESPONSES = {
+    400: _error_response_doc(
+        "Bad Request", "Invalid request parameters", "BAD_REQUEST", "bad_request",
+        path="/api/v1/shopping-lists/", method="GET"
+    ),
+    401: _error_response_doc("Unauthorized", "Authentication failed", "UNAUTHORIZED", "authentication"),
+    403: _error_response_doc(
+        "Forbidden", "Access denied", "FORBIDDEN", "authorization",
+        {"resource": "Kitchen", "action": "access"}
+    ),
+    404: _error_response_doc(
+        "Not Found", "Resource not found", "NOT_FOUND", "not_found",
+        {"resource": "ShoppingList", "identifier": 123}
+    ),
+    422: _error_response_doc(
+        "Validation Error", "Validation failed", ValidationException.ERROR_CODE, ValidationException.ERROR_TYPE,
+        {
+            "validation_errors": [
+                {
+                    "field": "name",
+                    "message": "field required",
+                    "type": "value_error.missing"
                 }
-            }
+            ]
         }
-    }
-}
\ No newline at end of file
+    ),
+    500: _error_response_doc(
+        "Internal Server Error", "An unexpected error occurred", "INTERNAL_SERVER_ERROR", "internal"
+    )
+}
+
+def error_responses(*status_codes: int) -> Dict[int, Dict[str, Any]]:
+    """Subset of ERROR_RESPONSES for a router's ``responses=`` argument"""
+    return {code: ERROR_RESPONSES[code] for code in status_codes}
\ No newline at end of file
@@ -4,6 +4,15 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Shared by every authentication failure; responses copy headers, never mutate them
+_BEARER_HEADERS = {"WWW-Authenticate": "Bearer"}
+
+def _merge_context(base: Dict[str, Any], context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Fold caller-supplied context into an exception's own context dict"""
+    if context:
+        base.update(context)
+    return base
+
 class APIException(HTTPException):
     """Base API exception with enhanced error details"""
     
@@ -19,11 +28,15 @@ class APIException(HTTPException):
         super().__init__(status_code=status_code, detail=detail, headers=headers)
         self.error_code = error_code
         self.error_type = error_type
-        self.context = context or {}
+        self.context = context if context is not None else {}
 
 class ValidationException(APIException):
     """Validation error with field-specific details"""
     
+    STATUS_CODE = status.HTTP_422_UNPROCESSABLE_ENTITY
+    ERROR_CODE = "VALIDATION_ERROR"
+    ERROR_TYPE = "validation"
+    
     def __init__(
         self,
         detail: str,
@@ -32,20 +45,22 @@ class ValidationException(APIException):
         context: Optional[Dict[str, Any]] = None
     ):
         super().__init__(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            status_code=self.STATUS_CODE,
             detail=detail,
-            error_code="VALIDATION_ERROR",
-            error_type="validation",
-            context={
+            error_code=self.ERROR_CODE,
+            error_type=self.ERROR_TYPE,
+            context=_merge_context({
                 "field": field,
-                "value": value,
-                **(context or {})
-            }
+                "value": value
+            }, context)
         )
 
 class AuthenticationException(APIException):
     """Authentication-related errors"""
     
+    STATUS_CODE = status.HTTP_401_UNAUTHORIZED
+    ERROR_TYPE = "authentication"
+    
     def __init__(
         self,
         detail: str = "Authentication failed",
@@ -53,17 +68,20 @@ class AuthenticationException(APIException):
         context: Optional[Dict[str, Any]] = None
     ):
         super().__init__(
-            status_code=status.HTTP_401_UNAUTHORIZED,
+            status_code=self.STATUS_CODE,
             detail=detail,
             error_code=error_code,
-            error_type="authentication",
+            error_type=self.ERROR_TYPE,
             context=context,
-            headers={"WWW-Authenticate": "Bearer"}
+            headers=_BEARER_HEADERS
         )
 
 class AuthorizationException(APIException):
     """Authorization/permission errors"""
     
+    STATUS_CODE = status.HTTP_403_FORBIDDEN
+    ERROR_TYPE = "authorization"
+    
     def __init__(
         self,
         detail: str = "Access denied",
@@ -73,20 +91,23 @@ class AuthorizationException(APIException):
         context: Optional[Dict[str, Any]] = None
     ):
         super().__init__(
-            status_code=status.HTTP_403_FORBIDDEN,
+            status_code=self.STATUS_CODE,
             detail=detail,
             error_code=error_code,
-            error_type="authorization",
-            context={
+            error_type=self.ERROR_TYPE,
+            context=_merge_context({
                 "resource": resource,
-                "action": action,
-                **(context or {})
-            }
+                "action": action
+            }, context)
         )
 
 class ResourceNotFoundException(APIException):
     """Resource not found errors"""
     
+    STATUS_CODE = status.HTTP_404_NOT_FOUND
+    ERROR_CODE = "RESOURCE_NOT_FOUND"
+    ERROR_TYPE = "not_found"
+    
     def __init__(
         self,
         resource: str,
@@ -95,25 +116,26 @@ class ResourceNotFoundException(APIException):
         context: Optional[Dict[str, Any]] = None
     ):
         if not detail:
-            detail = f"{resource} not found"
-            if identifier:
-                detail += f" with ID: {identifier}"
+            detail = f"{resource} not found with ID: {identifier}" if identifier else f"{resource} not found"
         
         super().__init__(
-            status_code=status.HTTP_404_NOT_FOUND,
+            status_code=self.STATUS_CODE,
             detail=detail,
-            error_code="RESOURCE_NOT_FOUND",
-            error_type="not_found",
-            context={
+            error_code=self.ERROR_CODE,
+            error_type=self.ERROR_TYPE,
+            context=_merge_context({
                 "resource": resource,
-                "identifier": identifier,
-                **(context or {})
-            }
+                "identifier": identifier
+            }, context)
         )
 
 class ConflictException(APIException):
     """Resource conflict errors (duplicate, constraint violations)"""
     
+    STATUS_CODE = status.HTTP_409_CONFLICT
+    ERROR_CODE = "RESOURCE_CONFLICT"
+    ERROR_TYPE = "conflict"
+    
     def __init__(
         self,
         detail: str,
@@ -123,16 +145,15 @@ class ConflictException(APIException):
         context: Optional[Dict[str, Any]] = None
     ):
         super().__init__(
-            status_code=status.HTTP_409_CONFLICT,
+            status_code=self.STATUS_CODE,
             detail=detail,
-            error_code="RESOURCE_CONFLICT",
-            error_type="conflict",
-            context={
+            error_code=self.ERROR_CODE,
+            error_type=self.ERROR_TYPE,
+            context=_merge_context({
                 "resource": resource,
                 "conflict_field": conflict_field,
-                "conflict_value": conflict_value,
-                **(context or {})
-            }
+                "conflict_value": conflict_value
+            }, context)
         )
 
 class BusinessLogicException(APIException):
@@ -155,6 +176,10 @@ class BusinessLogicException(APIException):
 class DatabaseException(APIException):
     """Database operation errors"""
     
+    STATUS_CODE = status.HTTP_500_INTERNAL_SERVER_ERROR
+    ERROR_CODE = "DATABASE_ERROR"
+    ERROR_TYPE = "database"
+    
     def __init__(
         self,
         detail: str = "Database operation failed",
@@ -162,14 +187,13 @@ class DatabaseException(APIException):
         context: Optional[Dict[str, Any]] = None
     ):
         super().__init__(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=self.STATUS_CODE,
             detail=detail,
-            error_code="DATABASE_ERROR",
-            error_type="database",
-            context={
-                "operation": operation,
-                **(context or {})
-            }
+            error_code=self.ERROR_CODE,
+            error_type=self.ERROR_TYPE,
+            context=_merge_context({
+                "operation": operation
+            }, context)
         )
 
 class ExternalServiceException(APIException):
@@ -187,10 +211,9 @@ class ExternalServiceException(APIException):
             detail=detail,
             error_code=error_code,
             error_type="external_service",
-            context={
-                "service": service,
-                **(context or {})
-            }
+            context=_merge_context({
+                "service": service
+            }, context)
         )
 
 class RateLimitException(APIException):
@@ -202,133 +225,161 @@ class RateLimitException(APIException):
         retry_after: Optional[int] = None,
         context: Optional[Dict[str, Any]] = None
     ):
-        headers = {}
-        if retry_after:
-            headers["Retry-After"] = str(retry_after)
-        
         super().__init__(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail=detail,
             error_code="RATE_LIMIT_EXCEEDED",
             error_type="rate_limit",
-            context={
-                "retry_after": retry_after,
-                **(context or {})
-            },
-            headers=headers
+            context=_merge_context({
+                "retry_after": retry_after
+            }, context),
+            headers={"Retry-After": str(retry_after)} if retry_after else None
         )
 
 # Specific application exceptions
+# These call APIException.__init__ directly with their fixed context instead
+# of going through the generic parent __init__, which only fills in defaults
 class KitchenNotFoundException(ResourceNotFoundException):
     def __init__(self, kitchen_id: int):
-        super().__init__(
-            resource="Kitchen",
-            identifier=kitchen_id,
-            detail=f"Kitchen with ID {kitchen_id} not found"
+        APIException.__init__(
+            self,
+            status_code=self.STATUS_CODE,
+            detail=f"Kitchen with ID {kitchen_id} not found",
+            error_code=self.ERROR_CODE,
+            error_type=self.ERROR_TYPE,
+            context={"resource": "Kitchen", "identifier": kitchen_id}
         )
 
 class ShoppingListNotFoundException(ResourceNotFoundException):
     def __init__(self, shopping_list_id: int):
-        super().__init__(
-            resource="ShoppingList",
-            identifier=shopping_list_id,
-            detail=f"Shopping list with ID {shopping_list_id} not found"
+        APIException.__init__(
+            self,
+            status_code=self.STATUS_CODE,
+            detail=f"Shopping list with ID {shopping_list_id} not found",
+            error_code=self.ERROR_CODE,
+            error_type=self.ERROR_TYPE,
+            context={"resource": "ShoppingList", "identifier": shopping_list_id}
         )
 
 class ShoppingListItemNotFoundException(ResourceNotFoundException):
     def __init__(self, item_id: int):
-        super().__init__(
-            resource="ShoppingListItem",
-            identifier=item_id,
-            detail=f"Shopping list item with ID {item_id} not found"
+        APIException.__init__(
+            self,
+            status_code=self.STATUS_CODE,
+            detail=f"Shopping list item with ID {item_id} not found",
+            error_code=self.ERROR_CODE,
+            error_type=self.ERROR_TYPE,
+            context={"resource": "ShoppingListItem", "identifier": item_id}
         )
 
 class UserNotFoundException(ResourceNotFoundException):
     def __init__(self, identifier: Any):
-        super().__init__(
-            resource="User",
-            identifier=identifier,
-            detail=f"User not found"
+        APIException.__init__(
+            self,
+            status_code=self.STATUS_CODE,
+            detail="User not found",
+            error_code=self.ERROR_CODE,
+            error_type=self.ERROR_TYPE,
+            context={"resource": "User", "identifier": identifier}
         )
 
 class DuplicateUsernameException(ConflictException):
     def __init__(self, username: str):
-        super().__init__(
+        APIException.__init__(
+            self,
+            status_code=self.STATUS_CODE,
             detail=f"Username '{username}' is already taken",
-            resource="User",
-            conflict_field="username",
-            conflict_value=username
+            error_code=self.ERROR_CODE,
+            error_type=self.ERROR_TYPE,
+            context={"resource": "User", "conflict_field": "username", "conflict_value": username}
         )
 
 class DuplicateEmailException(ConflictException):
     def __init__(self, email: str):
-        super().__init__(
+        APIException.__init__(
+            self,
+            status_code=self.STATUS_CODE,
             detail=f"Email '{email}' is already registered",
-            resource="User",
-            conflict_field="email",
-            conflict_value=email
+            error_code=self.ERROR_CODE,
+            error_type=self.ERROR_TYPE,
+            context={"resource": "User", "conflict_field": "email", "conflict_value": email}
         )
 
 class InvalidCredentialsException(AuthenticationException):
     def __init__(self):
-        super().__init__(
+        APIException.__init__(
+            self,
+            status_code=self.STATUS_CODE,
             detail="Invalid username or password",
-            error_code="INVALID_CREDENTIALS"
+            error_code="INVALID_CREDENTIALS",
+            error_type=self.ERROR_TYPE,
+            headers=_BEARER_HEADERS
         )
 
 class TokenExpiredException(AuthenticationException):
     def __init__(self):
-        super().__init__(
+        APIException.__init__(
+            self,
+            status_code=self.STATUS_CODE,
             detail="Token has expired",
-            error_code="TOKEN_EXPIRED"
+            error_code="TOKEN_EXPIRED",
+            error_type=self.ERROR_TYPE,
+            headers=_BEARER_HEADERS
         )
 
 class InvalidTokenException(AuthenticationException):
     def __init__(self, reason: Optional[str] = None):
-        detail = "Invalid token"
-        if reason:
-            detail += f": {reason}"
-        
-        super().__init__(
-            detail=detail,
-            error_code="INVALID_TOKEN"
+        APIException.__init__(
+            self,
+            status_code=self.STATUS_CODE,
+            detail=f"Invalid token: {reason}" if reason else "Invalid token",
+            error_code="INVALID_TOKEN",
+            error_type=self.ERROR_TYPE,
+            headers=_BEARER_HEADERS
         )
 
 class InactiveUserException(AuthenticationException):
     def __init__(self):
-        super().__init__(
+        APIException.__init__(
+            self,
+            status_code=self.STATUS_CODE,
             detail="User account is inactive",
-            error_code="INACTIVE_USER"
+            error_code="INACTIVE_USER",
+            error_type=self.ERROR_TYPE,
+            headers=_BEARER_HEADERS
         )
 
 class KitchenAccessDeniedException(AuthorizationException):
     def __init__(self, kitchen_id: int):
-        super().__init__(
+        APIException.__init__(
+            self,
+            status_code=self.STATUS_CODE,
             detail=f"Access denied to kitchen {kitchen_id}",
             error_code="KITCHEN_ACCESS_DENIED",
-            resource="Kitchen",
-            action="access",
-            context={"kitchen_id": kitchen_id}
+            error_type=self.ERROR_TYPE,
+            context={"resource": "Kitchen", "action": "access", "kitchen_id": kitchen_id}
         )
 
 class ShoppingListAccessDeniedException(AuthorizationException):
     def __init__(self, shopping_list_id: int):
-        super().__init__(
+        APIException.__init__(
+            self,
+            status_code=self.STATUS_CODE,
             detail=f"Access denied to shopping list {shopping_list_id}",
             error_code="SHOPPING_LIST_ACCESS_DENIED",
-            resource="ShoppingList",
-            action="access",
-            context={"shopping_list_id": shopping_list_id}
+            error_type=self.ERROR_TYPE,
+            context={"resource": "ShoppingList", "action": "access", "shopping_list_id": shopping_list_id}
         )
 
 class ShoppingListItemAccessDeniedException(AuthorizationException):
     def __init__(self, item_id: int):
-        super().__init__(
+        APIException.__init__(
+            self,
+            status_code=self.STATUS_CODE,
             detail=f"Access denied to shopping list item {item_id}",
             error_code="SHOPPING_LIST_ITEM_ACCESS_DENIED",
-            resource="ShoppingListItem",
-            action="access",
-            context={"item_id": item_id}
+            error_type=self.ERROR_TYPE,
+            context={"resource": "ShoppingListItem", "action": "access", "item_id": item_id}
         )
 
 # Error response models for documentation
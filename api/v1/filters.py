@@ -1,35 +1,74 @@
-from typing import Optional, List, Any
-from sqlalchemy.orm import Query
-from sqlalchemy import or_, and_, func
-from datetime import datetime, date
+from typing import Optional, List, Any, Tuple, FrozenSet
+from sqlalchemy.orm import Query, Session, selectinload
+from sqlalchemy import or_, and_, func, select, tuple_, DateTime, event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.util import find_tables
+from collections import OrderedDict
+from enum import Enum
+from datetime import datetime, date, timedelta
+from itertools import chain
+import base64
+import binascii
+import json
+import threading
+import time
+from config import COUNT_CACHE_TTL_SECONDS, COUNT_CACHE_MAX_SIZE
 from . import models
+from .exceptions import ValidationException
 
 class BaseFilter:
     """Base class for filtering functionality"""
     
     def __init__(self, query: Query):
         self.query = query
+        # WHERE predicates collected by the filter_by_* methods and applied
+        # in one .filter() by filtered_query(), instead of cloning the Query
+        # once per filter
+        self.conditions: List[Any] = []
+    
+    def add_condition(self, condition) -> None:
+        """Queue a predicate for the combined WHERE clause"""
+        self.conditions.append(condition)
+    
+    def filtered_query(self) -> Query:
+        """The base query with all queued predicates applied"""
+        if not self.conditions:
+            return self.query
+        return self.query.filter(and_(*self.conditions))
+    
+    def project(self, columns: Optional[List[Any]]) -> 'BaseFilter':
+        """Select only ``columns``; rows come back as named tuples, not entities"""
+        if columns:
+            self.query = self.query.with_entities(*columns)
+        return self
     
-    def apply_text_search(self, search_term: Optional[str], *fields) -> Query:
+    def apply_text_search(self, search_term: Optional[str], *fields) -> None:
         """Apply text search across multiple fields"""
         if not search_term:
-            return self.query
-        
-        search_conditions = []
-        for field in fields:
-            search_conditions.append(field.ilike(f"%{search_term}%"))
+            return
         
-        return self.query.filter(or_(*search_conditions))
+        pattern = f"%{search_term}%"
+        self.add_condition(or_(*(field.ilike(pattern) for field in fields)))
     
-    def apply_date_range(self, date_from: Optional[date], date_to: Optional[date], date_field) -> Query:
+    @staticmethod
+    def prefix_pattern(prefix: str) -> str:
+        """Lower-cased LIKE pattern matching values that start with ``prefix``.
+        
+        Built in Python (not ``:prefix || '%'``) so the pattern is a constant
+        even in prepared statements, which lets PostgreSQL use the
+        lower(name) text_pattern_ops indexes.
+        """
+        escaped = prefix.lower().replace('/', '//').replace('%', '/%').replace('_', '/_')
+        return escaped + '%'
+    
+    def apply_date_range(self, date_from: Optional[date], date_to: Optional[date], date_field) -> None:
         """Apply date range filtering"""
         if date_from:
-            self.query = self.query.filter(date_field >= date_from)
+            self.add_condition(date_field >= date_from)
         if date_to:
-            # Add one day to include the entire end date
-            end_date = datetime.combine(date_to, datetime.max.time())
-            self.query = self.query.filter(date_field <= end_date)
-        return self.query
+            # Half-open upper bound: anything before the start of the next day
+            # covers the whole end date without a 23:59:59.999999 timestamp
+            self.add_condition(date_field < date_to + timedelta(days=1))
     
     def apply_pagination(self, skip: int = 0, limit: int = 100) -> Query:
         """Apply pagination with validation"""
@@ -37,7 +76,7 @@ class BaseFilter:
         skip = max(0, skip)
         limit = min(max(1, limit), 1000)  # Max 1000 items per page
         
-        return self.query.offset(skip).limit(limit)
+        return self.filtered_query().offset(skip).limit(limit)
 
 class KitchenFilter(BaseFilter):
     """Filtering for Kitchen entities"""
@@ -45,19 +84,27 @@ class KitchenFilter(BaseFilter):
     def filter_by_name(self, name: Optional[str]) -> 'KitchenFilter':
         """Filter kitchens by name (partial match)"""
         if name:
-            self.query = self.query.filter(models.Kitchen.name.ilike(f"%{name}%"))
+            self.add_condition(models.Kitchen.name.ilike(f"%{name}%"))
+        return self
+    
+    def filter_by_name_prefix(self, prefix: Optional[str]) -> 'KitchenFilter':
+        """Filter kitchens whose name starts with ``prefix`` (case-insensitive)"""
+        if prefix:
+            self.add_condition(
+                func.lower(models.Kitchen.name).like(self.prefix_pattern(prefix), escape='/')
+            )
         return self
     
     def filter_by_owner(self, owner_id: Optional[int]) -> 'KitchenFilter':
         """Filter kitchens by owner"""
         if owner_id:
-            self.query = self.query.filter(models.Kitchen.owner_id == owner_id)
+            self.add_condition(models.Kitchen.owner_id == owner_id)
         return self
     
     def search(self, search_term: Optional[str]) -> 'KitchenFilter':
         """Search across kitchen name and description"""
         if search_term:
-            self.query = self.apply_text_search(
+            self.apply_text_search(
                 search_term,
                 models.Kitchen.name,
                 models.Kitchen.description
@@ -66,7 +113,7 @@ class KitchenFilter(BaseFilter):
     
     def filter_by_date_range(self, date_from: Optional[date], date_to: Optional[date]) -> 'KitchenFilter':
         """Filter by creation date range"""
-        self.query = self.apply_date_range(date_from, date_to, models.Kitchen.created_at)
+        self.apply_date_range(date_from, date_to, models.Kitchen.created_at)
         return self
 
 class ShoppingListFilter(BaseFilter):
@@ -75,25 +122,33 @@ class ShoppingListFilter(BaseFilter):
     def filter_by_name(self, name: Optional[str]) -> 'ShoppingListFilter':
         """Filter shopping lists by name (partial match)"""
         if name:
-            self.query = self.query.filter(models.ShoppingList.name.ilike(f"%{name}%"))
+            self.add_condition(models.ShoppingList.name.ilike(f"%{name}%"))
+        return self
+    
+    def filter_by_name_prefix(self, prefix: Optional[str]) -> 'ShoppingListFilter':
+        """Filter shopping lists whose name starts with ``prefix`` (case-insensitive)"""
+        if prefix:
+            self.add_condition(
+                func.lower(models.ShoppingList.name).like(self.prefix_pattern(prefix), escape='/')
+            )
         return self
     
     def filter_by_kitchen(self, kitchen_id: Optional[int]) -> 'ShoppingListFilter':
         """Filter shopping lists by kitchen"""
         if kitchen_id:
-            self.query = self.query.filter(models.ShoppingList.kitchen_id == kitchen_id)
+            self.add_condition(models.ShoppingList.kitchen_id == kitchen_id)
         return self
     
     def filter_by_kitchen_ids(self, kitchen_ids: Optional[List[int]]) -> 'ShoppingListFilter':
         """Filter shopping lists by multiple kitchen IDs"""
         if kitchen_ids:
-            self.query = self.query.filter(models.ShoppingList.kitchen_id.in_(kitchen_ids))
+            self.add_condition(models.ShoppingList.kitchen_id.in_(kitchen_ids))
         return self
     
     def search(self, search_term: Optional[str]) -> 'ShoppingListFilter':
         """Search across shopping list name and description"""
         if search_term:
-            self.query = self.apply_text_search(
+            self.apply_text_search(
                 search_term,
                 models.ShoppingList.name,
                 models.ShoppingList.description
@@ -102,16 +157,16 @@ class ShoppingListFilter(BaseFilter):
     
     def filter_by_date_range(self, date_from: Optional[date], date_to: Optional[date]) -> 'ShoppingListFilter':
         """Filter by creation date range"""
-        self.query = self.apply_date_range(date_from, date_to, models.ShoppingList.created_at)
+        self.apply_date_range(date_from, date_to, models.ShoppingList.created_at)
         return self
     
     def filter_by_has_items(self, has_items: Optional[bool]) -> 'ShoppingListFilter':
         """Filter by whether shopping list has items"""
         if has_items is not None:
             if has_items:
-                self.query = self.query.filter(models.ShoppingList.items.any())
+                self.add_condition(models.ShoppingList.items.any())
             else:
-                self.query = self.query.filter(~models.ShoppingList.items.any())
+                self.add_condition(~models.ShoppingList.items.any())
         return self
 
 class ShoppingListItemFilter(BaseFilter):
@@ -120,39 +175,46 @@ class ShoppingListItemFilter(BaseFilter):
     def filter_by_name(self, name: Optional[str]) -> 'ShoppingListItemFilter':
         """Filter items by name (partial match)"""
         if name:
-            self.query = self.query.filter(models.ShoppingListItem.name.ilike(f"%{name}%"))
+            self.add_condition(models.ShoppingListItem.name.ilike(f"%{name}%"))
+        return self
+    
+    def filter_by_name_prefix(self, prefix: Optional[str]) -> 'ShoppingListItemFilter':
+        """Filter items whose name starts with ``prefix`` (case-insensitive)"""
+        if prefix:
+            self.add_condition(
+                func.lower(models.ShoppingListItem.name).like(self.prefix_pattern(prefix), escape='/')
+            )
         return self
     
     def filter_by_shopping_list(self, shopping_list_id: Optional[int]) -> 'ShoppingListItemFilter':
         """Filter items by shopping list"""
         if shopping_list_id:
-            self.query = self.query.filter(models.ShoppingListItem.shopping_list_id == shopping_list_id)
+            self.add_condition(models.ShoppingListItem.shopping_list_id == shopping_list_id)
         return self
     
     def filter_by_shopping_list_ids(self, shopping_list_ids: Optional[List[int]]) -> 'ShoppingListItemFilter':
         """Filter items by multiple shopping list IDs"""
         if shopping_list_ids:
-            self.query = self.query.filter(models.ShoppingListItem.shopping_list_id.in_(shopping_list_ids))
+            self.add_condition(models.ShoppingListItem.shopping_list_id.in_(shopping_list_ids))
         return self
     
     def filter_by_kitchen(self, kitchen_id: Optional[int]) -> 'ShoppingListItemFilter':
         """Filter items by kitchen (through shopping list)"""
         if kitchen_id:
-            self.query = self.query.join(models.ShoppingList).filter(
-                models.ShoppingList.kitchen_id == kitchen_id
-            )
+            self.query = self.query.join(models.ShoppingList)
+            self.add_condition(models.ShoppingList.kitchen_id == kitchen_id)
         return self
     
     def filter_by_quantity_contains(self, quantity_text: Optional[str]) -> 'ShoppingListItemFilter':
         """Filter items by quantity text (partial match)"""
         if quantity_text:
-            self.query = self.query.filter(models.ShoppingListItem.quantity.ilike(f"%{quantity_text}%"))
+            self.add_condition(models.ShoppingListItem.quantity.ilike(f"%{quantity_text}%"))
         return self
     
     def search(self, search_term: Optional[str]) -> 'ShoppingListItemFilter':
         """Search across item name and quantity"""
         if search_term:
-            self.query = self.apply_text_search(
+            self.apply_text_search(
                 search_term,
                 models.ShoppingListItem.name,
                 models.ShoppingListItem.quantity
@@ -161,10 +223,27 @@ class ShoppingListItemFilter(BaseFilter):
     
     def filter_by_date_range(self, date_from: Optional[date], date_to: Optional[date]) -> 'ShoppingListItemFilter':
         """Filter by creation date range"""
-        self.query = self.apply_date_range(date_from, date_to, models.ShoppingListItem.created_at)
+        self.apply_date_range(date_from, date_to, models.ShoppingListItem.created_at)
         return self
 
 # Sorting functionality
+# Accepted sort query parameters; FastAPI rejects anything else with a 422
+# before the handler runs. Members are str, so they also work as plain keys.
+class SortOrder(str, Enum):
+    asc = 'asc'
+    desc = 'desc'
+
+class SortBy(str, Enum):
+    name = 'name'
+    created_at = 'created_at'
+    updated_at = 'updated_at'
+
+class ShoppingListItemSortBy(str, Enum):
+    name = 'name'
+    quantity = 'quantity'
+    created_at = 'created_at'
+    updated_at = 'updated_at'
+
 class SortOptions:
     """Sorting options for different entities"""
     
@@ -188,44 +267,275 @@ class SortOptions:
     }
     
     @staticmethod
-    def apply_sorting(query: Query, sort_by: Optional[str], sort_order: Optional[str], sort_fields: dict) -> Query:
-        """Apply sorting to query"""
-        if not sort_by or sort_by not in sort_fields:
+    def resolve(sort_by: Optional[str], sort_order: Optional[str], sort_fields: dict) -> Tuple[Any, bool]:
+        """Sort column and whether it is descending, applying the default"""
+        field = sort_fields.get(sort_by)
+        if field is None:
             # Default sorting by created_at desc
-            sort_by = 'created_at'
-            sort_order = 'desc'
+            return sort_fields['created_at'], True
+        return field, sort_order == SortOrder.desc
+    
+    @staticmethod
+    def apply_sorting(
+        query: Query,
+        sort_by: Optional[str],
+        sort_order: Optional[str],
+        sort_fields: dict,
+        cursor: Optional[str] = None
+    ) -> Query:
+        """Apply sorting to query, with id as tiebreaker.
         
-        field = sort_fields[sort_by]
+        With a ``cursor`` (see encode_cursor) only rows after the cursor row in
+        this ordering are kept, so the next page is an index seek rather than
+        an OFFSET over every earlier row.
+        """
+        field, descending = SortOptions.resolve(sort_by, sort_order, sort_fields)
+        tiebreaker = field.class_.id
         
-        if sort_order and sort_order.lower() == 'desc':
-            query = query.order_by(field.desc())
-        else:
-            query = query.order_by(field.asc())
+        if cursor:
+            sort_value, row_id = decode_cursor(cursor, field)
+            position = tuple_(field, tiebreaker)
+            after = tuple_(sort_value, row_id)
+            query = query.filter(position < after if descending else position > after)
         
-        return query
+        if descending:
+            return query.order_by(field.desc(), tiebreaker.desc())
+        return query.order_by(field.asc(), tiebreaker.asc())
+
+def encode_cursor(sort_value: Any, row_id: int) -> str:
+    """Opaque keyset cursor for the row a page ended on"""
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    return base64.urlsafe_b64encode(json.dumps([sort_value, row_id]).encode()).decode()
+
+def decode_cursor(cursor: str, field) -> Tuple[Any, int]:
+    """Sort value and row id from a cursor made by encode_cursor
+    
+    The sort value must match the sort column's Python type (an ISO string
+    for DateTime columns), since it is compared against the column directly.
+    """
+    try:
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(cursor))
+        if isinstance(field.type, DateTime):
+            if not isinstance(sort_value, str):
+                raise TypeError("sort value must be an ISO timestamp")
+            sort_value = datetime.fromisoformat(sort_value)
+        elif not isinstance(sort_value, field.type.python_type) or isinstance(sort_value, bool):
+            raise TypeError("sort value does not match the sort column")
+    except (ValueError, TypeError, binascii.Error):
+        raise ValidationException("Invalid pagination cursor", field="cursor", value=cursor)
+    if type(row_id) is not int:
+        raise ValidationException("Invalid pagination cursor", field="cursor", value=cursor)
+    return sort_value, row_id
 
-# Convenience functions for easy use in routes
+def paginate_after_cursor(query: Query, limit: int, sort_by: Optional[str], sort_fields: dict) -> Tuple[List[Any], Optional[str]]:
+    """Fetch one keyset page and the cursor for the page after it.
+    
+    ``query`` must already be sorted (and, past the first page, filtered) by
+    SortOptions.apply_sorting. No total is counted: one extra row is fetched
+    to tell whether another page exists.
+    """
+    rows = query.limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    
+    rows = rows[:limit]
+    return rows, cursor_after(rows[-1], sort_by, sort_fields)
+
+def cursor_after(row: Any, sort_by: Optional[str], sort_fields: dict) -> str:
+    """Cursor that continues a listing sorted by ``sort_by`` after ``row``"""
+    field, _ = SortOptions.resolve(sort_by, None, sort_fields)
+    return encode_cursor(getattr(row, field.key), row.id)
+
+# --- Listing total cache ---
+# Totals of recently listed filters, keyed by the compiled WHERE clause and its
+# parameters (not skip/limit), so paging through a listing counts it once.
+# Entries also record the tables they read; committing a flush or bulk
+# INSERT/UPDATE/DELETE that touched one of those tables in this process drops
+# them, other workers' writes wait out the TTL.
+_count_cache: "OrderedDict[Tuple[str, str], Tuple[float, FrozenSet[str], int]]" = OrderedDict()
+_count_cache_lock = threading.Lock()
+
+def _count_key(query: Query) -> Tuple[Tuple[str, str], FrozenSet[str]]:
+    """Cache key and source tables for the total of ``query``"""
+    stmt = query.order_by(None).statement
+    compiled = stmt.compile()
+    key = (str(compiled), repr(sorted(compiled.params.items())))
+    return key, frozenset(table.name for table in find_tables(stmt, include_joins=True))
+
+def get_cached_count(key: Tuple[str, str]) -> Optional[int]:
+    """Cached total for a count key, if still fresh"""
+    with _count_cache_lock:
+        entry = _count_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del _count_cache[key]
+            return None
+        _count_cache.move_to_end(key)
+        return entry[2]
+
+def store_count(key: Tuple[str, str], tables: FrozenSet[str], total: int) -> None:
+    """Remember a listing total for COUNT_CACHE_TTL_SECONDS"""
+    with _count_cache_lock:
+        _count_cache[key] = (time.monotonic() + COUNT_CACHE_TTL_SECONDS, tables, total)
+        _count_cache.move_to_end(key)
+        while len(_count_cache) > COUNT_CACHE_MAX_SIZE:
+            _count_cache.popitem(last=False)
+
+def invalidate_counts(tables) -> None:
+    """Drop cached totals that read any of ``tables``"""
+    tables = set(tables)
+    with _count_cache_lock:
+        stale = [key for key, entry in _count_cache.items() if not tables.isdisjoint(entry[1])]
+        for key in stale:
+            del _count_cache[key]
+
+def clear_count_cache() -> None:
+    """Drop all cached listing totals"""
+    with _count_cache_lock:
+        _count_cache.clear()
+
+# session.info key holding the tables a session has written in its current
+# transaction; their cached totals are dropped once the writes commit
+_WRITTEN_TABLES = "count_cache_written_tables"
+
+def _note_written_tables(session, tables) -> None:
+    session.info.setdefault(_WRITTEN_TABLES, set()).update(tables)
+
+def _has_uncommitted_writes(session) -> bool:
+    """Whether ``session`` has flushed writes its transaction has not committed
+    
+    Totals counted by such a session include those writes, which other
+    sessions cannot see yet (and may never see, after a rollback), so they
+    are neither stored nor served from the cache.
+    """
+    return bool(session.info.get(_WRITTEN_TABLES))
+
+@event.listens_for(Session, "after_flush")
+def _note_flushed_tables(session, flush_context):
+    _note_written_tables(session, {
+        obj.__table__.name for obj in chain(session.new, session.dirty, session.deleted)
+    })
+
+@event.listens_for(Session, "do_orm_execute")
+def _note_bulk_dml_tables(orm_execute_state):
+    # Bulk insert/update/delete statements bypass the flush
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        _note_written_tables(orm_execute_state.session, {orm_execute_state.statement.table.name})
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_counts(session):
+    tables = session.info.pop(_WRITTEN_TABLES, None)
+    if tables and _count_cache:
+        invalidate_counts(tables)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_tables(session):
+    session.info.pop(_WRITTEN_TABLES, None)
+
+def paginate_with_total(query: Query, skip: int, limit: int) -> Tuple[List[Any], int]:
+    """Fetch one page and the total match count in a single round trip.
+
+    The total is computed inline with ``COUNT(*) OVER ()`` instead of a
+    separate ``SELECT count(*)`` over the same filtered query. When the total
+    is cached, the page is fetched without the window count.
+    """
+    if COUNT_CACHE_TTL_SECONDS <= 0 or _has_uncommitted_writes(query.session):
+        return _paginate_counting(query, skip, limit)
+    
+    key, tables = _count_key(query)
+    total = get_cached_count(key)
+    if total is not None:
+        return query.offset(skip).limit(limit).all(), total
+    
+    rows, total = _paginate_counting(query, skip, limit)
+    store_count(key, tables, total)
+    return rows, total
+
+def _without_total(query: Query, rows: List[Any]) -> List[Any]:
+    """Page rows of ``query`` from rows carrying the trailing window count.
+    
+    Entity queries unwrap to the entity. Projected rows (BaseFilter.project)
+    are returned as they are; the extra ``total`` attribute is ignored by the
+    response schemas.
+    """
+    if query.is_single_entity:
+        return [row[0] for row in rows]
+    return rows
+
+def _paginate_counting(query: Query, skip: int, limit: int) -> Tuple[List[Any], int]:
+    rows = query.add_columns(func.count().over().label('total')).offset(skip).limit(limit).all()
+    if rows:
+        return _without_total(query, rows), rows[0].total
+    
+    # No row carries the window count when the page is past the end
+    return [], query.order_by(None).count() if skip else 0
+
+async def paginate_with_total_async(db: AsyncSession, query: Query, skip: int, limit: int) -> Tuple[List[Any], int]:
+    """Async counterpart of paginate_with_total.
+
+    ``query`` may be built without a session (``Query(Model)``) so the
+    existing filter classes can be reused; it is executed on ``db``.
+    """
+    use_cache = COUNT_CACHE_TTL_SECONDS > 0 and not _has_uncommitted_writes(db.sync_session)
+    if use_cache:
+        key, tables = _count_key(query)
+        total = get_cached_count(key)
+        if total is not None:
+            result = await db.execute(query.offset(skip).limit(limit).statement)
+            return (result.scalars().all() if query.is_single_entity else result.all()), total
+    
+    rows, total = await _paginate_counting_async(db, query, skip, limit)
+    if use_cache:
+        store_count(key, tables, total)
+    return rows, total
+
+async def _paginate_counting_async(db: AsyncSession, query: Query, skip: int, limit: int) -> Tuple[List[Any], int]:
+    stmt = query.add_columns(func.count().over().label('total')).offset(skip).limit(limit).statement
+    rows = (await db.execute(stmt)).all()
+    if rows:
+        return _without_total(query, rows), rows[0].total
+    
+    if not skip:
+        return [], 0
+    count_stmt = select(func.count()).select_from(query.order_by(None).statement.subquery())
+    return [], (await db.execute(count_stmt)).scalar_one()
+
+# Convenience functions for easy use in routes. Routes pass every filter key,
+# mostly as None, so a filter is only invoked when its value is set.
 def filter_kitchens(query: Query, **filters) -> Query:
     """Apply filters to kitchen query"""
     kitchen_filter = KitchenFilter(query)
     
-    if 'name' in filters:
+    if filters.get('name'):
         kitchen_filter = kitchen_filter.filter_by_name(filters['name'])
-    if 'owner_id' in filters:
+    if filters.get('name_prefix'):
+        kitchen_filter = kitchen_filter.filter_by_name_prefix(filters['name_prefix'])
+    if filters.get('owner_id'):
         kitchen_filter = kitchen_filter.filter_by_owner(filters['owner_id'])
-    if 'search' in filters:
+    if filters.get('search'):
         kitchen_filter = kitchen_filter.search(filters['search'])
-    if 'date_from' in filters or 'date_to' in filters:
+    if filters.get('date_from') or filters.get('date_to'):
         kitchen_filter = kitchen_filter.filter_by_date_range(
             filters.get('date_from'), filters.get('date_to')
         )
+    if filters.get('columns'):
+        kitchen_filter = kitchen_filter.project(filters['columns'])
+    if filters.get('include_shopping_lists'):
+        # Load each page's lists and their items in two IN queries rather
+        # than lazily per kitchen and per list during serialization
+        kitchen_filter.query = kitchen_filter.query.options(
+            selectinload(models.Kitchen.shopping_lists).selectinload(models.ShoppingList.items)
+        )
     
     # Apply sorting
     query = SortOptions.apply_sorting(
-        kitchen_filter.query,
+        kitchen_filter.filtered_query(),
         filters.get('sort_by'),
         filters.get('sort_order'),
-        SortOptions.KITCHEN_SORT_FIELDS
+        SortOptions.KITCHEN_SORT_FIELDS,
+        filters.get('cursor')
     )
     
     return query
@@ -234,27 +544,35 @@ def filter_shopping_lists(query: Query, **filters) -> Query:
     """Apply filters to shopping list query"""
     sl_filter = ShoppingListFilter(query)
     
-    if 'name' in filters:
+    if filters.get('name'):
         sl_filter = sl_filter.filter_by_name(filters['name'])
-    if 'kitchen_id' in filters:
+    if filters.get('name_prefix'):
+        sl_filter = sl_filter.filter_by_name_prefix(filters['name_prefix'])
+    if filters.get('kitchen_id'):
         sl_filter = sl_filter.filter_by_kitchen(filters['kitchen_id'])
-    if 'kitchen_ids' in filters:
+    if filters.get('kitchen_ids'):
         sl_filter = sl_filter.filter_by_kitchen_ids(filters['kitchen_ids'])
-    if 'search' in filters:
+    if filters.get('search'):
         sl_filter = sl_filter.search(filters['search'])
-    if 'date_from' in filters or 'date_to' in filters:
+    if filters.get('date_from') or filters.get('date_to'):
         sl_filter = sl_filter.filter_by_date_range(
             filters.get('date_from'), filters.get('date_to')
         )
-    if 'has_items' in filters:
+    if filters.get('has_items') is not None:
         sl_filter = sl_filter.filter_by_has_items(filters['has_items'])
+    if filters.get('columns'):
+        sl_filter = sl_filter.project(filters['columns'])
+    if filters.get('include_items'):
+        # Load each page's items in one IN query rather than lazily per list
+        sl_filter.query = sl_filter.query.options(selectinload(models.ShoppingList.items))
     
     # Apply sorting
     query = SortOptions.apply_sorting(
-        sl_filter.query,
+        sl_filter.filtered_query(),
         filters.get('sort_by'),
         filters.get('sort_order'),
-        SortOptions.SHOPPING_LIST_SORT_FIELDS
+        SortOptions.SHOPPING_LIST_SORT_FIELDS,
+        filters.get('cursor')
     )
     
     return query
@@ -263,29 +581,34 @@ def filter_shopping_list_items(query: Query, **filters) -> Query:
     """Apply filters to shopping list item query"""
     item_filter = ShoppingListItemFilter(query)
     
-    if 'name' in filters:
+    if filters.get('name'):
         item_filter = item_filter.filter_by_name(filters['name'])
-    if 'shopping_list_id' in filters:
+    if filters.get('name_prefix'):
+        item_filter = item_filter.filter_by_name_prefix(filters['name_prefix'])
+    if filters.get('shopping_list_id'):
         item_filter = item_filter.filter_by_shopping_list(filters['shopping_list_id'])
-    if 'shopping_list_ids' in filters:
+    if filters.get('shopping_list_ids'):
         item_filter = item_filter.filter_by_shopping_list_ids(filters['shopping_list_ids'])
-    if 'kitchen_id' in filters:
+    if filters.get('kitchen_id'):
         item_filter = item_filter.filter_by_kitchen(filters['kitchen_id'])
-    if 'quantity_contains' in filters:
+    if filters.get('quantity_contains'):
         item_filter = item_filter.filter_by_quantity_contains(filters['quantity_contains'])
-    if 'search' in filters:
+    if filters.get('search'):
         item_filter = item_filter.search(filters['search'])
-    if 'date_from' in filters or 'date_to' in filters:
+    if filters.get('date_from') or filters.get('date_to'):
         item_filter = item_filter.filter_by_date_range(
             filters.get('date_from'), filters.get('date_to')
         )
+    if filters.get('columns'):
+        item_filter = item_filter.project(filters['columns'])
     
     # Apply sorting
     query = SortOptions.apply_sorting(
-        item_filter.query,
+        item_filter.filtered_query(),
         filters.get('sort_by'),
         filters.get('sort_order'),
-        SortOptions.SHOPPING_LIST_ITEM_SORT_FIELDS
+        SortOptions.SHOPPING_LIST_ITEM_SORT_FIELDS,
+        filters.get('cursor')
     )
     
     return query
\ No newline at end of file
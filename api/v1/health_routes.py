@@ -1,17 +1,81 @@
 from fastapi import APIRouter, Depends, Query, HTTPException
-from typing import Dict, Any, Optional
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse, ORJSONResponse
+from typing import Dict, Any, Optional, Callable, Awaitable, Tuple
 from datetime import datetime, timedelta
+import asyncio
 import logging
-from sqlalchemy.orm import Session
+import time
+import psutil
+from collections import defaultdict
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
-from .database import get_db, db_manager
-from .monitoring import metrics_collector, performance_profiler
+from .database import get_async_db, db_manager, get_database_info_async, HEALTH_CHECK_SQL
+from .monitoring import metrics_collector, performance_profiler, COMMON_OPERATIONS, disk_usage, MB, GB
 from .exceptions import DatabaseException
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# The /metrics endpoints return ORJSONResponse themselves: a returned dict
+# would first be validated against response_model and re-encoded by FastAPI,
+# while orjson serializes it (datetimes included) in one pass. response_model
+# stays on the routes for the OpenAPI schema.
+
+# Probe results are reused briefly so a storm of load balancer and
+# orchestrator probes shares one evaluation (and one database round trip);
+# scraped metrics payloads use the same cache. Failures are never cached:
+# a producer that raises stores nothing, and /health/detailed only caches a
+# report whose overall status is healthy.
+HEALTH_CACHE_TTL = 1.0
+READY_CACHE_TTL = 0.5
+# Endpoint stats move slowly relative to how often dashboards scrape them
+ENDPOINT_METRICS_CACHE_TTL = 5.0
+
+_health_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_health_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+async def _cached_probe(
+    key: str,
+    ttl: float,
+    producer: Callable[[], Awaitable[Dict[str, Any]]],
+    cacheable: Optional[Callable[[Dict[str, Any]], bool]] = None
+) -> Dict[str, Any]:
+    """Return the cached result for key, running producer at most once per TTL
+    
+    A producer that raises stores nothing; neither does a result rejected by
+    ``cacheable``.
+    """
+    entry = _health_cache.get(key)
+    if entry is None or entry[0] <= time.monotonic():
+        async with _health_locks[key]:
+            # Another probe may have refreshed the entry while we waited
+            entry = _health_cache.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                entry = (time.monotonic() + ttl, await producer())
+                if cacheable is not None and not cacheable(entry[1]):
+                    return entry[1]
+                _health_cache[key] = entry
+    return entry[1]
+
+def _shared_health_status() -> Dict[str, Any]:
+    """metrics_collector.get_health_status(), computed at most once per TTL
+    
+    /health, /health/detailed and /health/ready all report it, so probes of
+    different kinds in the same second share one evaluation. It runs without
+    awaiting, so concurrent probes cannot race to recompute it.
+    """
+    entry = _health_cache.get("status")
+    if entry is None or entry[0] <= time.monotonic():
+        entry = (time.monotonic() + HEALTH_CACHE_TTL, metrics_collector.get_health_status())
+        _health_cache["status"] = entry
+    return entry[1]
+
+def clear_health_cache():
+    """Drop all cached probe results"""
+    _health_cache.clear()
+
 @router.get("/health", response_model=Dict[str, Any])
 async def health_check():
     """
@@ -19,8 +83,7 @@ async def health_check():
     Returns overall system health status
     """
     try:
-        health_status = metrics_collector.get_health_status()
-        return health_status
+        return _shared_health_status()
     except Exception as e:
         logger.error(f"Health check failed: {e}")
         return {
@@ -30,10 +93,18 @@ async def health_check():
         }
 
 @router.get("/health/detailed", response_model=Dict[str, Any])
-async def detailed_health_check(db: Session = Depends(get_db)):
+async def detailed_health_check():
     """
     Detailed health check with component-specific status
     """
+    return await _cached_probe(
+        "detailed",
+        HEALTH_CACHE_TTL,
+        _detailed_health,
+        cacheable=lambda health: health["overall_status"] == "healthy"
+    )
+
+async def _detailed_health() -> Dict[str, Any]:
     health_data = {
         "timestamp": datetime.utcnow().isoformat(),
         "overall_status": "healthy",
@@ -42,7 +113,7 @@ async def detailed_health_check(db: Session = Depends(get_db)):
     
     # Database health check with detailed pool information
     try:
-        db_health = db_manager.health_check()
+        db_health = await db_manager.async_health_check()
         health_data["components"]["database"] = db_health
         
         if db_health["status"] != "healthy":
@@ -57,7 +128,7 @@ async def detailed_health_check(db: Session = Depends(get_db)):
     
     # System metrics health check
     try:
-        system_health = metrics_collector.get_health_status()
+        system_health = _shared_health_status()
         health_data["components"]["system_metrics"] = {
             "status": system_health["status"],
             "metrics": system_health["metrics"],
@@ -76,21 +147,15 @@ async def detailed_health_check(db: Session = Depends(get_db)):
     # Application health indicators
     try:
         # Check recent error rates
-        now = datetime.utcnow()
-        five_minutes_ago = now - timedelta(minutes=5)
-        recent_requests = [
-            m for m in metrics_collector.request_metrics 
-            if m.timestamp >= five_minutes_ago
-        ]
+        total_requests, error_count = metrics_collector.get_recent_totals(5)
         
-        if recent_requests:
-            error_count = sum(1 for m in recent_requests if m.status_code >= 500)
-            error_rate = error_count / len(recent_requests)
+        if total_requests:
+            error_rate = error_count / total_requests
             
             health_data["components"]["application"] = {
                 "status": "healthy" if error_rate < 0.05 else "degraded",
                 "error_rate": error_rate,
-                "total_requests": len(recent_requests),
+                "total_requests": total_requests,
                 "error_count": error_count
             }
         else:
@@ -108,22 +173,24 @@ async def detailed_health_check(db: Session = Depends(get_db)):
     return health_data
 
 @router.get("/health/ready")
-async def readiness_check(db: Session = Depends(get_db)):
+async def readiness_check(db: AsyncSession = Depends(get_async_db)):
     """
     Kubernetes-style readiness probe
     Returns 200 if service is ready to accept traffic
     """
-    try:
+    async def check_ready() -> Dict[str, Any]:
         # Check database connectivity
-        db.execute(text("SELECT 1"))
+        await db.execute(HEALTH_CHECK_SQL)
         
         # Check if system is not overloaded
-        health_status = metrics_collector.get_health_status()
+        health_status = _shared_health_status()
         if health_status["status"] == "unhealthy":
             raise HTTPException(status_code=503, detail="System is unhealthy")
         
         return {"status": "ready", "timestamp": datetime.utcnow().isoformat()}
-        
+    
+    try:
+        return await _cached_probe("ready", READY_CACHE_TTL, check_ready)
     except HTTPException:
         raise
     except Exception as e:
@@ -136,10 +203,11 @@ async def liveness_check():
     Kubernetes-style liveness probe
     Returns 200 if service is alive (basic functionality)
     """
+    now = datetime.utcnow()
     return {
         "status": "alive",
-        "timestamp": datetime.utcnow().isoformat(),
-        "uptime": (datetime.utcnow() - metrics_collector.start_time).total_seconds()
+        "timestamp": now.isoformat(),
+        "uptime": (now - metrics_collector.start_time).total_seconds()
     }
 
 @router.get("/metrics", response_model=Dict[str, Any])
@@ -150,42 +218,55 @@ async def get_metrics(
     Get application metrics for the specified time period
     """
     try:
-        return metrics_collector.get_metrics_summary(hours=hours)
+        # The summary scans and sorts the whole request history; run it on a
+        # worker thread so the event loop keeps serving requests meanwhile
+        return ORJSONResponse(await run_in_threadpool(metrics_collector.get_metrics_summary, hours=hours))
     except Exception as e:
         logger.error(f"Failed to get metrics: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve metrics")
 
+@router.get("/metrics/prometheus", response_class=PlainTextResponse)
+async def get_prometheus_metrics():
+    """
+    Request counters and latency histograms in the Prometheus text format
+    """
+    return PlainTextResponse(
+        metrics_collector.render_prometheus(),
+        media_type="text/plain; version=0.0.4"
+    )
+
+def _system_snapshot():
+    """Current memory, disk and network counters from psutil"""
+    return psutil.virtual_memory(), disk_usage(), psutil.net_io_counters()
+
 @router.get("/metrics/system", response_model=Dict[str, Any])
 async def get_system_metrics():
     """
     Get current system resource metrics
     """
     try:
-        import psutil
-        
-        # Get current system stats
-        cpu_percent = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
-        network = psutil.net_io_counters()
+        # Get current system stats; the psutil calls read /proc, so they
+        # share one hop to a worker thread instead of blocking the event loop
+        cpu_percent = metrics_collector.current_cpu_percent()
+        memory, disk, network = await run_in_threadpool(_system_snapshot)
         
         # Get recent system metrics from collector
-        recent_metrics = list(metrics_collector.system_metrics)[-10:] if metrics_collector.system_metrics else []
+        recent_metrics = list(metrics_collector.snapshot_system_metrics()[-10:])
         
-        return {
-            "timestamp": datetime.utcnow().isoformat(),
+        return ORJSONResponse({
+            "timestamp": datetime.utcnow(),
             "current": {
                 "cpu_percent": cpu_percent,
                 "memory": {
-                    "total_mb": memory.total / 1024 / 1024,
-                    "used_mb": memory.used / 1024 / 1024,
-                    "available_mb": memory.available / 1024 / 1024,
+                    "total_mb": memory.total / MB,
+                    "used_mb": memory.used / MB,
+                    "available_mb": memory.available / MB,
                     "percent": memory.percent
                 },
                 "disk": {
-                    "total_gb": disk.total / 1024 / 1024 / 1024,
-                    "used_gb": disk.used / 1024 / 1024 / 1024,
-                    "free_gb": disk.free / 1024 / 1024 / 1024,
+                    "total_gb": disk.total / GB,
+                    "used_gb": disk.used / GB,
+                    "free_gb": disk.free / GB,
                     "percent": disk.percent
                 },
                 "network": {
@@ -197,7 +278,7 @@ async def get_system_metrics():
             },
             "history": [
                 {
-                    "timestamp": m.timestamp.isoformat(),
+                    "timestamp": m.timestamp_iso,
                     "cpu_percent": m.cpu_percent,
                     "memory_percent": m.memory_percent,
                     "memory_mb": m.memory_mb,
@@ -207,7 +288,7 @@ async def get_system_metrics():
                 }
                 for m in recent_metrics
             ]
-        }
+        })
         
     except Exception as e:
         logger.error(f"Failed to get system metrics: {e}")
@@ -219,63 +300,53 @@ async def get_performance_metrics():
     Get performance metrics for different operations
     """
     try:
-        operations = {}
-        
-        # Get stats for common operations
-        common_operations = [
-            "database_query",
-            "authentication",
-            "shopping_list_create",
-            "shopping_list_update",
-            "user_registration"
-        ]
-        
-        for operation in common_operations:
-            stats = performance_profiler.get_operation_stats(operation)
-            if stats["count"] > 0:
-                operations[operation] = stats
+        operations = performance_profiler.get_many(COMMON_OPERATIONS)
         
-        return {
-            "timestamp": datetime.utcnow().isoformat(),
+        return ORJSONResponse({
+            "timestamp": datetime.utcnow(),
             "operations": operations
-        }
+        })
         
     except Exception as e:
         logger.error(f"Failed to get performance metrics: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve performance metrics")
 
 @router.get("/metrics/endpoints", response_model=Dict[str, Any])
-async def get_endpoint_metrics():
+async def get_endpoint_metrics(
+    limit: int = Query(50, ge=1, le=1000, description="Number of busiest endpoints to return")
+):
     """
-    Get metrics for API endpoints
+    Get metrics for the busiest API endpoints
     """
     try:
-        endpoint_stats = {}
-        
-        for endpoint, stats in metrics_collector.endpoint_stats.items():
-            if stats['count'] > 0:
-                endpoint_stats[endpoint] = {
-                    "request_count": stats['count'],
-                    "error_count": stats['error_count'],
-                    "error_rate": stats['error_count'] / stats['count'],
-                    "avg_response_time": stats['total_time'] / stats['count'],
-                    "last_accessed": stats['last_accessed'].isoformat() if stats['last_accessed'] else None
-                }
-        
-        # Sort by request count
-        sorted_endpoints = dict(
-            sorted(endpoint_stats.items(), key=lambda x: x[1]['request_count'], reverse=True)
-        )
-        
-        return {
-            "timestamp": datetime.utcnow().isoformat(),
-            "endpoints": sorted_endpoints
-        }
-        
+        return ORJSONResponse(await _cached_probe(
+            f"endpoints:{limit}",
+            ENDPOINT_METRICS_CACHE_TTL,
+            lambda: _endpoint_metrics(limit)
+        ))
     except Exception as e:
         logger.error(f"Failed to get endpoint metrics: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve endpoint metrics")
 
+async def _endpoint_metrics(limit: int) -> Dict[str, Any]:
+    endpoint_stats = {}
+    
+    # Already ordered by request count, so the dict keeps that order
+    for endpoint, stats in metrics_collector.top_endpoint_stats(limit):
+        if stats['count'] > 0:
+            endpoint_stats[endpoint] = {
+                "request_count": stats['count'],
+                "error_count": stats['error_count'],
+                "error_rate": stats['error_count'] / stats['count'],
+                "avg_response_time": stats['total_time'] / stats['count'],
+                "last_accessed": stats['last_accessed']
+            }
+    
+    return {
+        "timestamp": datetime.utcnow(),
+        "endpoints": endpoint_stats
+    }
+
 @router.get("/metrics/errors", response_model=Dict[str, Any])
 async def get_error_metrics():
     """
@@ -284,42 +355,26 @@ async def get_error_metrics():
     try:
         # Get recent error breakdown
         now = datetime.utcnow()
-        one_hour_ago = now - timedelta(hours=1)
-        
-        recent_errors = [
-            m for m in metrics_collector.request_metrics 
-            if m.timestamp >= one_hour_ago and m.status_code >= 400
-        ]
-        
-        # Group by status code
-        status_code_breakdown = {}
-        error_code_breakdown = {}
-        
-        for error in recent_errors:
-            status_code = str(error.status_code)
-            status_code_breakdown[status_code] = status_code_breakdown.get(status_code, 0) + 1
-            
-            if error.error_code:
-                error_code_breakdown[error.error_code] = error_code_breakdown.get(error.error_code, 0) + 1
+        status_counts, error_code_breakdown, recent_errors = metrics_collector.get_error_breakdown(60)
         
-        return {
-            "timestamp": now.isoformat(),
+        return ORJSONResponse({
+            "timestamp": now,
             "period_hours": 1,
-            "total_errors": len(recent_errors),
-            "status_code_breakdown": status_code_breakdown,
+            "total_errors": sum(status_counts.values()),
+            "status_code_breakdown": {str(code): count for code, count in status_counts.items()},
             "error_code_breakdown": error_code_breakdown,
             "recent_errors": [
                 {
-                    "timestamp": e.timestamp.isoformat(),
+                    "timestamp": e.timestamp,
                     "method": e.method,
                     "path": e.path,
                     "status_code": e.status_code,
                     "error_code": e.error_code,
                     "duration": e.duration
                 }
-                for e in recent_errors[-20:]  # Last 20 errors
+                for e in recent_errors  # Last 20 errors
             ]
-        }
+        })
         
     except Exception as e:
         logger.error(f"Failed to get error metrics: {e}")
@@ -331,49 +386,53 @@ async def get_user_activity_metrics():
     Get user activity metrics
     """
     try:
-        # Get active users (users with activity in last 24 hours)
-        now = datetime.utcnow()
-        twenty_four_hours_ago = now - timedelta(hours=24)
-        
-        active_users = {}
-        for user_id, stats in metrics_collector.user_activity.items():
-            if stats['last_activity'] and stats['last_activity'] >= twenty_four_hours_ago:
-                active_users[str(user_id)] = {
-                    "request_count": stats['request_count'],
-                    "error_count": stats['error_count'],
-                    "last_activity": stats['last_activity'].isoformat()
-                }
-        
-        return {
-            "timestamp": now.isoformat(),
-            "period_hours": 24,
-            "active_user_count": len(active_users),
-            "active_users": active_users
-        }
-        
+        # Grows with every user seen since startup, so build it off the loop
+        return ORJSONResponse(await run_in_threadpool(_user_activity_metrics))
     except Exception as e:
         logger.error(f"Failed to get user activity metrics: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve user activity metrics")
 
+def _user_activity_metrics() -> Dict[str, Any]:
+    # Get active users (users with activity in last 24 hours)
+    now = datetime.utcnow()
+    twenty_four_hours_ago = now - timedelta(hours=24)
+    
+    active_users = {}
+    for user_id, stats in metrics_collector.snapshot_active_users(twenty_four_hours_ago):
+        active_users[str(user_id)] = {
+            "request_count": stats['request_count'],
+            "error_count": stats['error_count'],
+            "last_activity": stats['last_activity']
+        }
+    
+    return {
+        "timestamp": now,
+        "period_hours": 24,
+        "active_user_count": len(active_users),
+        "active_users": active_users
+    }
+
 @router.get("/database/status", response_model=Dict[str, Any])
 async def get_database_status():
     """
     Get comprehensive database status and connection pool information
     """
     try:
-        # Get database health check
-        health_status = db_manager.health_check()
-        
-        # Get connection pool status
+        # Connection pool status is read from the pool itself, with no
+        # connection checked out
         pool_status = db_manager.get_pool_status()
         
-        # Get database server information
-        db_info = {}
-        try:
-            from .database import get_database_info
-            db_info = get_database_info()
-        except Exception as e:
-            logger.warning(f"Could not get database info: {e}")
+        # The health check and server information queries run concurrently
+        # on separate pooled connections
+        health_status, db_info = await asyncio.gather(
+            db_manager.async_health_check(),
+            get_database_info_async(),
+            return_exceptions=True
+        )
+        if isinstance(health_status, BaseException):
+            raise health_status
+        if isinstance(db_info, BaseException):
+            logger.warning(f"Could not get database info: {db_info}")
             db_info = {"error": "Database info unavailable"}
         
         return {
@@ -395,7 +454,7 @@ async def get_database_status():
         raise HTTPException(status_code=500, detail="Failed to retrieve database status")
 
 @router.get("/database/connections", response_model=Dict[str, Any])
-async def get_database_connections(db: Session = Depends(get_db)):
+async def get_database_connections(db: AsyncSession = Depends(get_async_db)):
     """
     Get information about active database connections
     """
@@ -412,7 +471,7 @@ async def get_database_connections(db: Session = Depends(get_db)):
             WHERE pid != pg_backend_pid()
         """)
         
-        result = db.execute(connection_query, {"app_name": "kitchen_manager_api"})
+        result = await db.execute(connection_query, {"app_name": "kitchen_manager_api"})
         row = result.fetchone()
         
         # Get connection pool status
@@ -435,32 +494,56 @@ async def get_database_connections(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail="Failed to retrieve database connection information")
 
 @router.get("/database/performance", response_model=Dict[str, Any])
-async def get_database_performance(db: Session = Depends(get_db)):
+async def get_database_performance(db: AsyncSession = Depends(get_async_db)):
     """
     Get database performance metrics
     """
     try:
-        # Query for database performance statistics
+        # Table statistics and the database size in one round trip; the size
+        # is repeated on every row, and sz drives the join so it is still
+        # returned when there are no user tables
         performance_query = text("""
+            WITH sz AS (
+                SELECT 
+                    pg_size_pretty(pg_database_size(current_database())) as database_size,
+                    pg_database_size(current_database()) as database_size_bytes
+            )
             SELECT 
-                schemaname,
-                tablename,
-                seq_scan,
-                seq_tup_read,
-                idx_scan,
-                idx_tup_fetch,
-                n_tup_ins,
-                n_tup_upd,
-                n_tup_del
-            FROM pg_stat_user_tables 
-            ORDER BY seq_scan + idx_scan DESC
-            LIMIT 10
+                t.schemaname,
+                t.tablename,
+                t.seq_scan,
+                t.seq_tup_read,
+                t.idx_scan,
+                t.idx_tup_fetch,
+                t.n_tup_ins,
+                t.n_tup_upd,
+                t.n_tup_del,
+                sz.database_size,
+                sz.database_size_bytes
+            FROM sz
+            LEFT JOIN LATERAL (
+                SELECT 
+                    schemaname,
+                    relname as tablename,
+                    seq_scan,
+                    seq_tup_read,
+                    idx_scan,
+                    idx_tup_fetch,
+                    n_tup_ins,
+                    n_tup_upd,
+                    n_tup_del
+                FROM pg_stat_user_tables 
+                ORDER BY seq_scan + idx_scan DESC
+                LIMIT 10
+            ) t ON true
         """)
         
-        result = db.execute(performance_query)
+        rows = (await db.execute(performance_query)).fetchall()
         table_stats = []
         
-        for row in result:
+        for row in rows:
+            if row[1] is None:
+                continue
             table_stats.append({
                 "schema": row[0],
                 "table": row[1],
@@ -474,15 +557,7 @@ async def get_database_performance(db: Session = Depends(get_db)):
                 "total_operations": (row[2] or 0) + (row[4] or 0) + (row[6] or 0) + (row[7] or 0) + (row[8] or 0)
             })
         
-        # Get database size information
-        size_query = text("""
-            SELECT 
-                pg_size_pretty(pg_database_size(current_database())) as database_size,
-                pg_database_size(current_database()) as database_size_bytes
-        """)
-        
-        size_result = db.execute(size_query)
-        size_row = size_result.fetchone()
+        size_row = rows[0][9:] if rows else None
         
         return {
             "timestamp": datetime.utcnow().isoformat(),
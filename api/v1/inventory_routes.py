@@ -2,10 +2,10 @@ from fastapi import APIRouter, Depends, status, Query
 from sqlalchemy.orm import Session
 from typing import Optional
 from datetime import date
-import math
 
 from . import schemas, models
 from .database import get_db
+from .filters import paginate_with_total, SortBy, SortOrder
 from .validation import (
     validate_bearer_token,
     validate_authenticated_pantry_item_access,
@@ -43,8 +43,8 @@ def list_pantry_items(
     quantity_type: Optional[str] = Query(None, description="Filter by quantity type"),
     upc: Optional[str] = Query(None, description="Filter by UPC code"),
     search: Optional[str] = Query(None, description="Search in name and description"),
-    sort_by: Optional[str] = Query("created_at", description="Sort by field (name, created_at, updated_at)"),
-    sort_order: Optional[str] = Query("desc", description="Sort order (asc, desc)"),
+    sort_by: SortBy = Query(SortBy.created_at, description="Sort by field"),
+    sort_order: SortOrder = Query(SortOrder.desc, description="Sort order"),
     current_user: models.User = Depends(validate_bearer_token),
     db: Session = Depends(get_db)
 ):
@@ -84,24 +84,14 @@ def list_pantry_items(
     else:
         base_query = base_query.order_by(sort_field.desc())
     
-    # Get total count
-    total = base_query.count()
-    
-    # Apply pagination
-    items = base_query.offset(skip).limit(limit).all()
-    
-    # Calculate pagination metadata
-    page = (skip // limit) + 1
-    pages = math.ceil(total / limit) if total > 0 else 1
+    # Fetch the page and total count together
+    items, total = paginate_with_total(base_query, skip, limit)
     
     return schemas.PaginatedPantryItemsResponse(
         items=items,
         total=total,
-        page=page,
-        per_page=limit,
-        pages=pages,
-        has_next=skip + limit < total,
-        has_prev=skip > 0
+        skip=skip,
+        per_page=limit
     )
 
 @router.get("/pantry-items/{item_id}", response_model=schemas.PantryItem)
@@ -162,8 +152,8 @@ def list_refrigerator_items(
     quantity_type: Optional[str] = Query(None, description="Filter by quantity type"),
     upc: Optional[str] = Query(None, description="Filter by UPC code"),
     search: Optional[str] = Query(None, description="Search in name and description"),
-    sort_by: Optional[str] = Query("created_at", description="Sort by field (name, created_at, updated_at)"),
-    sort_order: Optional[str] = Query("desc", description="Sort order (asc, desc)"),
+    sort_by: SortBy = Query(SortBy.created_at, description="Sort by field"),
+    sort_order: SortOrder = Query(SortOrder.desc, description="Sort order"),
     current_user: models.User = Depends(validate_bearer_token),
     db: Session = Depends(get_db)
 ):
@@ -203,24 +193,14 @@ def list_refrigerator_items(
     else:
         base_query = base_query.order_by(sort_field.desc())
     
-    # Get total count
-    total = base_query.count()
-    
-    # Apply pagination
-    items = base_query.offset(skip).limit(limit).all()
-    
-    # Calculate pagination metadata
-    page = (skip // limit) + 1
-    pages = math.ceil(total / limit) if total > 0 else 1
+    # Fetch the page and total count together
+    items, total = paginate_with_total(base_query, skip, limit)
     
     return schemas.PaginatedRefrigeratorItemsResponse(
         items=items,
         total=total,
-        page=page,
-        per_page=limit,
-        pages=pages,
-        has_next=skip + limit < total,
-        has_prev=skip > 0
+        skip=skip,
+        per_page=limit
     )
 
 @router.get("/refrigerator-items/{item_id}", response_model=schemas.RefrigeratorItem)
@@ -281,8 +261,8 @@ def list_freezer_items(
     quantity_type: Optional[str] = Query(None, description="Filter by quantity type"),
     upc: Optional[str] = Query(None, description="Filter by UPC code"),
     search: Optional[str] = Query(None, description="Search in name and description"),
-    sort_by: Optional[str] = Query("created_at", description="Sort by field (name, created_at, updated_at)"),
-    sort_order: Optional[str] = Query("desc", description="Sort order (asc, desc)"),
+    sort_by: SortBy = Query(SortBy.created_at, description="Sort by field"),
+    sort_order: SortOrder = Query(SortOrder.desc, description="Sort order"),
     current_user: models.User = Depends(validate_bearer_token),
     db: Session = Depends(get_db)
 ):
@@ -322,24 +302,14 @@ def list_freezer_items(
     else:
         base_query = base_query.order_by(sort_field.desc())
     
-    # Get total count
-    total = base_query.count()
-    
-    # Apply pagination
-    items = base_query.offset(skip).limit(limit).all()
-    
-    # Calculate pagination metadata
-    page = (skip // limit) + 1
-    pages = math.ceil(total / limit) if total > 0 else 1
+    # Fetch the page and total count together
+    items, total = paginate_with_total(base_query, skip, limit)
     
     return schemas.PaginatedFreezerItemsResponse(
         items=items,
         total=total,
-        page=page,
-        per_page=limit,
-        pages=pages,
-        has_next=skip + limit < total,
-        has_prev=skip > 0
+        skip=skip,
+        per_page=limit
     )
 
 @router.get("/freezer-items/{item_id}", response_model=schemas.FreezerItem)
@@ -1,17 +1,72 @@
 from fastapi import Request, Response
+from fastapi.concurrency import run_in_threadpool
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Iterable
+from array import array
+from bisect import bisect_left
+import heapq
+from itertools import islice
 import time
 import psutil
 import logging
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
 from threading import Lock
 import asyncio
-from dataclasses import dataclass, asdict
+from contextvars import ContextVar
+from os import urandom
+from dataclasses import dataclass, field, asdict
+from functools import lru_cache
 import json
 
 logger = logging.getLogger(__name__)
 
+EPOCH = datetime(1970, 1, 1)
+
+# Id of the request being served, bound by MonitoringMiddleware so error
+# responses and request logs raised within one request share it (and stored
+# as request.state.request_id)
+current_request_id: ContextVar[str] = ContextVar("request_id", default="")
+
+MB = 1024 * 1024
+GB = 1024 * MB
+
+# Disk usage changes slowly and statvfs is a filesystem call, so it is re-read
+# at most once per DISK_USAGE_TTL seconds
+DISK_USAGE_TTL = 30
+
+@lru_cache(maxsize=1)
+def _disk_usage(period: int):
+    return psutil.disk_usage('/')
+
+def disk_usage():
+    """psutil.disk_usage('/'), refreshed once per DISK_USAGE_TTL period"""
+    return _disk_usage(int(time.monotonic() // DISK_USAGE_TTL))
+
+# Prometheus path label of requests that matched no route
+UNMATCHED_ROUTE = "unmatched"
+
+def route_label(scope) -> str:
+    """Path template of the route that served a request, for metric labels
+    
+    Labelling by the raw path would give every id, and every 404 probe, its
+    own series that is never removed.
+    """
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    # Plain Starlette routes (the docs pages) take no path parameters
+    if "endpoint" in scope and not scope.get("path_params"):
+        return scope["path"]
+    return UNMATCHED_ROUTE
+
+def to_epoch(dt: datetime) -> float:
+    """Seconds since the Unix epoch for a naive UTC datetime"""
+    return (dt - EPOCH).total_seconds()
+
+def _label(value: str) -> str:
+    """Escape a Prometheus label value"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
 @dataclass
 class RequestMetrics:
     """Request metrics data structure"""
@@ -22,6 +77,8 @@ class RequestMetrics:
     duration: float
     user_id: Optional[int] = None
     error_code: Optional[str] = None
+    # Path template of the matched route (see route_label)
+    route: Optional[str] = None
 
 @dataclass
 class SystemMetrics:
@@ -35,14 +92,34 @@ class SystemMetrics:
     request_count: int
     error_count: int
     avg_response_time: float
+    # Formatted once when recorded; /metrics/system returns the same history
+    # entries on every poll
+    timestamp_iso: str = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        self.timestamp_iso = self.timestamp.isoformat()
 
 class MetricsCollector:
     """Centralized metrics collection and storage"""
     
+    # Per-minute request rollups cover the longest dashboard window (7 days)
+    ROLLUP_MINUTES = 7 * 24 * 60
+    
+    # Per-minute error breakdowns cover the /metrics/errors window (1 hour)
+    ERROR_BREAKDOWN_MINUTES = 60
+    
+    # Users idle for longer are dropped from user_activity
+    USER_ACTIVITY_RETENTION = timedelta(days=7)
+    
+    # Upper bounds (seconds) of the request latency histogram buckets
+    LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    
     def __init__(self, max_history: int = 10000):
         self.max_history = max_history
         self.request_metrics: deque = deque(maxlen=max_history)
         self.system_metrics: deque = deque(maxlen=1000)  # Keep last 1000 system snapshots
+        self._system_ts: deque = deque(maxlen=1000)  # Epoch seconds, parallel to system_metrics
+        self.last_cpu_percent: Optional[float] = None  # Kept current by cpu_sampler_task
         self.error_counts: Dict[str, int] = defaultdict(int)
         self.endpoint_stats: Dict[str, Dict] = defaultdict(lambda: {
             'count': 0,
@@ -50,11 +127,34 @@ class MetricsCollector:
             'error_count': 0,
             'last_accessed': None
         })
-        self.user_activity: Dict[int, Dict] = defaultdict(lambda: {
-            'request_count': 0,
-            'last_activity': None,
-            'error_count': 0
-        })
+        # Least recently active user first, so active users are read from the
+        # end and idle ones trimmed from the front
+        self.user_activity: "OrderedDict[int, Dict]" = OrderedDict()
+        # Columnar ring buffers of the fields the dashboards aggregate, so
+        # window scans touch packed numbers instead of RequestMetrics objects
+        self._ts = array('d', bytes(8 * max_history))
+        self._status = array('H', bytes(2 * max_history))
+        self._dur = array('d', bytes(8 * max_history))
+        self._write_index = 0
+        self._series_len = 0
+        # One slot per minute, reused on wrap; a slot is only valid when its
+        # stored epoch minute matches the minute being read
+        self._rollup_minute = array('q', bytes(8 * self.ROLLUP_MINUTES))
+        self._rollup_count = array('L', bytes(array('L').itemsize * self.ROLLUP_MINUTES))
+        self._rollup_errors = array('L', bytes(array('L').itemsize * self.ROLLUP_MINUTES))
+        self._rollup_duration = array('d', bytes(8 * self.ROLLUP_MINUTES))
+        self._rollup_server_errors = array('L', bytes(array('L').itemsize * self.ROLLUP_MINUTES))
+        # [epoch minute, {status: count}, {error code: count}] per minute that
+        # saw an error, plus the details of the latest errors
+        self._error_minutes: deque = deque(maxlen=self.ERROR_BREAKDOWN_MINUTES)
+        self.recent_errors: deque = deque(maxlen=20)
+        # Prometheus-style counters: requests per (method, path, status) and
+        # per-bucket latency counts per (method, path), last slot is +Inf
+        self.status_counts: Dict[Tuple[str, str, int], int] = defaultdict(int)
+        self.latency_histograms: Dict[Tuple[str, str], List[int]] = defaultdict(
+            lambda: [0] * (len(self.LATENCY_BUCKETS) + 1)
+        )
+        self.latency_sums: Dict[Tuple[str, str], float] = defaultdict(float)
         self._lock = Lock()
         self.start_time = datetime.utcnow()
     
@@ -63,6 +163,45 @@ class MetricsCollector:
         with self._lock:
             self.request_metrics.append(metrics)
             
+            i = self._write_index
+            ts = to_epoch(metrics.timestamp)
+            self._ts[i] = ts
+            self._status[i] = metrics.status_code
+            self._dur[i] = metrics.duration
+            self._write_index = (i + 1) % self.max_history
+            if self._series_len < self.max_history:
+                self._series_len += 1
+            
+            # Update the per-minute rollup
+            minute = int(ts // 60)
+            slot = minute % self.ROLLUP_MINUTES
+            if self._rollup_minute[slot] != minute:
+                self._rollup_minute[slot] = minute
+                self._rollup_count[slot] = 0
+                self._rollup_errors[slot] = 0
+                self._rollup_duration[slot] = 0.0
+                self._rollup_server_errors[slot] = 0
+            self._rollup_count[slot] += 1
+            self._rollup_duration[slot] += metrics.duration
+            if metrics.status_code >= 400:
+                self._rollup_errors[slot] += 1
+                if metrics.status_code >= 500:
+                    self._rollup_server_errors[slot] += 1
+                
+                if not self._error_minutes or self._error_minutes[-1][0] != minute:
+                    self._error_minutes.append([minute, defaultdict(int), defaultdict(int)])
+                _, status_breakdown, error_code_breakdown = self._error_minutes[-1]
+                status_breakdown[metrics.status_code] += 1
+                if metrics.error_code:
+                    error_code_breakdown[metrics.error_code] += 1
+                self.recent_errors.append(metrics)
+            
+            # Update the Prometheus counters
+            labels = (metrics.method, metrics.route or UNMATCHED_ROUTE)
+            self.status_counts[labels + (metrics.status_code,)] += 1
+            self.latency_histograms[labels][bisect_left(self.LATENCY_BUCKETS, metrics.duration)] += 1
+            self.latency_sums[labels] += metrics.duration
+            
             # Update endpoint statistics
             endpoint_key = f"{metrics.method} {metrics.path}"
             stats = self.endpoint_stats[endpoint_key]
@@ -77,32 +216,222 @@ class MetricsCollector:
             
             # Update user activity
             if metrics.user_id:
-                user_stats = self.user_activity[metrics.user_id]
+                user_stats = self.user_activity.get(metrics.user_id)
+                if user_stats is None:
+                    user_stats = self.user_activity[metrics.user_id] = {
+                        'request_count': 0,
+                        'last_activity': None,
+                        'error_count': 0
+                    }
+                else:
+                    self.user_activity.move_to_end(metrics.user_id)
                 user_stats['request_count'] += 1
                 user_stats['last_activity'] = metrics.timestamp
                 if metrics.status_code >= 400:
                     user_stats['error_count'] += 1
+                
+                # Trim users idle past the retention window; the loop always
+                # stops at the user just recorded
+                idle_before = metrics.timestamp - self.USER_ACTIVITY_RETENTION
+                while next(iter(self.user_activity.values()))['last_activity'] < idle_before:
+                    self.user_activity.popitem(last=False)
+    
+    def snapshot_request_metrics(self) -> Tuple[RequestMetrics, ...]:
+        """Recorded requests, oldest first, copied under the lock"""
+        with self._lock:
+            return tuple(self.request_metrics)
+    
+    def snapshot_endpoint_stats(self) -> List[Tuple[str, Dict]]:
+        """Copies of the per-endpoint stats, taken under the lock
+        
+        The request middleware updates endpoint_stats from other threads, so
+        iterating the live dict can fail with a size-changed RuntimeError.
+        """
+        with self._lock:
+            return [(endpoint, stats.copy()) for endpoint, stats in self.endpoint_stats.items()]
+    
+    def top_endpoint_stats(self, limit: int) -> List[Tuple[str, Dict]]:
+        """Copies of the stats of the ``limit`` busiest endpoints, busiest first"""
+        with self._lock:
+            top = heapq.nlargest(limit, self.endpoint_stats.items(), key=lambda item: item[1]['count'])
+            return [(endpoint, stats.copy()) for endpoint, stats in top]
+    
+    def snapshot_active_users(self, since: datetime) -> List[Tuple[int, Dict]]:
+        """Copies of the stats of users active since a point in time, most
+        recently active first; idle users are never visited"""
+        active = []
+        with self._lock:
+            for user_id in reversed(self.user_activity):
+                stats = self.user_activity[user_id]
+                if stats['last_activity'] < since:
+                    break
+                active.append((user_id, stats.copy()))
+        return active
+    
+    def render_prometheus(self) -> str:
+        """Request counters and latency histograms in the Prometheus text format"""
+        with self._lock:
+            status_counts = list(self.status_counts.items())
+            histograms = [(labels, list(counts)) for labels, counts in self.latency_histograms.items()]
+            latency_sums = dict(self.latency_sums)
+        
+        lines = [
+            "# HELP http_requests_total Total HTTP requests.",
+            "# TYPE http_requests_total counter",
+        ]
+        for (method, path, status_code), count in status_counts:
+            lines.append(
+                f'http_requests_total{{method="{_label(method)}",path="{_label(path)}",status="{status_code}"}} {count}'
+            )
+        
+        lines += [
+            "# HELP http_request_duration_seconds HTTP request latency in seconds.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        bounds = [f"{bound:g}" for bound in self.LATENCY_BUCKETS] + ["+Inf"]
+        for (method, path), counts in histograms:
+            series = f'method="{_label(method)}",path="{_label(path)}"'
+            cumulative = 0
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                lines.append(f'http_request_duration_seconds_bucket{{{series},le="{bound}"}} {cumulative}')
+            lines.append(f"http_request_duration_seconds_sum{{{series}}} {latency_sums[(method, path)]}")
+            lines.append(f"http_request_duration_seconds_count{{{series}}} {cumulative}")
+        
+        return "\n".join(lines) + "\n"
+    
+    def get_request_series(self) -> Tuple[array, array, array]:
+        """Oldest-first copies of the timestamp, status code and duration columns
+        
+        Timestamps are epoch seconds in completion order, so they can be
+        searched with bisect.
+        """
+        with self._lock:
+            return self._ordered_series()
+    
+    def _ordered_series(self) -> Tuple[array, array, array]:
+        # Caller holds the lock
+        n, i = self._series_len, self._write_index
+        if n < self.max_history:
+            return self._ts[:n], self._status[:n], self._dur[:n]
+        return (
+            self._ts[i:] + self._ts[:i],
+            self._status[i:] + self._status[:i],
+            self._dur[i:] + self._dur[:i]
+        )
+    
+    def get_request_window(self, since: datetime) -> Tuple[List[RequestMetrics], array, array]:
+        """Requests recorded since a point in time, with their status code and
+        duration columns, oldest first
+        
+        request_metrics and the column ring buffers hold the same requests in
+        the same order, so the window is found by bisecting the timestamp
+        column instead of comparing every request's datetime.
+        """
+        with self._lock:
+            timestamps, status_codes, durations = self._ordered_series()
+            first = bisect_left(timestamps, to_epoch(since))
+            return list(islice(self.request_metrics, first, None)), status_codes[first:], durations[first:]
+    
+    def get_request_rollup(self, first_minute: int, bucket_minutes: int, bucket_count: int) -> List[Tuple[int, int, float]]:
+        """Request count, error count and total duration per bucket
+        
+        Buckets are bucket_minutes wide and start at first_minute (epoch
+        minutes); they are summed from the per-minute rollup, so the cost
+        depends on the window length rather than on traffic.
+        """
+        buckets = []
+        with self._lock:
+            minute = first_minute
+            for _ in range(bucket_count):
+                count = errors = 0
+                duration = 0.0
+                for minute in range(minute, minute + bucket_minutes):
+                    slot = minute % self.ROLLUP_MINUTES
+                    if self._rollup_minute[slot] == minute:
+                        count += self._rollup_count[slot]
+                        errors += self._rollup_errors[slot]
+                        duration += self._rollup_duration[slot]
+                minute += 1
+                buckets.append((count, errors, duration))
+        return buckets
+    
+    def get_recent_totals(self, minutes: int) -> Tuple[int, int]:
+        """Request and 5xx counts over the current and previous minutes
+        
+        Read from the per-minute rollup, so the cost depends on the window
+        length rather than on traffic.
+        """
+        last_minute = int(to_epoch(datetime.utcnow()) // 60)
+        count = server_errors = 0
+        with self._lock:
+            for minute in range(last_minute - minutes + 1, last_minute + 1):
+                slot = minute % self.ROLLUP_MINUTES
+                if self._rollup_minute[slot] == minute:
+                    count += self._rollup_count[slot]
+                    server_errors += self._rollup_server_errors[slot]
+        return count, server_errors
+    
+    def get_error_breakdown(self, minutes: int) -> Tuple[Dict[int, int], Dict[str, int], List[RequestMetrics]]:
+        """Error counts by status and error code over the current and previous
+        minutes (at most ERROR_BREAKDOWN_MINUTES), and the latest errors"""
+        first_minute = int(to_epoch(datetime.utcnow()) // 60) - minutes + 1
+        status_breakdown: Dict[int, int] = defaultdict(int)
+        error_code_breakdown: Dict[str, int] = defaultdict(int)
+        with self._lock:
+            for minute, statuses, error_codes in self._error_minutes:
+                if minute < first_minute:
+                    continue
+                for status_code, count in statuses.items():
+                    status_breakdown[status_code] += count
+                for error_code, count in error_codes.items():
+                    error_code_breakdown[error_code] += count
+            first_epoch = first_minute * 60
+            recent_errors = [m for m in self.recent_errors if to_epoch(m.timestamp) >= first_epoch]
+        return dict(status_breakdown), dict(error_code_breakdown), recent_errors
+    
+    def get_request_stats(self, since: datetime) -> Tuple[int, int, float]:
+        """Request count, error count and total duration since a point in time"""
+        timestamps, status_codes, durations = self.get_request_series()
+        first = bisect_left(timestamps, to_epoch(since))
+        return (
+            len(timestamps) - first,
+            sum(1 for code in status_codes[first:] if code >= 400),
+            sum(durations[first:])
+        )
+    
+    def snapshot_system_metrics(self) -> Tuple[SystemMetrics, ...]:
+        """Recorded system snapshots, oldest first, copied under the lock"""
+        with self._lock:
+            return tuple(self.system_metrics)
+    
+    def get_system_metrics(self, since: datetime) -> List[SystemMetrics]:
+        """System snapshots recorded at or after a point in time, oldest first"""
+        with self._lock:
+            first = bisect_left(self._system_ts, to_epoch(since))
+            return list(islice(self.system_metrics, first, None))
+    
+    def current_cpu_percent(self) -> float:
+        """Latest sampled CPU usage, without blocking to measure it"""
+        if self.last_cpu_percent is not None:
+            return self.last_cpu_percent
+        # Sampler has not reported yet: usage since the previous call
+        return psutil.cpu_percent(interval=None)
     
     def record_system_metrics(self):
         """Record current system metrics"""
         try:
-            cpu_percent = psutil.cpu_percent(interval=None)
+            cpu_percent = self.current_cpu_percent()
             memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            disk = disk_usage()
             
             # Count recent requests (last minute)
             now = datetime.utcnow()
             one_minute_ago = now - timedelta(minutes=1)
             
-            recent_requests = [
-                m for m in self.request_metrics 
-                if m.timestamp >= one_minute_ago
-            ]
-            
-            request_count = len(recent_requests)
-            error_count = sum(1 for m in recent_requests if m.status_code >= 400)
+            request_count, error_count, total_duration = self.get_request_stats(one_minute_ago)
             avg_response_time = (
-                sum(m.duration for m in recent_requests) / request_count
+                total_duration / request_count
                 if request_count > 0 else 0.0
             )
             
@@ -110,7 +439,7 @@ class MetricsCollector:
                 timestamp=now,
                 cpu_percent=cpu_percent,
                 memory_percent=memory.percent,
-                memory_mb=memory.used / 1024 / 1024,
+                memory_mb=memory.used / MB,
                 disk_percent=disk.percent,
                 active_connections=len(psutil.net_connections()),
                 request_count=request_count,
@@ -120,6 +449,7 @@ class MetricsCollector:
             
             with self._lock:
                 self.system_metrics.append(metrics)
+                self._system_ts.append(to_epoch(now))
                 
             logger.debug(f"System metrics recorded: CPU {cpu_percent}%, Memory {memory.percent}%")
             
@@ -137,13 +467,7 @@ class MetricsCollector:
             
             # Calculate error rates
             five_minutes_ago = now - timedelta(minutes=5)
-            recent_requests = [
-                m for m in self.request_metrics 
-                if m.timestamp >= five_minutes_ago
-            ]
-            
-            total_requests = len(recent_requests)
-            error_requests = sum(1 for m in recent_requests if m.status_code >= 400)
+            total_requests, error_requests, _ = self.get_request_stats(five_minutes_ago)
             error_rate = error_requests / total_requests if total_requests > 0 else 0.0
             
             # Determine overall health
@@ -190,23 +514,20 @@ class MetricsCollector:
             start_time = now - timedelta(hours=hours)
             
             # Filter metrics by time period
-            period_requests = [
-                m for m in self.request_metrics 
-                if m.timestamp >= start_time
-            ]
+            period_requests, status_codes, durations = self.get_request_window(start_time)
             
             if not period_requests:
                 return {"message": "No data available for the specified period"}
             
-            # Calculate statistics
+            # Calculate statistics from the packed columns
             total_requests = len(period_requests)
-            error_requests = sum(1 for m in period_requests if m.status_code >= 400)
+            error_requests = sum(1 for code in status_codes if code >= 400)
             error_rate = error_requests / total_requests
             
-            response_times = [m.duration for m in period_requests]
-            avg_response_time = sum(response_times) / len(response_times)
-            p95_response_time = sorted(response_times)[int(len(response_times) * 0.95)]
-            p99_response_time = sorted(response_times)[int(len(response_times) * 0.99)]
+            response_times = sorted(durations)
+            avg_response_time = sum(response_times) / total_requests
+            p95_response_time = response_times[int(total_requests * 0.95)]
+            p99_response_time = response_times[int(total_requests * 0.99)]
             
             # Top endpoints by request count
             endpoint_counts = defaultdict(int)
@@ -259,6 +580,12 @@ class MonitoringMiddleware:
             return
         
         start_time = time.time()
+        request_id = urandom(16).hex()
+        request_id_token = current_request_id.set(request_id)
+        # Also kept on request.state: the handler for unhandled exceptions
+        # runs in ServerErrorMiddleware, after this middleware has reset the
+        # context variable
+        scope.setdefault("state", {})["request_id"] = request_id
         request_info = {
             "method": scope["method"],
             "path": scope["path"],
@@ -290,7 +617,8 @@ class MonitoringMiddleware:
                 method=request_info["method"],
                 path=request_info["path"],
                 status_code=response_info["status_code"],
-                duration=duration
+                duration=duration,
+                route=route_label(scope)
             )
             
             metrics_collector.record_request(metrics)
@@ -304,9 +632,11 @@ class MonitoringMiddleware:
                     "path": request_info["path"],
                     "status_code": response_info["status_code"],
                     "duration": duration,
-                    "client_ip": request_info["client"][0] if request_info["client"] else None
+                    "client_ip": request_info["client"][0] if request_info["client"] else None,
+                    "request_id": request_id
                 }
             )
+            current_request_id.reset(request_id_token)
 
 class AlertManager:
     """Alert manager for monitoring thresholds and notifications"""
@@ -395,13 +725,27 @@ async def system_metrics_task():
     """Background task to collect system metrics and check alerts"""
     while True:
         try:
-            metrics_collector.record_system_metrics()
+            # psutil reads /proc (net_connections() walks every socket), so
+            # sampling runs on a worker thread rather than the event loop
+            await run_in_threadpool(metrics_collector.record_system_metrics)
             alert_manager.check_alerts()
             await asyncio.sleep(60)  # Run every minute
         except Exception as e:
             logger.error(f"System metrics task failed: {e}")
             await asyncio.sleep(60)
 
+async def cpu_sampler_task(interval: float = 1.0):
+    """Background task keeping metrics_collector.last_cpu_percent current
+    
+    cpu_percent(interval=None) reports usage since the previous call on the
+    same thread, so calling it every ``interval`` seconds gives the same
+    figure as the blocking cpu_percent(interval) without stalling the loop.
+    """
+    psutil.cpu_percent(interval=None)
+    while True:
+        await asyncio.sleep(interval)
+        metrics_collector.last_cpu_percent = psutil.cpu_percent(interval=None)
+
 class PerformanceProfiler:
     """Performance profiler for detailed operation timing"""
     
@@ -429,6 +773,21 @@ class PerformanceProfiler:
                 }
             )
     
+    @staticmethod
+    def _summarize(times: List[float]) -> Dict[str, float]:
+        """Summary statistics for a non-empty list of timings"""
+        times_sorted = sorted(times)
+        count = len(times_sorted)
+        return {
+            "count": count,
+            "avg": sum(times_sorted) / count,
+            "min": times_sorted[0],
+            "max": times_sorted[-1],
+            "p50": times_sorted[count // 2],
+            "p95": times_sorted[int(count * 0.95)],
+            "p99": times_sorted[int(count * 0.99)]
+        }
+    
     def get_operation_stats(self, operation: str) -> Dict[str, float]:
         """Get statistics for a specific operation"""
         with self._lock:
@@ -437,20 +796,32 @@ class PerformanceProfiler:
             if not times:
                 return {"count": 0}
             
-            times_sorted = sorted(times)
+            return self._summarize(times)
+    
+    def get_many(self, operations: Iterable[str]) -> Dict[str, Dict[str, float]]:
+        """Get statistics for several operations under one lock acquisition
+        
+        Operations with no recorded timings are left out.
+        """
+        with self._lock:
             return {
-                "count": len(times),
-                "avg": sum(times) / len(times),
-                "min": min(times),
-                "max": max(times),
-                "p50": times_sorted[len(times_sorted) // 2],
-                "p95": times_sorted[int(len(times_sorted) * 0.95)],
-                "p99": times_sorted[int(len(times_sorted) * 0.99)]
+                operation: self._summarize(times)
+                for operation in operations
+                if (times := self.operation_times.get(operation))
             }
 
 # Global performance profiler instance
 performance_profiler = PerformanceProfiler()
 
+# Operations reported by the performance metrics and dashboard endpoints
+COMMON_OPERATIONS = (
+    "database_query",
+    "authentication",
+    "shopping_list_create",
+    "shopping_list_update",
+    "user_registration",
+)
+
 def profile_operation(operation_name: str):
     """Decorator to profile operation performance"""
     def decorator(func):
@@ -2,10 +2,9 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import date
-import math
 from . import schemas, models
 from .database import get_db
-from .filters import filter_shopping_lists, filter_shopping_list_items
+from .filters import filter_shopping_lists, filter_shopping_list_items, paginate_with_total, paginate_after_cursor, cursor_after, SortOptions, SortBy, ShoppingListItemSortBy, SortOrder
 from .validation import (
     validate_bearer_token,
     validate_authenticated_shopping_list_access,
@@ -34,14 +33,16 @@ def create_shopping_list(
 def list_shopping_lists(
     skip: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of items to return"),
+    cursor: Optional[str] = Query(None, description="Continue after a previous page's next_cursor (skip is ignored)"),
     name: Optional[str] = Query(None, description="Filter by name (partial match)"),
+    name_prefix: Optional[str] = Query(None, description="Filter by name prefix (case-insensitive)"),
     kitchen_id: Optional[int] = Query(None, description="Filter by kitchen ID"),
     search: Optional[str] = Query(None, description="Search in name and description"),
     date_from: Optional[date] = Query(None, description="Filter from date (YYYY-MM-DD)"),
     date_to: Optional[date] = Query(None, description="Filter to date (YYYY-MM-DD)"),
     has_items: Optional[bool] = Query(None, description="Filter by whether list has items"),
-    sort_by: Optional[str] = Query("created_at", description="Sort by field (name, created_at, updated_at)"),
-    sort_order: Optional[str] = Query("desc", description="Sort order (asc, desc)"),
+    sort_by: SortBy = Query(SortBy.created_at, description="Sort by field"),
+    sort_order: SortOrder = Query(SortOrder.desc, description="Sort order"),
     current_user: models.User = Depends(validate_bearer_token),
     db: Session = Depends(get_db)
 ):
@@ -57,6 +58,7 @@ def list_shopping_lists(
     # Apply filters
     filters = {
         'name': name,
+        'name_prefix': name_prefix,
         'kitchen_id': kitchen_id,
         'search': search,
         'date_from': date_from,
@@ -64,29 +66,35 @@ def list_shopping_lists(
         'has_items': has_items,
         'sort_by': sort_by,
         'sort_order': sort_order,
+        'cursor': cursor,
+        'include_items': True,  # Serialized with each list
         'kitchen_ids': kitchen_ids  # Ensure we only get user's lists
     }
     
     filtered_query = filter_shopping_lists(base_query, **filters)
     
-    # Get total count for pagination
-    total = filtered_query.count()
+    if cursor is not None:
+        shopping_lists, next_cursor = paginate_after_cursor(
+            filtered_query, limit, sort_by, SortOptions.SHOPPING_LIST_SORT_FIELDS
+        )
+        return schemas.PaginatedShoppingListsResponse(
+            items=shopping_lists, per_page=limit, next_cursor=next_cursor
+        )
     
-    # Apply pagination
-    shopping_lists = filtered_query.offset(skip).limit(limit).all()
+    # Fetch the page and total count together
+    shopping_lists, total = paginate_with_total(filtered_query, skip, limit)
     
-    # Calculate pagination metadata
-    page = (skip // limit) + 1
-    pages = math.ceil(total / limit) if total > 0 else 1
+    # Lets a client switch to keyset paging from any offset page
+    next_cursor = None
+    if shopping_lists and skip + len(shopping_lists) < total:
+        next_cursor = cursor_after(shopping_lists[-1], sort_by, SortOptions.SHOPPING_LIST_SORT_FIELDS)
     
     return schemas.PaginatedShoppingListsResponse(
         items=shopping_lists,
         total=total,
-        page=page,
+        skip=skip,
         per_page=limit,
-        pages=pages,
-        has_next=skip + limit < total,
-        has_prev=skip > 0
+        next_cursor=next_cursor
     )
 
 @router.get("/shopping-lists/{shopping_list_id}", response_model=schemas.ShoppingList)
@@ -139,15 +147,17 @@ def create_shopping_list_item(
 def list_shopping_list_items(
     skip: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of items to return"),
+    cursor: Optional[str] = Query(None, description="Continue after a previous page's next_cursor (skip is ignored)"),
     name: Optional[str] = Query(None, description="Filter by item name (partial match)"),
+    name_prefix: Optional[str] = Query(None, description="Filter by name prefix (case-insensitive)"),
     shopping_list_id: Optional[int] = Query(None, description="Filter by shopping list ID"),
     kitchen_id: Optional[int] = Query(None, description="Filter by kitchen ID"),
     quantity_contains: Optional[str] = Query(None, description="Filter by quantity text (partial match)"),
     search: Optional[str] = Query(None, description="Search in name and quantity"),
     date_from: Optional[date] = Query(None, description="Filter from date (YYYY-MM-DD)"),
     date_to: Optional[date] = Query(None, description="Filter to date (YYYY-MM-DD)"),
-    sort_by: Optional[str] = Query("created_at", description="Sort by field (name, quantity, created_at, updated_at)"),
-    sort_order: Optional[str] = Query("desc", description="Sort order (asc, desc)"),
+    sort_by: ShoppingListItemSortBy = Query(ShoppingListItemSortBy.created_at, description="Sort by field"),
+    sort_order: SortOrder = Query(SortOrder.desc, description="Sort order"),
     current_user: models.User = Depends(validate_bearer_token),
     db: Session = Depends(get_db)
 ):
@@ -169,6 +179,7 @@ def list_shopping_list_items(
     # Apply filters
     filters = {
         'name': name,
+        'name_prefix': name_prefix,
         'shopping_list_id': shopping_list_id,
         'kitchen_id': kitchen_id,
         'quantity_contains': quantity_contains,
@@ -177,29 +188,34 @@ def list_shopping_list_items(
         'date_to': date_to,
         'sort_by': sort_by,
         'sort_order': sort_order,
+        'cursor': cursor,
         'shopping_list_ids': shopping_list_ids  # Ensure we only get user's items
     }
     
     filtered_query = filter_shopping_list_items(base_query, **filters)
     
-    # Get total count for pagination
-    total = filtered_query.count()
+    if cursor is not None:
+        items, next_cursor = paginate_after_cursor(
+            filtered_query, limit, sort_by, SortOptions.SHOPPING_LIST_ITEM_SORT_FIELDS
+        )
+        return schemas.PaginatedShoppingListItemsResponse(
+            items=items, per_page=limit, next_cursor=next_cursor
+        )
     
-    # Apply pagination
-    items = filtered_query.offset(skip).limit(limit).all()
+    # Fetch the page and total count together
+    items, total = paginate_with_total(filtered_query, skip, limit)
     
-    # Calculate pagination metadata
-    page = (skip // limit) + 1
-    pages = math.ceil(total / limit) if total > 0 else 1
+    # Lets a client switch to keyset paging from any offset page
+    next_cursor = None
+    if items and skip + len(items) < total:
+        next_cursor = cursor_after(items[-1], sort_by, SortOptions.SHOPPING_LIST_ITEM_SORT_FIELDS)
     
     return schemas.PaginatedShoppingListItemsResponse(
         items=items,
         total=total,
-        page=page,
+        skip=skip,
         per_page=limit,
-        pages=pages,
-        has_next=skip + limit < total,
-        has_prev=skip > 0
+        next_cursor=next_cursor
     )
 
 @router.get("/shopping-list-items/{item_id}", response_model=schemas.ShoppingListItem)
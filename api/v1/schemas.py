@@ -1,5 +1,5 @@
 from __future__ import annotations
-from pydantic import BaseModel, EmailStr, validator
+from pydantic import BaseModel, EmailStr, Field, validator, computed_field
 from typing import List, Optional, Union, Any
 from datetime import datetime, date
 import re
@@ -81,6 +81,17 @@ class Kitchen(KitchenBase):
     class Config:
         from_attributes = True
 
+class KitchenSummary(BaseModel):
+    """Kitchen as shown in listings, without description or shopping lists"""
+    id: int
+    name: str
+    owner_id: int
+    created_at: datetime
+    updated_at: datetime
+    
+    class Config:
+        from_attributes = True
+
 # Shopping List schemas
 class ShoppingListBase(BaseModel):
     name: str
@@ -158,40 +169,56 @@ class ShoppingListItemFilters(BaseModel):
 
 # Pagination response schema
 class PaginatedResponse(BaseModel):
+    """Page of results; page/pages/has_next/has_prev are derived from the counts
+    
+    skip is the offset the page was fetched at and is not serialized; it need
+    not be a multiple of per_page. Cursor pages carry no skip, total or page
+    number (they are not counted) and report has_next through next_cursor
+    instead.
+    """
     items: List[Any]
-    total: int
-    page: int
+    total: Optional[int] = None
+    skip: Optional[int] = Field(None, exclude=True)
     per_page: int
-    pages: int
-    has_next: bool
-    has_prev: bool
+    next_cursor: Optional[str] = None
+    
+    @computed_field
+    @property
+    def page(self) -> Optional[int]:
+        if self.skip is None:
+            return None
+        return self.skip // self.per_page + 1
+    
+    @computed_field
+    @property
+    def pages(self) -> Optional[int]:
+        if self.total is None:
+            return None
+        return -(-self.total // self.per_page) if self.total else 1
+    
+    @computed_field
+    @property
+    def has_next(self) -> bool:
+        if self.total is None:
+            return self.next_cursor is not None
+        return self.skip + self.per_page < self.total
+    
+    @computed_field
+    @property
+    def has_prev(self) -> bool:
+        return self.skip is None or self.skip > 0
 
-class PaginatedKitchensResponse(BaseModel):
+class PaginatedKitchensResponse(PaginatedResponse):
     items: List[Kitchen]
-    total: int
-    page: int
-    per_page: int
-    pages: int
-    has_next: bool
-    has_prev: bool
 
-class PaginatedShoppingListsResponse(BaseModel):
+class PaginatedKitchenSummaryResponse(PaginatedResponse):
+    items: List[KitchenSummary]
+
+class PaginatedShoppingListsResponse(PaginatedResponse):
     items: List[ShoppingList]
-    total: int
-    page: int
-    per_page: int
-    pages: int
-    has_next: bool
-    has_prev: bool
 
-class PaginatedShoppingListItemsResponse(BaseModel):
+class PaginatedShoppingListItemsResponse(PaginatedResponse):
     items: List[ShoppingListItem]
-    total: int
-    page: int
-    per_page: int
-    pages: int
-    has_next: bool
-    has_prev: bool
 
 # Pantry Item schemas
 class PantryItemBase(BaseModel):
@@ -278,32 +305,14 @@ class FreezerItem(FreezerItemBase):
         from_attributes = True
 
 # Paginated response schemas for new items
-class PaginatedPantryItemsResponse(BaseModel):
+class PaginatedPantryItemsResponse(PaginatedResponse):
     items: List[PantryItem]
-    total: int
-    page: int
-    per_page: int
-    pages: int
-    has_next: bool
-    has_prev: bool
 
-class PaginatedRefrigeratorItemsResponse(BaseModel):
+class PaginatedRefrigeratorItemsResponse(PaginatedResponse):
     items: List[RefrigeratorItem]
-    total: int
-    page: int
-    per_page: int
-    pages: int
-    has_next: bool
-    has_prev: bool
 
-class PaginatedFreezerItemsResponse(BaseModel):
+class PaginatedFreezerItemsResponse(PaginatedResponse):
     items: List[FreezerItem]
-    total: int
-    page: int
-    per_page: int
-    pages: int
-    has_next: bool
-    has_prev: bool
 
 # Update forward references
 ShoppingList.model_rebuild()
\ No newline at end of file
@@ -2,12 +2,11 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from typing import Optional, List, Dict, Any
 from datetime import date
-import math
 
 from . import schemas, models
 from .database import get_db
 from .validation import validate_bearer_token
-from .filters import filter_kitchens, filter_shopping_lists, filter_shopping_list_items
+from .filters import filter_kitchens, filter_shopping_lists, filter_shopping_list_items, paginate_with_total
 
 router = APIRouter()
 
@@ -28,8 +27,10 @@ def global_search(
     
     # Search kitchens
     kitchen_query = db.query(models.Kitchen).filter(models.Kitchen.owner_id == current_user.id)
-    filtered_kitchens = filter_kitchens(kitchen_query, search=q, sort_by="name", sort_order="asc")
-    kitchen_results = filtered_kitchens.offset(skip).limit(limit).all()
+    filtered_kitchens = filter_kitchens(
+        kitchen_query, search=q, sort_by="name", sort_order="asc", include_shopping_lists=True
+    )
+    kitchen_results, kitchen_total = paginate_with_total(filtered_kitchens, skip, limit)
     
     # Search shopping lists
     shopping_list_query = db.query(models.ShoppingList).filter(
@@ -40,9 +41,10 @@ def global_search(
         search=q, 
         kitchen_ids=kitchen_ids,
         sort_by="name", 
-        sort_order="asc"
+        sort_order="asc",
+        include_items=True
     )
-    shopping_list_results = filtered_shopping_lists.offset(skip).limit(limit).all()
+    shopping_list_results, shopping_list_total = paginate_with_total(filtered_shopping_lists, skip, limit)
     
     # Search shopping list items
     user_shopping_lists = db.query(models.ShoppingList).filter(
@@ -60,22 +62,22 @@ def global_search(
         sort_by="name", 
         sort_order="asc"
     )
-    item_results = filtered_items.offset(skip).limit(limit).all()
+    item_results, item_total = paginate_with_total(filtered_items, skip, limit)
     
     return {
         "query": q,
         "results": {
             "kitchens": {
                 "items": [schemas.Kitchen.from_orm(k) for k in kitchen_results],
-                "total": filtered_kitchens.count()
+                "total": kitchen_total
             },
             "shopping_lists": {
                 "items": [schemas.ShoppingList.from_orm(sl) for sl in shopping_list_results],
-                "total": filtered_shopping_lists.count()
+                "total": shopping_list_total
             },
             "shopping_list_items": {
                 "items": [schemas.ShoppingListItem.from_orm(item) for item in item_results],
-                "total": filtered_items.count()
+                "total": item_total
             }
         }
     }
@@ -5,6 +5,7 @@ from jose import JWTError, jwt
 from jose.exceptions import ExpiredSignatureError
 from pydantic import ValidationError as PydanticValidationError
 from config import SECRET_KEY, ALGORITHM
+from auth import get_user_by_username
 from . import models, schemas
 from .permissions import ensure_kitchen_access, ensure_shopping_list_access, ensure_shopping_list_item_access
 from .database import get_db
@@ -47,8 +48,12 @@ class FreezerItemNotFoundException(ValidationException):
 # OAuth2 scheme for token extraction
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
-async def validate_bearer_token(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> models.User:
-    """Validate JWT bearer token and return user"""
+def validate_bearer_token(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> models.User:
+    """Validate JWT bearer token and return user
+    
+    Not async: FastAPI runs it in the threadpool, keeping the blocking user
+    lookup off the event loop.
+    """
     try:
         # Decode the JWT token using the secret key
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
@@ -57,8 +62,8 @@ async def validate_bearer_token(token: str = Depends(oauth2_scheme), db: Session
         if username is None:
             raise InvalidTokenException("Missing user identifier")
         
-        # Get user from database
-        user = db.query(models.User).filter(models.User.username == username).first()
+        # Get user from database (or the short-lived user cache)
+        user = get_user_by_username(username, db)
         if not user:
             raise UserNotFoundException(username)
         
@@ -4,12 +4,17 @@ from jose import JWTError, jwt
 from jose.exceptions import ExpiredSignatureError
 from passlib.context import CryptContext
 from datetime import datetime, timedelta
-from typing import Optional
-from sqlalchemy.orm import Session
+from typing import Optional, Dict, Any, Tuple
+from collections import OrderedDict
+import threading
+import time
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, load_only, make_transient_to_detached
 from sqlalchemy.exc import IntegrityError
-from config import SECRET_KEY, ALGORITHM
+from config import SECRET_KEY, ALGORITHM, USER_CACHE_TTL_SECONDS, USER_CACHE_MAX_SIZE
 from api.v1.models import User, Kitchen
-from api.v1.database import get_db
+from api.v1.database import get_db, get_async_db
 from api.v1.exceptions import (
     InvalidCredentialsException,
     TokenExpiredException,
@@ -67,11 +72,16 @@ def get_password_hash(password: str) -> str:
 
 def authenticate_user(username: str, password: str, db: Session) -> Optional[User]:
     """Authenticate a user by username and password"""
-    user = db.query(User).filter(User.username == username).first()
+    # Filtering on is_active and loading only the columns carried by
+    # idx_users_active_username lets PostgreSQL answer this from the index
+    user = (
+        db.query(User)
+        .options(load_only(User.id, User.username, User.hashed_password, User.is_verified))
+        .filter(User.username == username, User.is_active == True)
+        .first()
+    )
     if not user:
         return None
-    if not user.is_active:
-        return None
     if not verify_password(password, user.hashed_password):
         return None
     return user
@@ -113,7 +123,10 @@ def create_user(username: str, email: str, password: str, db: Session, **kwargs)
         return user
     except IntegrityError as e:
         db.rollback()
-        error_msg = str(e.orig) if hasattr(e, 'orig') else str(e)
+        # Prefer the violated constraint name (PostgreSQL: ix_users_username /
+        # ix_users_email) over the message, which may echo the submitted values
+        diag = getattr(getattr(e, 'orig', None), 'diag', None)
+        error_msg = getattr(diag, 'constraint_name', None) or (str(e.orig) if hasattr(e, 'orig') else str(e))
         
         if "username" in error_msg.lower():
             raise DuplicateUsernameException(username)
@@ -125,9 +138,76 @@ def create_user(username: str, email: str, password: str, db: Session, **kwargs)
         db.rollback()
         raise DatabaseException(f"Unexpected error creating user: {str(e)}", operation="create_user")
 
+# --- Current user cache ---
+# Column snapshots of recently authenticated users, keyed by username, so a
+# burst of requests with the same token does not re-select the user each time
+_user_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_user_cache_lock = threading.Lock()
+
+def _cached_user_snapshot(username: str) -> Optional[Dict[str, Any]]:
+    """Fresh cached column snapshot for a username, if any"""
+    if USER_CACHE_TTL_SECONDS <= 0:
+        return None
+    now = time.monotonic()
+    with _user_cache_lock:
+        entry = _user_cache.get(username)
+        if entry and entry[0] > now:
+            _user_cache.move_to_end(username)
+            return entry[1]
+    return None
+
+def _user_from_snapshot(snapshot: Dict[str, Any]) -> User:
+    """Detached User built from a snapshot, ready to merge without a SELECT"""
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return user
+
+def _cache_user(username: str, user: Optional[User]) -> None:
+    """Remember a freshly loaded user's columns"""
+    if user is None or USER_CACHE_TTL_SECONDS <= 0:
+        return
+    snapshot = {attr.key: getattr(user, attr.key) for attr in User.__mapper__.column_attrs}
+    with _user_cache_lock:
+        _user_cache[username] = (time.monotonic() + USER_CACHE_TTL_SECONDS, snapshot)
+        _user_cache.move_to_end(username)
+        while len(_user_cache) > USER_CACHE_MAX_SIZE:
+            _user_cache.popitem(last=False)
+
+def get_user_by_username(username: str, db: Session) -> Optional[User]:
+    """Load a user by username, reusing a recent snapshot when available"""
+    snapshot = _cached_user_snapshot(username)
+    if snapshot is not None:
+        # Attach the snapshot to this session as a clean persistent
+        # instance without emitting a SELECT
+        return db.merge(_user_from_snapshot(snapshot), load=False)
+    
+    user = db.query(User).filter(User.username == username).first()
+    _cache_user(username, user)
+    return user
+
+async def get_user_by_username_async(username: str, db: AsyncSession) -> Optional[User]:
+    """Async counterpart of get_user_by_username, sharing its cache"""
+    snapshot = _cached_user_snapshot(username)
+    if snapshot is not None:
+        return await db.merge(_user_from_snapshot(snapshot), load=False)
+    
+    user = (await db.execute(select(User).filter(User.username == username))).scalars().first()
+    _cache_user(username, user)
+    return user
+
+def invalidate_cached_user(username: str) -> None:
+    """Drop a user's cached snapshot after their row changes"""
+    with _user_cache_lock:
+        _user_cache.pop(username, None)
+
+def clear_user_cache() -> None:
+    """Drop all cached user snapshots"""
+    with _user_cache_lock:
+        _user_cache.clear()
+
 # --- Auth dependency ---
-async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
-    """Get the current authenticated user from JWT token"""
+def _username_from_token(token: str) -> str:
+    """Username (``sub`` claim) of a valid access token"""
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         username: str = payload.get("sub")
@@ -137,16 +217,41 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = De
         raise TokenExpiredException()
     except JWTError as e:
         raise InvalidTokenException(str(e))
-    
-    user = db.query(User).filter(User.username == username).first()
+    return username
+
+def _check_active(user: Optional[User], username: str) -> User:
     if user is None:
         raise UserNotFoundException(username)
     if not user.is_active:
         raise InactiveUserException()
     return user
 
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
+    """Get the current authenticated user from JWT token
+    
+    A plain function so FastAPI runs the user lookup (a blocking query on a
+    cache miss) in its threadpool rather than on the event loop.
+    """
+    username = _username_from_token(token)
+    return _check_active(get_user_by_username(username, db), username)
+
+async def get_current_user_async(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)) -> User:
+    """get_current_user for async routes, on the request's async session
+    
+    Async routes use this so a request never holds a sync connection as
+    well as an asyncpg one.
+    """
+    username = _username_from_token(token)
+    return _check_active(await get_user_by_username_async(username, db), username)
+
 async def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
     """Get the current active user"""
+    if not current_user.is_active:
+        raise InactiveUserException()
+    return current_user
+
+async def get_current_active_user_async(current_user: User = Depends(get_current_user_async)) -> User:
+    """Get the current active user, for async routes"""
     if not current_user.is_active:
         raise InactiveUserException()
     return current_user
\ No newline at end of file
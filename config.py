@@ -24,6 +24,14 @@ class Settings(BaseSettings):
     pool_timeout: int = Field(30, env='DB_POOL_TIMEOUT')
     pool_recycle: int = Field(3600, env='DB_POOL_RECYCLE')
     pool_pre_ping: bool = Field(True, env='DB_POOL_PRE_PING')
+    # The async (asyncpg) engine keeps a separate pool; both count towards the
+    # database's connection limit per worker
+    async_pool_size: int = Field(10, env='DB_ASYNC_POOL_SIZE')
+    async_max_overflow: int = Field(10, env='DB_ASYNC_MAX_OVERFLOW')
+    
+    # Statement caching
+    query_cache_size: int = Field(1200, env='DB_QUERY_CACHE_SIZE')
+    prepared_statement_cache_size: int = Field(500, env='DB_PREPARED_STATEMENT_CACHE_SIZE')
     
     # AWS RDS specific settings
     connect_timeout: int = Field(10, env='DB_CONNECT_TIMEOUT')
@@ -39,6 +47,14 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = Field(30, env='ACCESS_TOKEN_EXPIRE_MINUTES')
     refresh_token_expire_days: int = Field(7, env='REFRESH_TOKEN_EXPIRE_DAYS')
     
+    # Authenticated user cache (0 disables; deactivations apply after the TTL)
+    user_cache_ttl_seconds: int = Field(30, env='USER_CACHE_TTL_SECONDS')
+    user_cache_max_size: int = Field(10000, env='USER_CACHE_MAX_SIZE')
+    
+    # Listing total cache (0 disables; other workers' writes apply after the TTL)
+    count_cache_ttl_seconds: int = Field(30, env='COUNT_CACHE_TTL_SECONDS')
+    count_cache_max_size: int = Field(1000, env='COUNT_CACHE_MAX_SIZE')
+    
     # CORS settings
     cors_origins: str = Field('http://localhost:3000', env='CORS_ORIGINS')
     cors_allow_credentials: bool = Field(True, env='CORS_ALLOW_CREDENTIALS')
@@ -87,13 +103,13 @@ class Settings(BaseSettings):
             raise ValueError('Environment must be development, staging, or production')
         return v
     
-    @validator('pool_size')
+    @validator('pool_size', 'async_pool_size')
     def validate_pool_size(cls, v):
         if v < 5 or v > 100:
             raise ValueError('Pool size must be between 5 and 100')
         return v
     
-    @validator('max_overflow')
+    @validator('max_overflow', 'async_max_overflow')
     def validate_max_overflow(cls, v):
         if v < 0 or v > 200:
             raise ValueError('Max overflow must be between 0 and 200')
@@ -117,4 +133,8 @@ settings = Settings()
 SECRET_KEY = settings.secret_key
 ALGORITHM = settings.algorithm
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.access_token_expire_minutes
+USER_CACHE_TTL_SECONDS = settings.user_cache_ttl_seconds
+USER_CACHE_MAX_SIZE = settings.user_cache_max_size
+COUNT_CACHE_TTL_SECONDS = settings.count_cache_ttl_seconds
+COUNT_CACHE_MAX_SIZE = settings.count_cache_max_size
 DATABASE_URL = settings.database_url
\ No newline at end of file
@@ -1,7 +1,10 @@
 import logging
 import logging.config
+import logging.handlers
 from datetime import datetime
+import atexit
 import os
+import queue
 
 # Logging configuration
 LOGGING_CONFIG = {
@@ -86,6 +89,56 @@ LOGGING_CONFIG = {
     }
 }
 
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queue records, unformatted, for a logger's original handlers"""
+    
+    def __init__(self, log_queue, targets):
+        super().__init__(log_queue)
+        self.targets = targets
+    
+    def prepare(self, record):
+        # Formatting (including tracebacks) is left to the listener thread
+        return record
+    
+    def enqueue(self, record):
+        self.queue.put_nowait((self.targets, record))
+
+class _DeferredQueueListener(logging.handlers.QueueListener):
+    """Hand each queued record to the handlers of the logger that emitted it"""
+    
+    def handle(self, item):
+        targets, record = item
+        for handler in targets:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+_queue_listener = None
+
+def _defer_handlers():
+    """Move configured handlers behind one queue drained by a background thread"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+    
+    log_queue = queue.SimpleQueue()
+    for name in LOGGING_CONFIG["loggers"]:
+        target_logger = logging.getLogger(name or None)
+        targets = tuple(target_logger.handlers)
+        if targets:
+            target_logger.handlers = [_DeferredQueueHandler(log_queue, targets)]
+    
+    _queue_listener = _DeferredQueueListener(log_queue)
+    _queue_listener.start()
+
+def stop_logging():
+    """Flush queued log records and stop the listener thread"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+atexit.register(stop_logging)
+
 def setup_logging():
     """Setup logging configuration"""
     # Create logs directory if it doesn't exist
@@ -94,6 +147,9 @@ def setup_logging():
     # Apply logging configuration
     logging.config.dictConfig(LOGGING_CONFIG)
     
+    # Request paths only enqueue records; formatting and I/O happen off-thread
+    _defer_handlers()
+    
     # Log startup message
     logger = logging.getLogger(__name__)
     logger.info("Logging configuration initialized")
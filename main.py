@@ -1,9 +1,11 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from contextlib import asynccontextmanager
 import asyncio
 import logging
+import orjson
 
 from api.v1.routes import router as v1_router
 from api.v1.auth_routes import router as auth_router
@@ -16,10 +18,13 @@ from api.v1.error_handlers import (
     api_exception_handler,
     http_exception_handler,
     validation_exception_handler,
+    integrity_error_handler,
     sqlalchemy_exception_handler,
-    general_exception_handler
+    general_exception_handler,
+    error_responses
 )
-from api.v1.monitoring import MonitoringMiddleware, system_metrics_task
+from api.v1.monitoring import MonitoringMiddleware, system_metrics_task, cpu_sampler_task
+from api.v1.database import db_manager
 from logging_config import setup_logging
 
 # Setup logging
@@ -32,6 +37,7 @@ async def lifespan(app: FastAPI):
     logger.info("Home Kitchen Manager API starting up")
     
     # Start background tasks
+    cpu_task = asyncio.create_task(cpu_sampler_task())
     metrics_task = asyncio.create_task(system_metrics_task())
     
     try:
@@ -39,11 +45,13 @@ async def lifespan(app: FastAPI):
     finally:
         logger.info("Home Kitchen Manager API shutting down")
         # Cancel background tasks
-        metrics_task.cancel()
-        try:
-            await metrics_task
-        except asyncio.CancelledError:
-            pass
+        for task in (cpu_task, metrics_task):
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await db_manager.close()
 
 # --- App setup ---
 app = FastAPI(
@@ -118,6 +126,7 @@ app = FastAPI(
         }
     ],
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/api/v1/openapi.json"
@@ -129,6 +138,7 @@ app.add_middleware(MonitoringMiddleware)
 # Register error handlers
 app.add_exception_handler(APIException, api_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
+app.add_exception_handler(IntegrityError, integrity_error_handler)
 app.add_exception_handler(SQLAlchemyError, sqlalchemy_exception_handler)
 app.add_exception_handler(Exception, general_exception_handler)
 
@@ -137,36 +147,25 @@ app.include_router(
     auth_router, 
     prefix="/api/v1/auth", 
     tags=["🔐 Authentication"],
-    responses={
-        401: {"description": "Authentication failed"},
-        403: {"description": "Access forbidden"}
-    }
+    responses=error_responses(401, 403)
 )
 app.include_router(
     v1_router, 
     prefix="/api/v1", 
     tags=["📝 Shopping Lists"],
-    responses={
-        404: {"description": "Resource not found"},
-        422: {"description": "Validation error"}
-    }
+    responses=error_responses(404, 422)
 )
 app.include_router(
     inventory_router, 
     prefix="/api/v1", 
     tags=["📦 Inventory Management"],
-    responses={
-        404: {"description": "Item not found"},
-        422: {"description": "Validation error"}
-    }
+    responses=error_responses(404, 422)
 )
 app.include_router(
     search_router, 
     prefix="/api/v1", 
     tags=["🔍 Search & Filtering"],
-    responses={
-        400: {"description": "Invalid search parameters"}
-    }
+    responses=error_responses(400)
 )
 app.include_router(
     health_router, 
@@ -235,3 +234,18 @@ def read_root():
             "Real-time monitoring and health checks"
         ]
     }
+
+
+# --- OpenAPI schema ---
+# FastAPI caches the schema dict but re-encodes it on every request to the
+# schema URL; serve bytes encoded once on first request instead
+_openapi_body = None
+
+app.router.routes = [route for route in app.router.routes if getattr(route, "path", None) != app.openapi_url]
+
+@app.get(app.openapi_url, include_in_schema=False)
+async def openapi_schema() -> Response:
+    global _openapi_body
+    if _openapi_body is None:
+        _openapi_body = orjson.dumps(app.openapi())
+    return Response(content=_openapi_body, media_type="application/json")
\ No newline at end of file
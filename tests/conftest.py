@@ -3,11 +3,14 @@ from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 
 from main import app
 from api.v1.models import Base
-from api.v1.database import get_db
-from auth import create_user, create_access_token
+from api.v1.database import get_db, get_async_db
+from auth import create_user, create_access_token, clear_user_cache
+from api.v1.filters import clear_count_cache
+from api.v1.health_routes import clear_health_cache
 
 # Test database URL (SQLite in memory)
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
@@ -19,6 +22,10 @@ engine = create_engine(
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async endpoints get their own engine on the same SQLite file
+async_engine = create_async_engine("sqlite+aiosqlite:///./test.db")
+TestingAsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 def override_get_db():
     try:
         db = TestingSessionLocal()
@@ -26,7 +33,23 @@ def override_get_db():
     finally:
         db.close()
 
+async def override_get_async_db():
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_async_db] = override_get_async_db
+
+@pytest.fixture(autouse=True)
+def reset_user_cache():
+    """Keep cached users, listing totals and probe results from leaking between tests that recreate the database"""
+    clear_user_cache()
+    clear_count_cache()
+    clear_health_cache()
+    yield
+    clear_user_cache()
+    clear_count_cache()
+    clear_health_cache()
 
 @pytest.fixture
 def client():
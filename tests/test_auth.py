@@ -111,4 +111,21 @@ def test_update_current_user(client: TestClient, auth_headers):
     assert response.status_code == 200
     data = response.json()
     assert data["first_name"] == "Updated"
-    assert data["last_name"] == "Name"
\ No newline at end of file
+    assert data["last_name"] == "Name"
+
+def test_update_current_user_not_served_from_cache(client: TestClient, auth_headers):
+    """Test that an update is visible on the next request despite the user cache"""
+    response = client.get("/api/v1/auth/users/me", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["first_name"] == "Test"
+    
+    response = client.put(
+        "/api/v1/auth/users/me",
+        headers=auth_headers,
+        json={"first_name": "Cached"}
+    )
+    assert response.status_code == 200
+    
+    response = client.get("/api/v1/auth/users/me", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["first_name"] == "Cached"
@@ -204,6 +204,59 @@ def test_error_response_has_unique_request_id(client: TestClient):
     # Request IDs should be different
     assert data1["error"]["request_id"] != data2["error"]["request_id"]
 
+def test_error_response_reuses_bound_request_id():
+    """Test that error responses reuse the request id bound by the middleware"""
+    from api.v1.error_handlers import create_error_response
+    from api.v1.monitoring import current_request_id
+    
+    token = current_request_id.set("abc123")
+    try:
+        first = create_error_response("First", "FIRST", "test", 400)
+        second = create_error_response("Second", "SECOND", "test", 400)
+    finally:
+        current_request_id.reset(token)
+    
+    assert first["error"]["request_id"] == "abc123"
+    assert second["error"]["request_id"] == "abc123"
+
+def test_unhandled_error_reuses_request_id():
+    """Test that a 500 from an unhandled exception carries the route's request id"""
+    from fastapi import FastAPI
+    from api.v1.error_handlers import general_exception_handler
+    from api.v1.monitoring import MonitoringMiddleware, current_request_id
+    
+    app = FastAPI()
+    app.add_middleware(MonitoringMiddleware)
+    app.add_exception_handler(Exception, general_exception_handler)
+    seen = []
+    
+    @app.get("/boom")
+    def boom():
+        seen.append(current_request_id.get())
+        raise RuntimeError("boom")
+    
+    with TestClient(app, raise_server_exceptions=False) as test_client:
+        response = test_client.get("/boom")
+    
+    assert response.status_code == 500
+    assert seen[0]
+    assert response.json()["error"]["request_id"] == seen[0]
+
+def test_error_response_caps_large_context():
+    """Test that oversized error context is truncated before serialization"""
+    from api.v1.error_handlers import create_error_response, MAX_CONTEXT_ITEMS, MAX_CONTEXT_STRING
+    
+    context = {"items": list(range(10000)), "note": "x" * 100000, "field": "name"}
+    error = create_error_response("Too big", "BIG", "test", 400, context=context)["error"]
+    
+    assert len(error["context"]["items"]) == MAX_CONTEXT_ITEMS
+    assert len(error["context"]["note"]) == MAX_CONTEXT_STRING
+    assert error["context"]["field"] == "name"
+    assert error["context"]["_truncated"] is True
+    
+    small = {"field": "name"}
+    assert create_error_response("Small", "SMALL", "test", 400, context=small)["error"]["context"] is small
+
 def test_parameter_validation_errors(client: TestClient, auth_headers):
     """Test parameter validation in query strings"""
     # Test invalid pagination parameters
@@ -236,6 +289,24 @@ def test_database_constraint_error_handling(client: TestClient, test_user, auth_
     # Should handle the foreign key constraint error gracefully
     assert response.status_code in [400, 404, 500]  # Depending on validation order
 
+def test_integrity_error_classified_by_sqlstate():
+    """Test that PostgreSQL integrity violations are classified by SQLSTATE"""
+    import asyncio
+    import json
+    from fastapi import Request
+    from sqlalchemy.exc import IntegrityError
+    from api.v1.error_handlers import integrity_error_handler
+    
+    class UniqueViolation(Exception):
+        pgcode = "23505"
+    
+    exc = IntegrityError("INSERT INTO users ...", {}, UniqueViolation("duplicate key value violates unique constraint"))
+    request = Request({"type": "http", "method": "POST", "path": "/api/v1/users", "headers": [], "query_string": b""})
+    
+    response = asyncio.run(integrity_error_handler(request, exc))
+    assert response.status_code == 500
+    assert json.loads(response.body)["error"]["error_code"] == "DUPLICATE_VALUE"
+
 def test_large_request_handling(client: TestClient, auth_headers):
     """Test handling of oversized requests"""
     # Create a very long name
@@ -274,4 +345,18 @@ def test_concurrent_request_error_handling(client: TestClient):
     conflict_count = sum(1 for r in responses if r.status_code == 409)
     
     assert success_count == 1
-    assert conflict_count == 4
\ No newline at end of file
+    assert conflict_count == 4
+
+def test_openapi_schema_documents_error_responses(client: TestClient):
+    """Test that the served OpenAPI schema carries the shared error examples"""
+    from main import app
+    
+    response = client.get("/api/v1/openapi.json")
+    
+    assert response.status_code == 200
+    schema = response.json()
+    assert schema == app.openapi()
+    
+    login_responses = schema["paths"]["/api/v1/auth/token"]["post"]["responses"]
+    example = login_responses["401"]["content"]["application/json"]["example"]
+    assert example["error"]["error_code"] == "UNAUTHORIZED"
\ No newline at end of file
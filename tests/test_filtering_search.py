@@ -21,6 +21,23 @@ def test_filter_shopping_lists_by_name(client: TestClient, auth_headers, test_ki
     assert len(data["items"]) == 2
     assert all("Grocery" in item["name"] for item in data["items"])
 
+def test_filter_shopping_lists_by_name_prefix(client: TestClient, auth_headers, test_kitchen, db_session):
+    """Test filtering shopping lists by case-insensitive name prefix"""
+    from api.v1.models import ShoppingList
+    
+    for name in ["Grocery Run", "grocery_extra", "Weekly Grocery", "Grocer%y"]:
+        db_session.add(ShoppingList(name=name, kitchen_id=test_kitchen.id))
+    db_session.commit()
+    
+    response = client.get("/api/v1/shopping-lists/?name_prefix=GROCERY", headers=auth_headers)
+    assert response.status_code == 200
+    names = sorted(item["name"] for item in response.json()["items"])
+    assert names == ["Grocery Run", "grocery_extra"]
+    
+    # LIKE wildcards in the prefix match literally
+    response = client.get("/api/v1/shopping-lists/?name_prefix=grocer%25", headers=auth_headers)
+    assert [item["name"] for item in response.json()["items"]] == ["Grocer%y"]
+
 def test_search_shopping_lists(client: TestClient, auth_headers, test_kitchen, db_session):
     """Test searching shopping lists"""
     from api.v1.models import ShoppingList
@@ -114,6 +131,191 @@ def test_pagination_metadata(client: TestClient, auth_headers, test_kitchen, db_
     assert data["page"] == 2
     assert data["has_prev"] is True
 
+def test_pagination_metadata_unaligned_skip(client: TestClient, auth_headers, test_kitchen, db_session):
+    """Test that has_next follows the offset when skip is not a multiple of limit"""
+    from api.v1.models import ShoppingList
+    
+    for i in range(12):
+        db_session.add(ShoppingList(name=f"Offset List {i}", kitchen_id=test_kitchen.id))
+    db_session.commit()
+    
+    # skip=5, limit=10 returns the last 7 of 12
+    response = client.get("/api/v1/shopping-lists/?limit=10&skip=5", headers=auth_headers)
+    assert response.status_code == 200
+    data = response.json()
+    
+    assert data["total"] == 12
+    assert len(data["items"]) == 7
+    assert data["page"] == 1
+    assert data["has_next"] is False
+    assert data["has_prev"] is True
+    assert "skip" not in data
+
+def test_listing_total_cached_until_write(client: TestClient, auth_headers, test_kitchen, db_session):
+    """Test that listing totals are reused across pages and dropped on writes"""
+    from api.v1.models import ShoppingList
+    
+    for i in range(4):
+        db_session.add(ShoppingList(name=f"Counted List {i}", kitchen_id=test_kitchen.id))
+    db_session.commit()
+    
+    first = client.get("/api/v1/shopping-lists/?limit=2&skip=0", headers=auth_headers).json()
+    second = client.get("/api/v1/shopping-lists/?limit=2&skip=2", headers=auth_headers).json()
+    assert second["total"] == first["total"]
+    assert len(second["items"]) == 2
+    
+    db_session.add(ShoppingList(name="Counted List 4", kitchen_id=test_kitchen.id))
+    db_session.commit()
+    
+    third = client.get("/api/v1/shopping-lists/?limit=2&skip=0", headers=auth_headers).json()
+    assert third["total"] == first["total"] + 1
+
+def test_listing_total_not_cached_from_uncommitted_writes(test_kitchen, db_session):
+    """Test that a total counted over uncommitted writes is not cached"""
+    from api.v1.filters import paginate_with_total
+    from api.v1.models import ShoppingList
+    from tests.conftest import TestingSessionLocal
+    
+    db_session.add(ShoppingList(name="Rolled Back List", kitchen_id=test_kitchen.id))
+    db_session.flush()
+    _, total = paginate_with_total(db_session.query(ShoppingList), 0, 10)
+    assert total == 1
+    db_session.rollback()
+    
+    other = TestingSessionLocal()
+    try:
+        _, total = paginate_with_total(other.query(ShoppingList), 0, 10)
+    finally:
+        other.close()
+    assert total == 0
+
+def test_list_shopping_lists_loads_items_in_bulk(client: TestClient, auth_headers, test_kitchen, db_session):
+    """Test that listing shopping lists does not select items once per list"""
+    from sqlalchemy import event
+    from api.v1.models import ShoppingList, ShoppingListItem
+    from tests.conftest import engine
+    
+    for i in range(5):
+        shopping_list = ShoppingList(name=f"Bulk List {i}", kitchen_id=test_kitchen.id)
+        db_session.add(shopping_list)
+        db_session.flush()
+        db_session.add(ShoppingListItem(name="Milk", quantity="1", shopping_list_id=shopping_list.id))
+    db_session.commit()
+    
+    item_selects = []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM shopping_list_items" in statement:
+            item_selects.append(statement)
+    
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = client.get("/api/v1/shopping-lists/", headers=auth_headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    
+    assert response.status_code == 200
+    assert all(len(item["items"]) == 1 for item in response.json()["items"])
+    assert len(item_selects) == 1
+
+def test_filtered_listing_reuses_compiled_sql(client: TestClient, auth_headers, test_kitchen, db_session):
+    """Test that filter values are bound parameters, so the SQL compiles once"""
+    from sqlalchemy import event
+    from tests.conftest import engine
+    
+    cache_stats = []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "FROM shopping_lists" in statement and "LIMIT" in statement:
+            cache_stats.append(context.cache_hit)
+    
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        for name, day in (("Weekly", "2024-01-01"), ("Party", "2024-02-01")):
+            response = client.get(
+                f"/api/v1/shopping-lists/?name={name}&name_prefix={name}&date_from={day}&date_to={day}&sort_by=name",
+                headers=auth_headers
+            )
+            assert response.status_code == 200
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    
+    assert cache_stats[-1] == engine.dialect.CACHE_HIT
+
+def test_cursor_pagination(client: TestClient, auth_headers, test_kitchen, db_session):
+    """Test keyset pagination walks the same rows as offset pagination"""
+    from api.v1.models import ShoppingList
+    
+    for i in range(7):
+        db_session.add(ShoppingList(name=f"Cursor List {i % 3}", kitchen_id=test_kitchen.id))
+    db_session.commit()
+    
+    response = client.get("/api/v1/shopping-lists/?sort_by=name&sort_order=asc", headers=auth_headers)
+    expected = [item["id"] for item in response.json()["items"]]
+    
+    seen = []
+    cursor = ""
+    while cursor is not None:
+        response = client.get(
+            "/api/v1/shopping-lists/",
+            params={"limit": 3, "sort_by": "name", "sort_order": "asc", "cursor": cursor},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] is None
+        assert data["has_next"] is (data["next_cursor"] is not None)
+        seen.extend(item["id"] for item in data["items"])
+        cursor = data["next_cursor"]
+    
+    assert seen == expected
+    
+    # Offset pages hand out a cursor to continue from
+    response = client.get("/api/v1/shopping-lists/?limit=3&sort_by=name&sort_order=asc", headers=auth_headers)
+    next_page = client.get(
+        "/api/v1/shopping-lists/",
+        params={"limit": 3, "sort_by": "name", "sort_order": "asc", "cursor": response.json()["next_cursor"]},
+        headers=auth_headers
+    )
+    assert [item["id"] for item in next_page.json()["items"]] == expected[3:6]
+    
+    response = client.get("/api/v1/shopping-lists/?cursor=not-a-cursor", headers=auth_headers)
+    assert response.status_code == 422
+
+def test_cursor_rejects_mistyped_sort_value(client: TestClient, auth_headers, test_kitchen):
+    """Test that cursors whose sort value does not fit the sort column are rejected"""
+    import base64
+    import json
+    
+    def make_cursor(value):
+        return base64.urlsafe_b64encode(json.dumps(value).encode()).decode()
+    
+    cases = [
+        ("name", [{"a": 1}, 1]),
+        ("name", [["a"], 1]),
+        ("name", [1, 1]),
+        ("name", [None, 1]),
+        ("name", ["List", "1"]),
+        ("created_at", [{"a": 1}, 1]),
+        ("created_at", [12345, 1]),
+        ("created_at", ["yesterday", 1]),
+        ("created_at", ["2024-01-01T00:00:00", True]),
+    ]
+    for sort_by, value in cases:
+        response = client.get(
+            "/api/v1/shopping-lists/",
+            params={"sort_by": sort_by, "cursor": make_cursor(value)},
+            headers=auth_headers
+        )
+        assert response.status_code == 422, (sort_by, value)
+    
+    response = client.get(
+        "/api/v1/shopping-lists/",
+        params={"sort_by": "created_at", "cursor": make_cursor(["2024-01-01T00:00:00", 1])},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+
 def test_sorting(client: TestClient, auth_headers, test_kitchen, db_session):
     """Test sorting functionality"""
     from api.v1.models import ShoppingList
@@ -149,6 +351,14 @@ def test_sorting(client: TestClient, auth_headers, test_kitchen, db_session):
     # Most recent should be first
     assert len(data["items"]) >= 2
 
+def test_sorting_rejects_unknown_values(client: TestClient, auth_headers):
+    """Test that sort parameters are validated before the handler runs"""
+    response = client.get("/api/v1/shopping-lists/?sort_by=description", headers=auth_headers)
+    assert response.status_code == 422
+    
+    response = client.get("/api/v1/shopping-lists/?sort_order=sideways", headers=auth_headers)
+    assert response.status_code == 422
+
 def test_global_search(client: TestClient, auth_headers, test_kitchen, test_shopping_list, db_session):
     """Test global search functionality"""
     from api.v1.models import ShoppingListItem
@@ -44,6 +44,24 @@ def test_get_kitchen(client: TestClient, auth_headers, test_kitchen):
     assert data["name"] == "Test Kitchen"
     assert data["id"] == test_kitchen.id
 
+def test_async_kitchen_routes_skip_sync_session(client: TestClient, auth_headers, test_kitchen):
+    """Test that async kitchen routes authenticate on the async session alone"""
+    from main import app
+    from api.v1.database import get_db
+    
+    def no_sync_session():
+        raise AssertionError("sync session opened by an async route")
+        yield
+    
+    original = app.dependency_overrides[get_db]
+    app.dependency_overrides[get_db] = no_sync_session
+    try:
+        assert client.get(f"/api/v1/auth/kitchens/{test_kitchen.id}", headers=auth_headers).status_code == 200
+        assert client.get("/api/v1/auth/kitchens/", headers=auth_headers).status_code == 200
+        assert client.get("/api/v1/auth/users/me", headers=auth_headers).status_code == 200
+    finally:
+        app.dependency_overrides[get_db] = original
+
 def test_get_kitchen_not_found(client: TestClient, auth_headers):
     """Test getting a non-existent kitchen"""
     response = client.get("/api/v1/auth/kitchens/99999", headers=auth_headers)
@@ -71,4 +89,18 @@ def test_delete_kitchen(client: TestClient, auth_headers, test_kitchen):
     
     # Verify kitchen is deleted
     response = client.get(f"/api/v1/auth/kitchens/{test_kitchen.id}", headers=auth_headers)
-    assert response.status_code == 404
\ No newline at end of file
+    assert response.status_code == 404
+
+def test_delete_kitchen_updates_listing_total(client: TestClient, auth_headers, test_kitchen):
+    """The cached listing total drops a kitchen removed by the bulk DELETE"""
+    response = client.get("/api/v1/auth/kitchens/", headers=auth_headers)
+    assert response.status_code == 200
+    total = response.json()["total"]
+    
+    response = client.delete(f"/api/v1/auth/kitchens/{test_kitchen.id}", headers=auth_headers)
+    assert response.status_code == 204
+    
+    response = client.get("/api/v1/auth/kitchens/?limit=1", headers=auth_headers)
+    data = response.json()
+    assert data["total"] == total - 1
+    assert data["pages"] == total - 1
@@ -8,7 +8,8 @@ from api.v1.monitoring import (
     RequestMetrics, 
     SystemMetrics,
     PerformanceProfiler,
-    profile_operation
+    profile_operation,
+    to_epoch
 )
 
 def test_metrics_collector_request_recording():
@@ -44,6 +45,25 @@ def test_metrics_collector_request_recording():
     assert collector.endpoint_stats["POST /api/v1/shopping-lists/"]["error_count"] == 1
     assert collector.error_counts["VALIDATION_ERROR"] == 1
 
+def test_metrics_collector_active_users():
+    """Test that active users are read newest first and idle users trimmed"""
+    collector = MetricsCollector()
+    now = datetime.utcnow()
+    
+    for user_id, days_ago in [(1, 8), (2, 2), (3, 0), (2, 0)]:
+        collector.record_request(RequestMetrics(
+            timestamp=now - timedelta(days=days_ago),
+            method="GET",
+            path="/test",
+            status_code=200,
+            duration=0.1,
+            user_id=user_id
+        ))
+    
+    assert list(collector.user_activity) == [3, 2]
+    active = collector.snapshot_active_users(now - timedelta(hours=24))
+    assert [(user_id, stats['request_count']) for user_id, stats in active] == [(2, 2), (3, 1)]
+
 def test_metrics_collector_health_status():
     """Test health status generation"""
     collector = MetricsCollector()
@@ -110,6 +130,19 @@ def test_performance_profiler():
     assert stats["min"] == 0.3
     assert stats["max"] == 0.7
 
+def test_performance_profiler_get_many():
+    """get_many returns stats only for operations with recorded timings"""
+    profiler = PerformanceProfiler()
+    
+    profiler.record_operation("recorded", 0.2)
+    profiler.record_operation("recorded", 0.4)
+    
+    stats = profiler.get_many(("recorded", "missing"))
+    
+    assert list(stats) == ["recorded"]
+    assert stats["recorded"] == profiler.get_operation_stats("recorded")
+    assert "missing" not in profiler.operation_times
+
 def test_profile_operation_decorator():
     """Test the profile_operation decorator"""
     profiler = PerformanceProfiler()
@@ -145,6 +178,12 @@ def test_health_endpoint(client: TestClient):
     assert "timestamp" in data
     assert "uptime_seconds" in data
 
+def test_health_endpoint_cached(client: TestClient):
+    """Test that back-to-back probes share one health evaluation"""
+    first = client.get("/api/v1/health").json()
+    second = client.get("/api/v1/health").json()
+    assert second["timestamp"] == first["timestamp"]
+
 def test_health_detailed_endpoint(client: TestClient):
     """Test detailed health check endpoint"""
     response = client.get("/api/v1/health/detailed")
@@ -156,6 +195,23 @@ def test_health_detailed_endpoint(client: TestClient):
     assert "database" in data["components"]
     assert "system_metrics" in data["components"]
 
+def test_health_detailed_unhealthy_not_cached(client: TestClient, monkeypatch):
+    """Test that an unhealthy detailed report is re-evaluated on the next probe"""
+    from api.v1 import health_routes
+    
+    calls = []
+    
+    async def failing_health_check():
+        calls.append(1)
+        return {"status": "unhealthy", "message": "Database unreachable"}
+    
+    monkeypatch.setattr(health_routes.db_manager, "async_health_check", failing_health_check)
+    
+    for _ in range(2):
+        data = client.get("/api/v1/health/detailed").json()
+        assert data["overall_status"] != "healthy"
+    assert len(calls) == 2
+
 def test_health_ready_endpoint(client: TestClient):
     """Test readiness probe endpoint"""
     response = client.get("/api/v1/health/ready")
@@ -200,6 +256,64 @@ def test_system_metrics_endpoint(client: TestClient):
     assert "cpu_percent" in data["current"]
     assert "memory" in data["current"]
 
+def test_system_metrics_endpoint_uses_sampled_cpu(client: TestClient, monkeypatch):
+    """Test that the system metrics endpoint reports the sampler's CPU figure"""
+    from api.v1.monitoring import metrics_collector
+    
+    monkeypatch.setattr(metrics_collector, "last_cpu_percent", 42.5)
+    
+    start = time.perf_counter()
+    response = client.get("/api/v1/metrics/system")
+    assert time.perf_counter() - start < 0.5
+    assert response.json()["current"]["cpu_percent"] == 42.5
+
+def test_prometheus_metrics_endpoint(client: TestClient):
+    """Test Prometheus exposition of request counters and latency histograms"""
+    client.get("/api/v1/health")
+    
+    response = client.get("/api/v1/metrics/prometheus")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    
+    body = response.text
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    assert 'http_requests_total{method="GET",path="/api/v1/health",status="200"}' in body
+    assert 'http_request_duration_seconds_bucket{method="GET",path="/api/v1/health",le="+Inf"}' in body
+
+def test_prometheus_labels_by_route_template(client: TestClient, auth_headers):
+    """Test that Prometheus series are labelled by route template, not raw path"""
+    for kitchen_id in range(99990, 99993):
+        client.get(f"/api/v1/auth/kitchens/{kitchen_id}", headers=auth_headers)
+    for i in range(5):
+        client.get(f"/api/v1/nonexistent/{i}")
+    
+    body = client.get("/api/v1/metrics/prometheus").text
+    assert 'http_requests_total{method="GET",path="/api/v1/auth/kitchens/{kitchen_id}",status="404"}' in body
+    assert 'http_requests_total{method="GET",path="unmatched",status="404"}' in body
+    assert "99990" not in body
+    assert "/api/v1/nonexistent" not in body
+
+def test_metrics_collector_latency_histogram():
+    """Test that latency histogram buckets are cumulative in the exposition"""
+    collector = MetricsCollector()
+    for duration in [0.001, 0.2, 20.0]:
+        collector.record_request(RequestMetrics(
+            timestamp=datetime.utcnow(),
+            method="GET",
+            path="/test",
+            status_code=200,
+            duration=duration,
+            route="/test"
+        ))
+    
+    body = collector.render_prometheus()
+    assert 'http_request_duration_seconds_bucket{method="GET",path="/test",le="0.005"} 1' in body
+    assert 'http_request_duration_seconds_bucket{method="GET",path="/test",le="0.25"} 2' in body
+    assert 'http_request_duration_seconds_bucket{method="GET",path="/test",le="10"} 2' in body
+    assert 'http_request_duration_seconds_bucket{method="GET",path="/test",le="+Inf"} 3' in body
+    assert 'http_request_duration_seconds_count{method="GET",path="/test"} 3' in body
+    assert 'http_requests_total{method="GET",path="/test",status="200"} 3' in body
+
 def test_performance_metrics_endpoint(client: TestClient):
     """Test performance metrics endpoint"""
     response = client.get("/api/v1/metrics/performance")
@@ -218,6 +332,26 @@ def test_endpoint_metrics_endpoint(client: TestClient):
     assert "endpoints" in data
     assert "timestamp" in data
 
+def test_endpoint_metrics_limit(client: TestClient):
+    """Test that endpoint metrics return only the busiest endpoints, busiest first"""
+    collector = MetricsCollector()
+    for path, count in [("/a", 1), ("/b", 3), ("/c", 2)]:
+        for _ in range(count):
+            collector.record_request(RequestMetrics(
+                timestamp=datetime.utcnow(),
+                method="GET",
+                path=path,
+                status_code=200,
+                duration=0.1
+            ))
+    
+    top = collector.top_endpoint_stats(2)
+    assert [(endpoint, stats['count']) for endpoint, stats in top] == [("GET /b", 3), ("GET /c", 2)]
+    
+    response = client.get("/api/v1/metrics/endpoints?limit=1")
+    assert response.status_code == 200
+    assert len(response.json()["endpoints"]) == 1
+
 def test_error_metrics_endpoint(client: TestClient):
     """Test error metrics endpoint"""
     response = client.get("/api/v1/metrics/errors")
@@ -272,6 +406,23 @@ def test_dashboard_alerts(client: TestClient, auth_headers):
     assert "thresholds" in data
     assert "alert_summary" in data
 
+def test_dashboard_alerts_threshold_tripped(client: TestClient, auth_headers, monkeypatch):
+    """Test that a tripped threshold is reported as an active alert"""
+    from api.v1 import dashboard_routes
+    from api.v1.dashboard_routes import clear_dashboard_cache
+    
+    monkeypatch.setitem(dashboard_routes.alert_manager.alert_thresholds, "error_rate", -1.0)
+    clear_dashboard_cache()
+    
+    response = client.get("/api/v1/dashboard/alerts", headers=auth_headers)
+    assert response.status_code == 200
+    
+    data = response.json()
+    alert_types = [alert["type"] for alert in data["current_alerts"]]
+    assert "high_error_rate" in alert_types
+    assert data["alert_summary"]["critical_count"] >= 1
+    assert data["alert_summary"]["total_active"] == len(alert_types)
+
 def test_dashboard_performance(client: TestClient, auth_headers):
     """Test dashboard performance endpoint"""
     response = client.get("/api/v1/dashboard/performance", headers=auth_headers)
@@ -339,4 +490,161 @@ def test_metrics_collector_thread_safety():
         thread.join()
     
     # Should have 500 total requests (5 threads * 100 requests each)
-    assert len(collector.request_metrics) == 500
\ No newline at end of file
+    assert len(collector.request_metrics) == 500
+
+def test_dashboard_charts_requests_buckets(client: TestClient, auth_headers, monkeypatch):
+    """Test that request chart buckets count requests, errors and durations"""
+    from api.v1 import dashboard_routes
+    
+    collector = MetricsCollector()
+    now = datetime.utcnow()
+    for minutes_ago, status_code, duration in [(200, 200, 1.0), (50, 200, 0.1), (50, 500, 0.3), (20, 404, 0.2)]:
+        collector.record_request(RequestMetrics(
+            timestamp=now - timedelta(minutes=minutes_ago),
+            method="GET",
+            path="/test",
+            status_code=status_code,
+            duration=duration
+        ))
+    monkeypatch.setattr(dashboard_routes, "metrics_collector", collector)
+    dashboard_routes.clear_dashboard_cache()
+    
+    response = client.get(
+        "/api/v1/dashboard/charts/requests?hours=1&interval_minutes=30",
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    
+    data = response.json()["data"]
+    assert [p["value"] for p in data["request_counts"]] == [2, 1]
+    assert [p["value"] for p in data["error_counts"]] == [1, 1]
+    assert [round(p["value"], 6) for p in data["response_times"]] == [0.2, 0.2]
+    
+    response = client.get(
+        "/api/v1/dashboard/charts/requests?hours=1&interval_minutes=30&format=columnar",
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    
+    columns = response.json()["data"]
+    assert columns["timestamps"] == [p["timestamp"] for p in data["request_counts"]]
+    assert columns["request_counts"] == [2, 1]
+    assert columns["error_counts"] == [1, 1]
+
+def test_metrics_collector_request_series_wraps():
+    """Test that the columnar request series keeps the newest entries in order"""
+    collector = MetricsCollector(max_history=3)
+    start = datetime.utcnow() - timedelta(minutes=10)
+    
+    for i in range(5):
+        collector.record_request(RequestMetrics(
+            timestamp=start + timedelta(minutes=i),
+            method="GET",
+            path="/test",
+            status_code=200 if i % 2 else 500,
+            duration=float(i)
+        ))
+    
+    timestamps, status_codes, durations = collector.get_request_series()
+    assert list(durations) == [2.0, 3.0, 4.0]
+    assert list(status_codes) == [500, 200, 500]
+    assert list(timestamps) == sorted(timestamps)
+    
+    count, errors, total_duration = collector.get_request_stats(start + timedelta(minutes=3))
+    assert (count, errors, total_duration) == (2, 1, 7.0)
+    
+    requests, status_codes, durations = collector.get_request_window(start + timedelta(minutes=3))
+    assert [m.duration for m in requests] == list(durations) == [3.0, 4.0]
+    assert list(status_codes) == [200, 500]
+
+def test_metrics_collector_request_rollup():
+    """Test that per-minute rollups sum into buckets and ignore stale slots"""
+    collector = MetricsCollector()
+    base = datetime(2024, 1, 1, 12, 0)
+    first_minute = int(to_epoch(base)) // 60
+    
+    for minutes, status_code, duration in [(0, 200, 1.0), (1, 500, 2.0), (5, 200, 3.0)]:
+        collector.record_request(RequestMetrics(
+            timestamp=base + timedelta(minutes=minutes, seconds=30),
+            method="GET",
+            path="/test",
+            status_code=status_code,
+            duration=duration
+        ))
+    
+    assert collector.get_request_rollup(first_minute, 5, 2) == [(2, 1, 3.0), (1, 0, 3.0)]
+    
+    # A request a full rollup period later reuses the slot of minute 0
+    collector.record_request(RequestMetrics(
+        timestamp=base + timedelta(minutes=MetricsCollector.ROLLUP_MINUTES),
+        method="GET",
+        path="/test",
+        status_code=200,
+        duration=4.0
+    ))
+    assert collector.get_request_rollup(first_minute, 5, 1) == [(1, 1, 2.0)]
+
+def test_metrics_collector_error_breakdown():
+    """Test that recent totals and error breakdowns come from minute buckets"""
+    collector = MetricsCollector()
+    now = datetime.utcnow()
+    
+    for minutes_ago, status_code, error_code in [
+        (90, 500, "DATABASE_ERROR"),
+        (0, 200, None),
+        (0, 404, "RESOURCE_NOT_FOUND"),
+        (0, 503, None),
+    ]:
+        collector.record_request(RequestMetrics(
+            timestamp=now - timedelta(minutes=minutes_ago),
+            method="GET",
+            path="/test",
+            status_code=status_code,
+            duration=0.1,
+            error_code=error_code
+        ))
+    
+    assert collector.get_recent_totals(5) == (3, 1)
+    
+    status_counts, error_codes, recent_errors = collector.get_error_breakdown(60)
+    assert status_counts == {404: 1, 503: 1}
+    assert error_codes == {"RESOURCE_NOT_FOUND": 1}
+    assert [m.status_code for m in recent_errors] == [404, 503]
+
+def test_metrics_collector_system_metrics_window():
+    """Test that system snapshots are sliced by time window"""
+    collector = MetricsCollector()
+    collector.record_system_metrics()
+    collector.record_system_metrics()
+    
+    assert len(collector.get_system_metrics(datetime.utcnow() - timedelta(minutes=1))) == 2
+    assert collector.get_system_metrics(datetime.utcnow() + timedelta(minutes=1)) == []
+
+def test_dashboard_overview_cached(client: TestClient, auth_headers):
+    """Test that repeated dashboard refreshes within the TTL are served from cache"""
+    from api.v1.dashboard_routes import clear_dashboard_cache
+    
+    clear_dashboard_cache()
+    first = client.get("/api/v1/dashboard/overview", headers=auth_headers)
+    second = client.get("/api/v1/dashboard/overview", headers=auth_headers)
+    
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.json() == first.json()
+
+def test_dashboard_overview_not_modified(client: TestClient, auth_headers):
+    """Test that a refresh carrying the current ETag gets a bodyless 304"""
+    from api.v1.dashboard_routes import clear_dashboard_cache
+    
+    clear_dashboard_cache()
+    first = client.get("/api/v1/dashboard/overview", headers=auth_headers)
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"].startswith("private")
+    
+    second = client.get(
+        "/api/v1/dashboard/overview",
+        headers={**auth_headers, "If-None-Match": etag}
+    )
+    assert second.status_code == 304
+    assert second.headers["ETag"] == etag
+    assert second.content == b""